@@ -0,0 +1,142 @@
+import sqlite3
+import threading
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from db import get_db, RESET, PurchaseOrderError
+
+# A drafted purchase order brings stock back up to this many times the
+# product's reorder point.
+REORDER_TARGET_MULTIPLE = 2
+
+PRODUCT_SQL = ("SELECT design_id, description, stock, reorder_point, supplier_id "
+               "FROM products WHERE design_id = ?")
+# Served by the partial index idx_products_low_stock (migration 9)
+LOW_STOCK_SQL = ("SELECT design_id, description, stock, reorder_point, supplier_id "
+                 "FROM products WHERE stock <= reorder_point")
+
+
+def reorder_quantity(stock, reorder_point):
+    return max(reorder_point * REORDER_TARGET_MULTIPLE - (stock or 0), 1)
+
+
+class _CheckTask(QRunnable):
+    def __init__(self, owner, design_ids):
+        super().__init__()
+        self.owner = owner
+        self.design_ids = design_ids  # None: every low product
+
+    def run(self):
+        owner = self.owner
+        try:
+            if self.design_ids is None:
+                rows = owner.db.execute(LOW_STOCK_SQL).fetchall()
+                checked = None
+            else:
+                rows = []
+                for design_id in self.design_ids:
+                    row = owner.db.execute(PRODUCT_SQL, (design_id,)).fetchone()
+                    if row is not None and row[2] is not None and row[3] is not None \
+                            and row[2] <= row[3]:
+                        rows.append(row)
+                checked = list(self.design_ids)
+            alerts = [owner.draft(*row) for row in rows]
+        except (sqlite3.Error, PurchaseOrderError) as e:
+            # e.g. a product deleted between the check and its draft
+            owner.failed.emit(str(e))
+            return
+        owner.checked.emit(checked, alerts)
+
+
+class ReorderAlerts(QObject):
+    """Flags products at or below their reorder point and drafts purchase orders.
+
+    Listens for product changes in the data layer (every stock movement
+    notifies its product) and re-checks only the products that changed, on a
+    worker thread. A low product with a supplier gets a draft purchase order
+    unless one is already open. alertsChanged carries the current list of
+    (design_id, description, stock, reorder_point, po_id or None).
+    """
+
+    alertsChanged = pyqtSignal(list)
+    failed = pyqtSignal(str)
+    # (checked design ids or None for all, alerts among them), from the worker
+    checked = pyqtSignal(object, list)
+    # design id, or None when many products changed; from any thread
+    _productChanged = pyqtSignal(object)
+
+    def __init__(self, db=None, parent=None):
+        super().__init__(parent)
+        self.db = db or get_db()
+        self._alerts = {}
+        self._dirty = set()
+        self._full = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._start)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
+
+        self._productChanged.connect(self._queue)
+        self.checked.connect(self._apply)
+        self.db.subscribe("products", self._product_changed)
+
+    def alerts(self):
+        return sorted(self._alerts.values())
+
+    def check_all(self):
+        """Queue a check of every low product (start-up, or after a bulk change)."""
+        self._queue(None)
+
+    def wait(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
+
+    def _product_changed(self, table, change, key, rowid):
+        self._productChanged.emit(None if change == RESET else key)
+
+    def _queue(self, design_id):
+        if design_id is None:
+            self._full = True
+        else:
+            self._dirty.add(design_id)
+        self._timer.start()
+
+    def _start(self):
+        design_ids = None if self._full else self._dirty
+        self._full, self._dirty = False, set()
+        self._pool.start(_CheckTask(self, design_ids))
+
+    def draft(self, design_id, description, stock, reorder_point, supplier_id):
+        """Runs on the worker: return the alert, drafting a purchase order if needed."""
+        orders = self.db.purchase_orders
+        with self.db.transaction():
+            po_id = orders.open_for_product(design_id)
+            if po_id is None and supplier_id:
+                po_id = orders.draft(supplier_id, design_id, reorder_quantity(stock, reorder_point))
+        return (design_id, description, stock, reorder_point, po_id)
+
+    def _apply(self, checked, alerts):
+        current = {} if checked is None else dict(self._alerts)
+        for design_id in checked or ():
+            current.pop(design_id, None)
+        for alert in alerts:
+            current[alert[0]] = alert
+        if current != self._alerts:
+            self._alerts = current
+            self.alertsChanged.emit(self.alerts())
+
+
+_alerts = None
+_alerts_lock = threading.Lock()
+
+
+def get_reorder_alerts():
+    """Return the process-wide ReorderAlerts, creating and starting it on first use."""
+    global _alerts
+    with _alerts_lock:
+        if _alerts is None:
+            _alerts = ReorderAlerts()
+            _alerts.check_all()
+        return _alerts
@@ -0,0 +1,121 @@
+import sqlite3
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from db import get_db
+
+# Quiet period after the last keystroke before a query is started.
+SEARCH_DEBOUNCE_MS = 150
+
+# Rows sent to the GUI per batch, so the first matches appear before the
+# whole result set has been read.
+SEARCH_BATCH_SIZE = 50
+
+
+class _SearchTask(QRunnable):
+    def __init__(self, owner, generation, text):
+        super().__init__()
+        self.owner = owner
+        self.generation = generation
+        self.text = text
+
+    def run(self):
+        owner = self.owner
+        if owner.is_stale(self.generation):
+            return
+        try:
+            # Published before the query starts: the FTS match, ranking and
+            # ORDER BY all run inside the first step of execute(), which is
+            # what cancel() has to interrupt
+            owner.active_connection = owner.db.connection()
+            if owner.is_stale(self.generation):
+                return  # cancelled before the connection was published
+            cursor = owner.search_fn(self.text)
+            first = True
+            while True:
+                rows = cursor.fetchmany(SEARCH_BATCH_SIZE)
+                if owner.is_stale(self.generation):
+                    return
+                owner.batchReady.emit(self.generation, rows, first, len(rows) < SEARCH_BATCH_SIZE)
+                if len(rows) < SEARCH_BATCH_SIZE:
+                    return
+                first = False
+        except sqlite3.Error as e:
+            # An interrupted query from a superseded search is expected.
+            if not owner.is_stale(self.generation):
+                owner.failed.emit(self.generation, str(e))
+        finally:
+            owner.active_connection = None
+
+
+class DebouncedSearch(QObject):
+    """Debounced, cancellable search run on a worker thread.
+
+    request() restarts the debounce timer; when it fires the newest text is
+    searched on a single background thread. Each request bumps a generation
+    counter: a newer request interrupts the running query and any batch that
+    still arrives from an older one is dropped, so only the newest result set
+    reaches resultsReady.
+
+    search_fn(text) is called on the worker thread and must return an
+    sqlite3 cursor on that thread's connection of `db` (default get_db()).
+    """
+
+    batchReady = pyqtSignal(int, list, bool, bool)
+    failed = pyqtSignal(int, str)
+    # (rows, first batch?, last batch?) for the newest request only
+    resultsReady = pyqtSignal(list, bool, bool)
+    searchFailed = pyqtSignal(str)
+
+    def __init__(self, search_fn, delay_ms=SEARCH_DEBOUNCE_MS, db=None, parent=None):
+        super().__init__(parent)
+        self.search_fn = search_fn
+        self.db = db or get_db()
+        self.active_connection = None
+        self._generation = 0
+        self._text = ""
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._start)
+
+        # One long-lived worker thread keeps its pooled connection between
+        # searches and guarantees queries never overlap.
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
+
+        self.batchReady.connect(self._deliver)
+        self.failed.connect(self._fail)
+
+    def request(self, text, immediate=False):
+        self._text = text
+        self.cancel()
+        if immediate:
+            self._timer.stop()
+            self._start()
+        else:
+            self._timer.start()
+
+    def cancel(self):
+        self._generation += 1
+        self._pool.clear()
+        connection = self.active_connection
+        if connection is not None:
+            connection.interrupt()
+
+    def is_stale(self, generation):
+        return generation != self._generation
+
+    def wait(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
+
+    def _start(self):
+        self._pool.start(_SearchTask(self, self._generation, self._text))
+
+    def _deliver(self, generation, rows, first, last):
+        if not self.is_stale(generation):
+            self.resultsReady.emit(rows, first, last)
+
+    def _fail(self, generation, message):
+        if not self.is_stale(generation):
+            self.searchFailed.emit(message)
@@ -0,0 +1,154 @@
+import os
+import sqlite3
+import bcrypt
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from db import get_db
+
+# bcrypt cost factor for new and upgraded hashes: each step doubles the time
+# a hash takes. Set BCRYPT_ROUNDS in the environment to tune it for slower
+# shop PCs; benchmarks/bench_login.py prints the latency per level.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+
+# bcrypt reads at most this many bytes of a password and refuses longer ones.
+MAX_PASSWORD_BYTES = 72
+
+
+class AuthError(Exception):
+    """A login or registration the user has to correct (shown as a warning)."""
+
+
+def _as_bytes(value):
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
+def hash_password(password, rounds=BCRYPT_ROUNDS):
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds))
+
+
+def hash_rounds(hashed):
+    """Cost factor stored in a bcrypt hash ($2b$12$...), or None if unreadable."""
+    try:
+        return int(_as_bytes(hashed).split(b"$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def needs_rehash(hashed, rounds=BCRYPT_ROUNDS):
+    return hash_rounds(hashed) != rounds
+
+
+class Authenticator:
+    """Password checks and registration against the users table.
+
+    The methods are blocking (a bcrypt hash takes a large fraction of a
+    second by design); AuthWorker runs them off the GUI thread.
+    """
+
+    def __init__(self, users=None, rounds=BCRYPT_ROUNDS):
+        self.users = users or get_db().users
+        self.rounds = rounds
+        self._dummy_hash = None
+
+    def login(self, username, password):
+        """Return the user id, or raise AuthError.
+
+        A hash made with a different cost factor is replaced with one at
+        `rounds` after a successful check, while the password is at hand.
+        """
+        if len(password.encode("utf-8")) > MAX_PASSWORD_BYTES:
+            raise AuthError("Invalid username or password")  # could never have been registered
+        user = self.users.find_by_username(username)
+        if user is None:
+            # Spend the same time as a real check so unknown names don't stand out.
+            if self._dummy_hash is None:
+                self._dummy_hash = hash_password("", self.rounds)
+            bcrypt.checkpw(password.encode("utf-8"), self._dummy_hash)
+            raise AuthError("Invalid username or password")
+        user_id, hashed = user
+        if not bcrypt.checkpw(password.encode("utf-8"), _as_bytes(hashed)):
+            raise AuthError("Invalid username or password")
+        if needs_rehash(hashed, self.rounds):
+            self.users.set_password(user_id, hash_password(password, self.rounds))
+        return user_id
+
+    def register(self, username, password):
+        """Create the user and return its id, or raise AuthError."""
+        if self.users.exists(username):
+            raise AuthError("Username already exists")
+        if len(password.encode("utf-8")) > MAX_PASSWORD_BYTES:
+            raise AuthError(f"Password must be at most {MAX_PASSWORD_BYTES} bytes long")
+        hashed = hash_password(password, self.rounds)
+        try:
+            return self.users.insert(username, hashed)
+        except sqlite3.IntegrityError:
+            raise AuthError("Username already exists")  # registered meanwhile
+
+
+class _AuthTask(QRunnable):
+    def __init__(self, owner, fn, args):
+        super().__init__()
+        self.owner = owner
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except AuthError as e:
+            self.owner.rejected.emit(str(e))
+        except (sqlite3.Error, ValueError) as e:
+            # ValueError: bcrypt could not read a stored hash
+            self.owner.failed.emit(str(e))
+        else:
+            self.owner.succeeded.emit(result)
+        finally:
+            self.owner.finished.emit()
+
+
+class AuthWorker(QObject):
+    """Runs Authenticator.login/register on a worker thread.
+
+    busyChanged(True) is emitted when a request starts and busyChanged(False)
+    after exactly one of succeeded (user id), rejected (message for the
+    user) or failed (database error, or a stored hash bcrypt cannot read).
+    A request made while one is running is ignored, so a double click never
+    hashes twice.
+    """
+
+    busyChanged = pyqtSignal(bool)
+    succeeded = pyqtSignal(str)
+    rejected = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, authenticator=None, parent=None):
+        super().__init__(parent)
+        self.authenticator = authenticator or Authenticator()
+        self._busy = False
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self.finished.connect(self._finish)
+
+    def is_busy(self):
+        return self._busy
+
+    def login(self, username, password):
+        return self._start(self.authenticator.login, username, password)
+
+    def register(self, username, password):
+        return self._start(self.authenticator.register, username, password)
+
+    def wait(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
+
+    def _start(self, fn, *args):
+        if self._busy:
+            return False
+        self._busy = True
+        self.busyChanged.emit(True)
+        self._pool.start(_AuthTask(self, fn, args))
+        return True
+
+    def _finish(self):
+        self._busy = False
+        self.busyChanged.emit(False)
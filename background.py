@@ -0,0 +1,116 @@
+"""Long jobs (imports, exports, invoice batches) run off the GUI thread.
+
+A BackgroundJob runs its work() on a worker thread of its own, one run at
+a time, and reports through Qt signals, which reach the GUI thread queued.
+run_with_progress() starts a job behind a progress dialog with a Cancel
+button and shows how it ended.
+"""
+import logging
+import sqlite3
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtWidgets import QMessageBox, QProgressDialog
+
+from db import get_db
+
+log = logging.getLogger(__name__)
+
+
+class _JobTask(QRunnable):
+    def __init__(self, job, args):
+        super().__init__()
+        self.job = job
+        self.args = args
+
+    def run(self):
+        job = self.job
+        try:
+            result = job.work(*self.args)
+        except job.errors as e:
+            job.failed.emit(str(e))
+        except sqlite3.Error as e:
+            job.failed.emit(f"Database error: {e}")
+        except Exception as e:
+            # A bug must still close the progress dialog, not leave it waiting
+            log.exception("%s failed", type(job).__name__)
+            job.failed.emit(f"Unexpected error: {e}")
+        else:
+            job.finished.emit(*result)
+
+
+class BackgroundJob(QObject):
+    """Base for a job run on a worker thread.
+
+    Subclasses declare the `progress` and `finished` signals and implement
+    work(*args), which runs on the worker thread, emits progress as it
+    goes, stops early once cancelled() is true and returns the values
+    finished carries. `errors` lists the exceptions whose message is for
+    the user; those, database errors and any other exception end the job
+    with failed (message).
+    """
+
+    failed = pyqtSignal(str)
+    errors = ()
+
+    def __init__(self, db=None, parent=None):
+        super().__init__(parent)
+        self.db = db or get_db()
+        self._cancel = False
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    def start(self, *args):
+        self._cancel = False
+        self._pool.start(_JobTask(self, args))
+
+    def cancel(self):
+        self._cancel = True
+
+    def cancelled(self):
+        return self._cancel
+
+    def wait(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
+
+    def work(self, *args):
+        raise NotImplementedError
+
+
+def run_with_progress(parent, job, title, label, describe, result, *args):
+    """Start `job` with `args` behind a progress dialog and return the dialog.
+
+    describe(*progress values) gives (percent, label text) for the dialog;
+    result(*finished values) gives the message shown when the job is done,
+    or None to show nothing (e.g. when it was cancelled). A failure is shown
+    as a warning titled `title`. Cancel asks the job to stop; the dialog
+    and the job are deleted once it has ended.
+    """
+    dialog = QProgressDialog(label, "Cancel", 0, 100, parent)
+    dialog.setAttribute(Qt.WA_DeleteOnClose)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+    dialog.setMinimumDuration(0)
+    job.setParent(dialog)
+
+    def show_progress(*values):
+        percent, text = describe(*values)
+        dialog.setValue(percent)
+        dialog.setLabelText(text)
+
+    def show_result(*values):
+        dialog.close()
+        message = result(*values)
+        if message:
+            QMessageBox.information(parent, title, message)
+
+    def show_failure(message):
+        dialog.close()
+        QMessageBox.warning(parent, title, message)
+
+    job.progress.connect(show_progress)
+    job.finished.connect(show_result)
+    job.failed.connect(show_failure)
+    dialog.canceled.connect(job.cancel)
+    dialog.show()
+    job.start(*args)
+    return dialog
@@ -0,0 +1,86 @@
+"""Compare per-call sqlite3.connect() against the shared Database.
+
+Run from the repository root:
+
+    python benchmarks/bench_db.py [--rows 20000] [--ops 2000]
+
+A scratch database is built in a temporary directory; embroidery.db is never
+touched.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import Database
+
+
+def seed(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE clients (id TEXT PRIMARY KEY, name TEXT, contact TEXT, address TEXT)")
+    conn.executemany("INSERT INTO clients VALUES (?, ?, ?, ?)",
+                     ((str(uuid.uuid4()), f"Party {i}", f"9{i:09d}", f"Surat {i % 97}")
+                      for i in range(rows)))
+    conn.commit()
+    ids = [r[0] for r in conn.execute("SELECT id FROM clients")]
+    conn.close()
+    return ids
+
+
+def per_call_get(path, key):
+    conn = sqlite3.connect(path)
+    c = conn.cursor()
+    c.execute("SELECT id, name, contact, address FROM clients WHERE id = ?", (key,))
+    row = c.fetchone()
+    conn.close()
+    return row
+
+
+def per_call_update(path, key, i):
+    conn = sqlite3.connect(path)
+    c = conn.cursor()
+    c.execute("UPDATE clients SET name = ?, contact = ?, address = ? WHERE id = ?",
+              (f"Party {i}", f"8{i:09d}", "Surat", key))
+    conn.commit()
+    conn.close()
+
+
+def measure(label, ops, fn):
+    start = time.perf_counter()
+    for i in range(ops):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {ops / elapsed:>12,.0f} ops/sec")
+    return ops / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--ops", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        ids = seed(path, args.rows)
+        db = Database(path)
+        pick = lambda i: ids[(i * 7919) % len(ids)]
+
+        print(f"{args.rows} clients, {args.ops} operations each")
+        old = measure("connect-per-call lookup", args.ops, lambda i: per_call_get(path, pick(i)))
+        new = measure("pooled lookup", args.ops, lambda i: db.clients.get(pick(i)))
+        print(f"{'speed-up':<32} {new / old:>12.1f}x")
+        old = measure("connect-per-call update", args.ops, lambda i: per_call_update(path, pick(i), i))
+        new = measure("pooled update", args.ops,
+                      lambda i: db.clients.update(pick(i), f"Party {i}", f"8{i:09d}", "Surat"))
+        print(f"{'speed-up':<32} {new / old:>12.1f}x")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
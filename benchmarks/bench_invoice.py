@@ -0,0 +1,91 @@
+"""Invoice PDF throughput: invoices per second, in process and in a pool.
+
+Renders a day of invoices from a scratch database once on this process
+(after a warm-up invoice, so the cached template, fonts and header are
+not counted) and then with invoice.write_invoices() at each pool size.
+
+Run from the repository root:
+
+    python benchmarks/bench_invoice.py [--invoices 200] [--workers 1 2 4]
+
+A scratch database and output directory are built in a temporary
+directory; embroidery.db is never touched.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtGui import QGuiApplication
+
+import invoice
+from db import Database
+from migrations import migrate
+from pricing import order_amounts
+
+DAY = "2026-10-05"
+NAMES = ["Ramesh Patel", "રમેશભાઈ પટેલ", "ભાવના શાહ", "सुरेश मेहता", "Kiran Desai"]
+
+
+def seed(db, invoices):
+    rng = random.Random(7)
+    migrate(db)
+    with db.transaction():
+        db.executemany("INSERT INTO products (design_id, description, embroidery_type, price, stock, gst_rate) "
+                       "VALUES (?, ?, 'Zari', ?, 0, ?)",
+                       ((f"D{i}", f"Design {i}", rng.randint(5000, 500000), rng.choice([5, 12, 18]))
+                        for i in range(50)))
+        for i in range(invoices):
+            client = str(uuid.uuid4())
+            db.execute("INSERT INTO clients (id, name, contact, address) VALUES (?, ?, ?, 'Surat')",
+                       (client, f"{rng.choice(NAMES)} {i}", f"9{i:09d}"))
+            for _ in range(rng.randint(1, 6)):
+                product = f"D{rng.randrange(50)}"
+                price, rate = db.execute("SELECT price, gst_rate FROM products WHERE design_id = ?",
+                                         (product,)).fetchone()
+                quantity = rng.randint(1, 20)
+                _, gst, total = order_amounts(price, rate, quantity)
+                db.execute("INSERT INTO orders (order_id, client_id, product_id, quantity, status, "
+                           "order_date, total_cost, gst) VALUES (?, ?, ?, ?, 'Pending', ?, ?, ?)",
+                           (str(uuid.uuid4()), client, product, quantity, DAY, total, gst))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--invoices", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    app = QGuiApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "invoices.db"))
+        db.configure()
+        seed(db, args.invoices)
+        start = time.perf_counter()
+        invoices = invoice.invoices_for_day(db, DAY)
+        print(f"{'read the day':<24} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+        invoice.write_pdf(invoices[0], os.path.join(tmp, "warm-up.pdf"))
+        start = time.perf_counter()
+        for number, bill in enumerate(invoices):
+            invoice.write_pdf(bill, os.path.join(tmp, f"serial-{number}.pdf"))
+        elapsed = time.perf_counter() - start
+        print(f"{'in process':<24} {len(invoices) / elapsed:>10.1f} invoices/s")
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            invoice.write_invoices(invoices, os.path.join(tmp, f"pool-{workers}"), workers)
+            elapsed = time.perf_counter() - start
+            print(f"{f'pool of {workers}':<24} {len(invoices) / elapsed:>10.1f} invoices/s")
+        db.close()
+    del app
+
+
+if __name__ == "__main__":
+    main()
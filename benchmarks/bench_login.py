@@ -0,0 +1,96 @@
+"""Login latency per bcrypt cost factor.
+
+For each cost level registers a user, then logs in repeatedly through
+AuthWorker while a 10 ms timer ticks on the GUI thread. Reports the time to
+hash, the login latency (click to result) and the longest the GUI thread
+went without processing an event, next to the stall a checkpw call on the
+GUI thread (the old handle_login) would cause.
+
+Run from the repository root:
+
+    python benchmarks/bench_login.py [--min-rounds 10] [--max-rounds 14] [--logins 5]
+
+A scratch database is built in a temporary directory; embroidery.db is never
+touched.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bcrypt
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from auth import Authenticator, AuthWorker
+from db import Database
+from migrations import migrate
+
+
+def login_once(worker, username, password):
+    """Log in through the worker; return (latency, longest GUI gap)."""
+    loop = QEventLoop()
+    ticks = []
+    timer = QTimer()
+    timer.setInterval(10)
+    timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    worker.finished.connect(loop.quit)
+    timer.start()
+    start = time.perf_counter()
+    ticks.append(start)
+    worker.login(username, password)
+    loop.exec_()
+    end = time.perf_counter()
+    timer.stop()
+    worker.finished.disconnect(loop.quit)
+    ticks.append(end)
+    gap = max(b - a for a, b in zip(ticks, ticks[1:]))
+    return end - start, gap
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--logins", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "bench.db"))
+        db.configure()
+        migrate(db)
+
+        print(f"{'cost':>4} {'hash ms':>9} {'login ms':>9} {'GUI gap ms':>11} {'checkpw on GUI ms':>18}")
+        for rounds in range(args.min_rounds, args.max_rounds + 1):
+            auth = Authenticator(db.users, rounds)
+            worker = AuthWorker(auth)
+            username = f"user{rounds}"
+            start = time.perf_counter()
+            auth.register(username, "secret")
+            hashed = time.perf_counter() - start
+
+            latencies, gaps = [], []
+            for _ in range(args.logins):
+                latency, gap = login_once(worker, username, "secret")
+                latencies.append(latency)
+                gaps.append(gap)
+
+            stored = db.users.find_by_username(username)[1]
+            start = time.perf_counter()
+            bcrypt.checkpw(b"secret", stored)
+            blocking = time.perf_counter() - start
+            print(f"{rounds:>4} {hashed * 1000:>9.1f} {statistics.median(latencies) * 1000:>9.1f} "
+                  f"{max(gaps) * 1000:>11.1f} {blocking * 1000:>18.1f}")
+            worker.wait()
+        db.close()
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Batch GST pricing, and a year of monthly GST figures over many orders.
+
+Prices a batch of lines with pricing.line_amounts() with and without
+NumPy, and reads twelve months of taxable value and GST from the summary
+tables against grouping the orders table itself.
+
+Run from the repository root:
+
+    python benchmarks/bench_pricing.py [--rows 500000]
+
+A scratch database is built in a temporary directory; embroidery.db is never
+touched.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pricing
+from db import Database
+from migrations import migrate
+
+GST_RATES = [0, 5, 12, 18, 28, 0.25]
+
+
+def seed(db, rows):
+    rng = random.Random(7)
+    migrate(db)
+    lines = [(rng.randint(500, 500000), rng.randint(1, 40), rng.choice(GST_RATES)) for _ in range(rows)]
+    net, gst, total = pricing.line_amounts(*zip(*lines))
+    with db.transaction():
+        db.executemany("INSERT INTO orders (order_id, client_id, product_id, quantity, status, "
+                       "order_date, total_cost, gst) VALUES (?, 'c', 'p', ?, 'Paid', ?, ?, ?)",
+                       ((str(uuid.uuid4()), quantity, f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                         int(total[i]), int(gst[i])) for i, (_, quantity, _) in enumerate(lines)))
+    return lines
+
+
+def best_of(fn, runs=5):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "pricing.db"))
+        db.configure()
+        lines = seed(db, args.rows)
+        prices, quantities, rates = zip(*lines)
+
+        numpy = pricing.np
+        if numpy is not None:
+            elapsed, _ = best_of(lambda: pricing.line_amounts(prices, quantities, rates))
+            print(f"{'line_amounts, NumPy':<36} {elapsed * 1000:>10.2f} ms")
+        pricing.np = None
+        elapsed, _ = best_of(lambda: pricing.line_amounts(prices, quantities, rates))
+        pricing.np = numpy
+        print(f"{'line_amounts, plain Python':<36} {elapsed * 1000:>10.2f} ms")
+
+        elapsed, summary = best_of(lambda: db.summaries.gst_monthly("2026-01", "2026-12"))
+        print(f"{'monthly GST from summaries':<36} {elapsed * 1000:>10.2f} ms")
+        elapsed, grouped = best_of(lambda: db.execute(
+            "SELECT strftime('%Y-%m', order_date) AS month, SUM(total_cost) - SUM(gst), SUM(gst), COUNT(*) "
+            "FROM orders WHERE order_date BETWEEN '2026-01-01' AND '2026-12-31' "
+            "GROUP BY month ORDER BY month").fetchall())
+        print(f"{'monthly GST grouping orders':<36} {elapsed * 1000:>10.2f} ms")
+        assert [tuple(map(int, row[1:])) for row in summary] == [tuple(row[1:]) for row in grouped]
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Client search latency: LIKE '%text%' against the clients_fts index.
+
+Run from the repository root:
+
+    python benchmarks/bench_search.py [--rows 200000]
+
+A scratch database is built in a temporary directory; embroidery.db is never
+touched.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import Database
+from migrations import migrate
+
+FIRST_NAMES = ["Ramesh", "Suresh", "Mahesh", "Kiran", "Nilesh", "Jignesh", "Hetal", "Bhavna",
+               "રમેશ", "સુરેશ", "કિરણ", "ભાવના"]
+LAST_NAMES = ["Patel", "Shah", "Desai", "Mehta", "Joshi", "પટેલ", "શાહ", "દેસાઈ"]
+CITIES = ["Surat", "Ahmedabad", "Vadodara", "Rajkot", "Varachha Road", "Katargam"]
+QUERIES = ["r", "ra", "ram", "rame", "ramesh", "ramesh pat", "રમે", "98", "surat"]
+
+
+def seed(db, rows):
+    rng = random.Random(7)
+    migrate(db)
+    with db.transaction():
+        db.executemany("INSERT INTO clients (id, name, contact, address) VALUES (?, ?, ?, ?)",
+                       ((str(uuid.uuid4()),
+                         f"{rng.choice(FIRST_NAMES)}bhai {rng.choice(LAST_NAMES)} {i}",
+                         f"9{i:09d}", f"{rng.randint(1, 500)}, {rng.choice(CITIES)}")
+                        for i in range(rows)))
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "bench.db"))
+        db.configure()
+        seed(db, args.rows)
+        like_sql = ("SELECT id, name, contact, address FROM clients "
+                    "WHERE name LIKE ? OR contact LIKE ?")
+
+        print(f"{args.rows} clients")
+        print(f"{'query':<14} {'LIKE ms':>10} {'rows':>8} {'FTS ms':>10} {'rows':>8}")
+        for text in QUERIES:
+            like_ms, like_rows = timed(
+                lambda: db.execute(like_sql, (f"%{text}%", f"%{text}%")).fetchall())
+            fts_ms, fts_rows = timed(lambda: db.clients.search(text))
+            print(f"{text:<14} {like_ms:>10.2f} {like_rows:>8} {fts_ms:>10.2f} {fts_rows:>8}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Cold start to the login screen, and first open of each page.
+
+Builds the window with yogi_fashion.app.create_window(), as the application
+does, against scratch databases of increasing size. With lazily built pages the time to the
+login screen should not depend on how many rows the tables hold.
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py [--rows 0 10000 100000]
+
+embroidery.db is never touched.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from db import open_db
+from migrations import migrate
+from yogi_fashion.app import create_window
+
+
+def seed(db, rows):
+    migrate(db)
+    with db.transaction():
+        db.executemany("INSERT INTO employees (id, name, contact, role) VALUES (?, ?, ?, ?)",
+                       ((str(uuid.uuid4()), f"Worker {i}", f"9{i:09d}", "Karigar")
+                        for i in range(rows)))
+        db.executemany("INSERT INTO clients (id, name, contact, address) VALUES (?, ?, ?, ?)",
+                       ((str(uuid.uuid4()), f"Party {i}", f"8{i:09d}", "Surat")
+                        for i in range(rows)))
+        db.executemany("INSERT INTO products (design_id, description, embroidery_type, price, stock) "
+                       "VALUES (?, ?, ?, ?, ?)",
+                       ((str(uuid.uuid4()), f"Design {i}", "Zari", 10000, 10) for i in range(rows)))
+        db.executemany("INSERT INTO expenses (id, description, amount, date) VALUES (?, ?, ?, ?)",
+                       ((str(uuid.uuid4()), f"Expense {i}", 5000, "2024-01-01") for i in range(rows)))
+
+
+def login_screen(app):
+    start = time.perf_counter()
+    stacked_widget = create_window()
+    stacked_widget.show()
+    app.processEvents()
+    return stacked_widget, time.perf_counter() - start
+
+
+def first_open(app, main_page, name):
+    start = time.perf_counter()
+    main_page.open_page(name)
+    app.processEvents()
+    return time.perf_counter() - start
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[0, 10000, 100000])
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    names = ["Home", "Employee Details", "Party Details", "Material Details", "Expense Details"]
+    print(f"{'rows/table':>10} {'login screen ms':>16} " + " ".join(f"{n.split()[0]:>10}" for n in names))
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            db = open_db(os.path.join(tmp, f"startup-{rows}.db"))
+            db.configure()
+            seed(db, rows)
+            stacked_widget, cold = login_screen(app)
+            stacked_widget.setCurrentIndex(3)
+            main_page = stacked_widget.widget(3)
+            opens = [first_open(app, main_page, name) for name in names]
+            print(f"{rows:>10} {cold * 1000:>16.1f} " + " ".join(f"{t * 1000:>10.1f}" for t in opens))
+            stacked_widget.close()
+            stacked_widget.deleteLater()
+            app.processEvents()
+        db.close()
+
+
+if __name__ == "__main__":
+    main_()
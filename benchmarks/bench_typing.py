@@ -0,0 +1,107 @@
+"""Typing-burst latency for the PartyPage search box.
+
+Types a name one key at a time and compares the old pipeline (a synchronous
+LIKE query on the GUI thread per keystroke) with DebouncedSearch. Reports
+the queries run, the time the GUI thread spent blocked and the latency from
+the last keystroke to the final results.
+
+Run from the repository root:
+
+    python benchmarks/bench_typing.py [--rows 200000] [--text Rameshbhai] [--key-interval 80]
+
+A scratch database is built in a temporary directory; embroidery.db is never
+touched.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from async_search import DebouncedSearch
+from bench_search import seed
+from db import Database
+
+LIKE_SQL = "SELECT id, name, contact, address FROM clients WHERE name LIKE ? OR contact LIKE ?"
+
+
+def pump(msecs):
+    loop = QEventLoop()
+    QTimer.singleShot(msecs, loop.quit)
+    loop.exec_()
+
+
+def synchronous(db, text, key_interval):
+    queries = 0
+    blocked = 0.0
+    for i in range(1, len(text) + 1):
+        typed = text[:i]
+        start = time.perf_counter()
+        pattern = f"%{typed}%"
+        db.execute(LIKE_SQL, (pattern, pattern)).fetchall()
+        latency = time.perf_counter() - start
+        blocked += latency
+        queries += 1
+        pump(key_interval)
+    return queries, blocked, latency
+
+
+def debounced(db, text, key_interval):
+    search = DebouncedSearch(db.clients.search_cursor, db=db)
+    calls = []
+    original = search.search_fn
+    search.search_fn = lambda typed: (calls.append(typed), original(typed))[1]
+    done = {}
+    blocked = [0.0]
+
+    def on_results(rows, first, last):
+        start = time.perf_counter()
+        if last:
+            done["at"] = start
+        blocked[0] += time.perf_counter() - start
+
+    search.resultsReady.connect(on_results)
+    for i in range(1, len(text) + 1):
+        start = time.perf_counter()
+        search.request(text[:i])
+        blocked[0] += time.perf_counter() - start
+        last_key = time.perf_counter()
+        if i < len(text):
+            pump(key_interval)
+    while "at" not in done:
+        pump(5)
+    search.wait()
+    return len(calls), blocked[0], done["at"] - last_key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--text", default="Rameshbhai")
+    parser.add_argument("--key-interval", type=int, default=80, help="ms between keystrokes")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "bench.db"))
+        db.configure()
+        seed(db, args.rows)
+
+        print(f"{args.rows} clients, typing {args.text!r} at {args.key_interval} ms per key")
+        print(f"{'pipeline':<22} {'queries':>8} {'GUI blocked ms':>15} {'last key -> results ms':>24}")
+        for label, fn in (("synchronous LIKE", synchronous), ("debounced FTS", debounced)):
+            queries, blocked, latency = fn(db, args.text, args.key_interval)
+            print(f"{label:<22} {queries:>8} {blocked * 1000:>15.1f} {latency * 1000:>24.1f}")
+        db.close()
+    del app
+
+
+if __name__ == "__main__":
+    main()
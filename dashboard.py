@@ -0,0 +1,87 @@
+import sqlite3
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from db import get_db
+from pricing import rupees
+
+# Tables whose changes move a dashboard figure (see migrations.DASHBOARD_TOTALS,
+# migrations.PARTY_TOTALS and migrations.LEDGER_TOTALS).
+SOURCE_TABLES = ("expenses", "orders", "employees", "clients", "party_ledger")
+
+
+class Dashboard(QObject):
+    """Dashboard figures read from the dashboard_totals running totals.
+
+    Triggers keep dashboard_totals in step with every insert, update and
+    delete on the source tables, so figures() reads a handful of rows no
+    matter how large the ledgers grow; the orders awaiting payment are
+    counted from the parties that owe. The service listens for changes
+    made through the repositories and emits changed() once per burst of
+    changes with the fresh figures. Reorder alerts, if given, are listed in
+    the notifications.
+    """
+
+    changed = pyqtSignal(dict)
+    # Emitted from the thread that made a change; queued onto the GUI thread
+    _tableChanged = pyqtSignal()
+
+    def __init__(self, db=None, alerts=None, parent=None):
+        super().__init__(parent)
+        self.db = db or get_db()
+        self._alerts = []
+        self._refresh = QTimer(self)
+        self._refresh.setSingleShot(True)
+        self._refresh.setInterval(0)
+        self._refresh.timeout.connect(self.refresh)
+        self._tableChanged.connect(self._refresh.start)
+        for table in SOURCE_TABLES:
+            self.db.subscribe(table, self._table_changed)
+        if alerts is not None:
+            self._alerts = alerts.alerts()
+            alerts.alertsChanged.connect(self._alerts_changed)
+
+    def _table_changed(self, table, change, key, rowid):
+        self._tableChanged.emit()
+
+    def _alerts_changed(self, alerts):
+        self._alerts = alerts
+        self._refresh.start()
+
+    def notifications(self, awaiting_payment):
+        lines = []
+        for design_id, description, stock, reorder_point, po_id in self._alerts:
+            if po_id:
+                line = self.tr("⚠️ {0}: {1} left (reorder at {2}), purchase order drafted")
+            else:
+                line = self.tr("⚠️ {0}: {1} left (reorder at {2}), no supplier set")
+            lines.append(line.format(description or design_id, stock, reorder_point))
+        if awaiting_payment:
+            lines.append(self.tr("📦 {0} order(s) awaiting payment").format(awaiting_payment))
+        return "\n".join(lines) or self.tr("No new notifications")
+
+    def totals(self):
+        return dict(self.db.execute("SELECT name, value FROM dashboard_totals").fetchall())
+
+    def figures(self):
+        """Return the figures HomePage.update_data takes, as a dict; money is
+        formatted in rupees."""
+        totals = self.totals()
+        # Money in: orders marked Paid and payments taken against Udhar
+        paid = totals.get("paid_total", 0) + totals.get("payments_total", 0)
+        expenses = totals.get("expenses_total", 0)
+        return {
+            "balance": rupees(paid - expenses),
+            "expenses": rupees(expenses),
+            "employees": int(totals.get("employees", 0)),
+            "machines": 0,  # machines are not recorded anywhere yet
+            # Udhar is what parties owe on the party ledger, payments taken off
+            "udhar": rupees(totals.get("udhar_total", 0)),
+            "notifications": self.notifications(
+                self.db.party_ledger.awaiting_payment() if totals.get("parties_owing") else 0),
+        }
+
+    def refresh(self):
+        try:
+            figures = self.figures()
+        except sqlite3.Error:
+            return  # keep showing the last figures; the next change retries
+        self.changed.emit(figures)
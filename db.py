@@ -0,0 +1,982 @@
+import json
+import sqlite3
+import threading
+import uuid
+import weakref
+from contextlib import contextmanager
+from datetime import date
+
+from pricing import line_amounts, order_amounts
+
+DB_FILE = "embroidery.db"
+
+# sqlite3 keeps a per-connection cache of compiled statements keyed by SQL text.
+# Every repository builds its SQL once, so a long-lived connection with a roomy
+# cache never re-prepares a statement after the first click.
+STATEMENT_CACHE_SIZE = 256
+
+# Seconds a connection waits on another writer (two copies of the application,
+# or a script, may run against the same file) before raising "database is locked".
+BUSY_TIMEOUT = 10.0
+
+# Applied to every connection as it is opened. In WAL mode synchronous=FULL
+# costs a single fsync of the WAL per commit instead of the rollback journal's
+# create/fsync/delete cycle, and a committed bill survives a power cut.
+CONNECTION_PRAGMAS = (
+    ("synchronous", "FULL"),
+    ("cache_size", -32000),       # 32 MB page cache
+    ("mmap_size", 268435456),     # 256 MB memory-mapped reads
+    ("temp_store", "MEMORY"),
+)
+
+# Pages the WAL may grow to before a committing writer checkpoints it.
+WAL_AUTOCHECKPOINT_PAGES = 1000
+
+# Seconds between background PASSIVE checkpoints (see Checkpointer).
+CHECKPOINT_INTERVAL = 60.0
+
+# Row change kinds passed to Database.subscribe() callbacks. RESET means
+# "many rows changed, re-read everything" (e.g. after a bulk operation).
+INSERTED = "insert"
+UPDATED = "update"
+DELETED = "delete"
+RESET = "reset"
+
+# Rows returned by a client search; the table shows the best matches first.
+SEARCH_PAGE_SIZE = 100
+
+# Order statuses offered by the order page. Only PAID orders count towards
+# the balance; every other status is Udhar (see migrations.DASHBOARD_TOTALS).
+PAID = "Paid"
+ORDER_STATUSES = ("Pending", "Delivered", PAID)
+
+# Purchase order statuses: drafted (by hand or by the reorder alerts),
+# approved for sending to the supplier, received into stock.
+PO_DRAFT = "Draft"
+PO_APPROVED = "Approved"
+PO_RECEIVED = "Received"
+
+# Age brackets of outstanding Udhar: (label, oldest age in days it holds,
+# or None for everything older).
+AGING_BUCKETS = (("0-30", 30), ("31-60", 60), ("60+", None))
+
+# Open purchase orders listed per page on the supplier page.
+PO_PAGE_SIZE = 50
+
+# Matches scored with bm25 per search. Scoring is the expensive part of an
+# FTS query, so broad prefixes are ranked within this window only.
+SEARCH_RANK_CANDIDATES = 500
+
+
+class Database:
+    """Owns the long-lived connections to embroidery.db.
+
+    Each thread gets its own connection, opened on first use and kept until
+    close() is called, so the GUI thread and any worker threads never share a
+    connection and never pay connect/close per query.
+    """
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+        self.users = UserRepository(self)
+        self.employees = EmployeeRepository(self)
+        self.clients = ClientRepository(self)
+        self.products = ProductRepository(self)
+        self.expenses = ExpenseRepository(self)
+        self.orders = OrderRepository(self)
+        self.stock = StockLedger(self)
+        self.party_ledger = PartyLedger(self)
+        self.suppliers = SupplierRepository(self)
+        self.purchase_orders = PurchaseOrderRepository(self)
+        self.summaries = Summaries(self)
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None leaves transaction control to transaction(),
+            # so single statements commit on their own and DDL is transactional.
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT,
+                                   isolation_level=None,
+                                   check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            for name, value in CONNECTION_PRAGMAS:
+                conn.execute(f"PRAGMA {name} = {value}")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def configure(self):
+        """Startup stage: switch the file to WAL so readers never block the writer.
+
+        journal_mode is stored in the database file, so this only does real
+        work the first time; afterwards every connection opens in WAL.
+        """
+        conn = self.connection()
+        mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        if mode.lower() != "wal":
+            raise sqlite3.OperationalError(f"could not enable WAL (journal_mode={mode})")
+        conn.execute(f"PRAGMA wal_autocheckpoint = {WAL_AUTOCHECKPOINT_PAGES}")
+        return mode
+
+    def checkpoint(self, mode="PASSIVE"):
+        """Copy WAL frames back into the database file.
+
+        PASSIVE never waits on readers or writers; TRUNCATE waits for them and
+        then empties the WAL, which is what we want on shutdown.
+        Returns (busy, wal_frames, checkpointed_frames).
+        """
+        return self.connection().execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+
+    def execute(self, sql, params=()):
+        return self.connection().execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        return self.connection().executemany(sql, seq_of_params)
+
+    @contextmanager
+    def transaction(self):
+        """Run a block of statements as one transaction.
+
+        Nested use joins the outer transaction, so helpers can open a
+        transaction without caring whether their caller already has one.
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.pending = []
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            pending, self._local.pending = self._local.pending, None
+        for change in pending:
+            self._dispatch(*change)
+
+    @contextmanager
+    def savepoint(self, name):
+        """Inside transaction(), run a block that can fail on its own: on an
+        exception its statements and notifications are undone and the
+        exception re-raised, and the surrounding transaction carries on."""
+        conn = self.connection()
+        pending = self._local.pending
+        mark = len(pending)
+        conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute(f"ROLLBACK TO {name}")
+            conn.execute(f"RELEASE {name}")
+            del pending[mark:]
+            raise
+        conn.execute(f"RELEASE {name}")
+
+    def subscribe(self, table, callback):
+        """Call callback(table, change, key, rowid) after every committed
+        insert, update or delete made through a repository on `table`.
+
+        Callbacks run on the thread that made the change. Bound methods are
+        held weakly, so a page or model that goes away unsubscribes itself.
+        """
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        with self._lock:
+            self._subscribers.setdefault(table, []).append(ref)
+
+    def unsubscribe(self, table, callback):
+        with self._lock:
+            refs = self._subscribers.get(table, [])
+            refs[:] = [ref for ref in refs if ref() not in (None, callback)]
+
+    def notify(self, table, change, key=None, rowid=None):
+        """Announce a row change; held back until commit inside transaction()."""
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append((table, change, key, rowid))
+        else:
+            self._dispatch(table, change, key, rowid)
+
+    def _dispatch(self, table, change, key, rowid):
+        with self._lock:
+            refs = self._subscribers.get(table, [])
+            callbacks = [ref() for ref in refs]
+            if None in callbacks:
+                refs[:] = [ref for ref, callback in zip(refs, callbacks) if callback is not None]
+        for callback in callbacks:
+            if callback is not None:
+                callback(table, change, key, rowid)
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                # Refresh planner statistics for indexes whose tables changed a lot.
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+class Checkpointer(threading.Thread):
+    """Background checkpoint policy.
+
+    Runs a PASSIVE checkpoint every `interval` seconds on its own connection so
+    the WAL never grows without bound and no GUI click ever pays for the copy.
+    stop() finishes with a TRUNCATE checkpoint so the -wal file is emptied.
+    """
+
+    def __init__(self, db, interval=CHECKPOINT_INTERVAL):
+        super().__init__(name="wal-checkpointer", daemon=True)
+        self.db = db
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.db.checkpoint("PASSIVE")
+            except sqlite3.Error:
+                pass  # a busy or locked database is retried on the next tick
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+        try:
+            self.db.checkpoint("TRUNCATE")
+        except sqlite3.Error:
+            pass
+
+
+def fts_prefix_query(text):
+    """Turn free text into an FTS5 query matching every word as a prefix.
+
+    Each word is quoted so characters such as '+', '-' or '"' in a phone
+    number or name are taken literally instead of as query syntax.
+    """
+    words = text.split()
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+
+
+class Repository:
+    """Prepared CRUD statements for a single table."""
+
+    table = None
+    key = None
+    columns = ()
+    # Columns holding money, in whole paise (see pricing.py)
+    money = ()
+
+    def __init__(self, db):
+        self.db = db
+        cols = ", ".join(self.columns)
+        self.select_all_sql = f"SELECT {self.key}, {cols} FROM {self.table}"
+        self.select_one_sql = f"{self.select_all_sql} WHERE {self.key} = ?"
+        self.insert_sql = (f"INSERT INTO {self.table} ({self.key}, {cols}) "
+                           f"VALUES ({', '.join('?' * (len(self.columns) + 1))})")
+        self.update_sql = (f"UPDATE {self.table} SET "
+                           f"{', '.join(f'{c} = ?' for c in self.columns)} "
+                           f"WHERE {self.key} = ?")
+        self.delete_sql = f"DELETE FROM {self.table} WHERE {self.key} = ? RETURNING rowid"
+
+    def all(self):
+        return self.db.execute(self.select_all_sql).fetchall()
+
+    def get(self, key):
+        return self.db.execute(self.select_one_sql, (key,)).fetchone()
+
+    def insert(self, *values):
+        key = str(uuid.uuid4())
+        cursor = self.db.execute(self.insert_sql, (key, *values))
+        self.db.notify(self.table, INSERTED, key, cursor.lastrowid)
+        return key
+
+    def insert_many(self, rows):
+        """Insert rows of column values with one executemany; returns their keys.
+
+        Subscribers get a single RESET rather than one INSERTED per row.
+        """
+        rows = [(str(uuid.uuid4()), *values) for values in rows]
+        if rows:
+            with self.db.transaction() as conn:
+                conn.executemany(self.insert_sql, rows)
+                self.db.notify(self.table, RESET)
+        return [row[0] for row in rows]
+
+    def existing(self, column, values):
+        """The subset of `values` already present in `column` (one query)."""
+        return {row[0] for row in self.db.execute(
+            f"SELECT {column} FROM {self.table} WHERE {column} IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(values)),))}
+
+    def update(self, key, *values):
+        if self.db.execute(self.update_sql, (*values, key)).rowcount:
+            self.db.notify(self.table, UPDATED, key)
+
+    def delete(self, key):
+        for (rowid,) in self.db.execute(self.delete_sql, (key,)).fetchall():
+            self.db.notify(self.table, DELETED, key, rowid)
+
+
+class UserRepository(Repository):
+    table = "users"
+    key = "id"
+    columns = ("username", "password")
+
+    def find_by_username(self, username):
+        return self.db.execute("SELECT id, password FROM users WHERE username = ?",
+                               (username,)).fetchone()
+
+    def exists(self, username):
+        return self.db.execute("SELECT 1 FROM users WHERE username = ?",
+                               (username,)).fetchone() is not None
+
+    def set_password(self, key, password):
+        if self.db.execute("UPDATE users SET password = ? WHERE id = ?",
+                           (password, key)).rowcount:
+            self.db.notify(self.table, UPDATED, key)
+
+
+class EmployeeRepository(Repository):
+    table = "employees"
+    key = "id"
+    columns = ("name", "contact", "role")
+
+
+class ClientRepository(Repository):
+    table = "clients"
+    key = "id"
+    columns = ("name", "contact", "address")
+    # The cached Udhar, kept by PartyLedger; not one of the form's columns
+    money = ("balance",)
+
+    def search(self, text, limit=SEARCH_PAGE_SIZE):
+        return self.search_cursor(text, limit).fetchall()
+
+    def search_cursor(self, text, limit=SEARCH_PAGE_SIZE):
+        """Best-ranked clients whose name, contact or address has a word
+        starting with every word typed, via the clients_fts index.
+
+        Only the first SEARCH_RANK_CANDIDATES matches are ranked, so a one
+        letter prefix matching half the table costs the same as a full name.
+        Name hits outrank contact hits, which outrank address hits.
+        """
+        query = fts_prefix_query(text)
+        if not query:
+            return self.db.execute(self.select_all_sql)
+        return self.db.execute(
+            "SELECT c.id, c.name, c.contact, c.address FROM "
+            "(SELECT rowid, bm25(clients_fts, 10.0, 5.0, 1.0) AS score FROM clients_fts "
+            " WHERE clients_fts MATCH ? LIMIT ?) m "
+            "JOIN clients c ON c.rowid = m.rowid ORDER BY m.score LIMIT ?",
+            (query, SEARCH_RANK_CANDIDATES, limit))
+
+    def find_by_contact(self, contact):
+        row = self.db.execute("SELECT id FROM clients WHERE contact = ?", (contact,)).fetchone()
+        return row[0] if row else None
+
+    def contact_exists(self, contact, exclude_id=None):
+        if exclude_id is None:
+            row = self.db.execute("SELECT 1 FROM clients WHERE contact = ?",
+                                  (contact,)).fetchone()
+        else:
+            row = self.db.execute("SELECT 1 FROM clients WHERE contact = ? AND id != ?",
+                                  (contact, exclude_id)).fetchone()
+        return row is not None
+
+
+class ProductRepository(Repository):
+    """Products; `stock` is a cached balance of the product's stock_transactions.
+
+    insert() and update() take the stock the user typed and record the
+    difference as an 'opening' or 'adjustment' movement through StockLedger,
+    so the ledger always adds up to products.stock. gst_rate is a
+    percentage, None for none. A product with a reorder point and a supplier is watched by alerts.ReorderAlerts.
+    """
+
+    table = "products"
+    key = "design_id"
+    columns = ("description", "embroidery_type", "price", "stock", "gst_rate", "reorder_point", "supplier_id")
+    money = ("price",)
+
+    def insert(self, description, embroidery_type, price, stock, gst_rate=None, reorder_point=None,
+               supplier_id=None):
+        with self.db.transaction():
+            key = super().insert(description, embroidery_type, price, 0, gst_rate, reorder_point, supplier_id)
+            if stock:
+                self.db.stock.move(key, stock, "opening")
+        return key
+
+    def insert_many(self, rows, day=None):
+        """Insert many products, each with an 'opening' movement for its stock."""
+        rows = list(rows)
+        if not rows:
+            return []
+        day = day or date.today().isoformat()
+        with self.db.transaction() as conn:
+            keys = super().insert_many(rows)
+            conn.executemany(self.db.stock.insert_sql,
+                             [(str(uuid.uuid4()), key, values[3], "opening", day)
+                              for key, values in zip(keys, rows) if values[3]])
+            self.db.notify("stock_transactions", RESET)
+        return keys
+
+    def update(self, key, description, embroidery_type, price, stock, gst_rate=None, reorder_point=None,
+               supplier_id=None):
+        with self.db.transaction():
+            if self.db.execute("UPDATE products SET description = ?, embroidery_type = ?, price = ?, "
+                               "gst_rate = ?, reorder_point = ?, supplier_id = ? WHERE design_id = ?",
+                               (description, embroidery_type, price, gst_rate, reorder_point,
+                                supplier_id, key)).rowcount:
+                self.db.stock.adjust(key, stock)
+                self.db.notify(self.table, UPDATED, key)
+
+
+class ExpenseRepository(Repository):
+    table = "expenses"
+    key = "id"
+    columns = ("description", "amount", "date")
+    money = ("amount",)
+
+
+class StockError(Exception):
+    """A stock movement that cannot be made; the message is for the user."""
+
+
+class StockLedger:
+    """Every change to products.stock, recorded in stock_transactions.
+
+    Each movement inserts a ledger row (quantity signed: + in, - out) and
+    moves products.stock by the same amount in the same transaction, so
+    products.stock is a cached balance of the ledger. verify() and
+    rebuild() compare it with the ledger using one grouped query.
+    Movement kinds: opening, adjustment, receipt, sale, return.
+    """
+
+    insert_sql = ("INSERT INTO stock_transactions (transaction_id, product_id, quantity, type, date) "
+                  "VALUES (?, ?, ?, ?, ?)")
+    add_sql = "UPDATE products SET stock = COALESCE(stock, 0) + ? WHERE design_id = ?"
+    # The balance check is part of the UPDATE, so two movements can never
+    # both take the last pieces.
+    take_sql = "UPDATE products SET stock = stock + ? WHERE design_id = ? AND stock >= -?"
+    # (design_id, cached stock, ledger balance) for every product
+    balances_sql = ("SELECT p.design_id, p.stock, COALESCE(t.balance, 0) AS balance FROM products p "
+                    "LEFT JOIN (SELECT product_id, SUM(quantity) AS balance FROM stock_transactions "
+                    "GROUP BY product_id) t ON t.product_id = p.design_id")
+
+    def __init__(self, db):
+        self.db = db
+
+    def move(self, product_id, quantity, kind, day=None):
+        """Record one movement and return its transaction id; raises StockError."""
+        day = day or date.today().isoformat()
+        with self.db.transaction() as conn:
+            if quantity < 0:
+                if not conn.execute(self.take_sql, (quantity, product_id, quantity)).rowcount:
+                    row = conn.execute("SELECT stock FROM products WHERE design_id = ?",
+                                       (product_id,)).fetchone()
+                    if row is None:
+                        raise StockError(f"Unknown design {product_id}")
+                    raise StockError(f"Only {row[0] or 0} of design {product_id} in stock")
+            elif not conn.execute(self.add_sql, (quantity, product_id)).rowcount:
+                raise StockError(f"Unknown design {product_id}")
+            key = str(uuid.uuid4())
+            cursor = conn.execute(self.insert_sql, (key, product_id, quantity, kind, day))
+            self.db.notify("stock_transactions", INSERTED, key, cursor.lastrowid)
+            self.db.notify("products", UPDATED, product_id)
+        return key
+
+    def adjust(self, product_id, counted, day=None):
+        """Bring a product's stock to `counted` with an 'adjustment' movement."""
+        with self.db.transaction() as conn:
+            row = conn.execute("SELECT stock FROM products WHERE design_id = ?",
+                               (product_id,)).fetchone()
+            if row is None:
+                raise StockError(f"Unknown design {product_id}")
+            difference = counted - (row[0] or 0)
+            if difference:
+                return self.move(product_id, difference, "adjustment", day)
+
+    def receive_many(self, items, kind="receipt", day=None):
+        """Add stock for many (product_id, quantity) items in one transaction.
+
+        Ledger rows go in with one executemany and each product's balance
+        is raised once, however many lines it has. Raises StockError (and
+        records nothing) if a design is unknown or a quantity not positive.
+        """
+        day = day or date.today().isoformat()
+        items = list(items)
+        totals = {}
+        for product_id, quantity in items:
+            if quantity <= 0:
+                raise StockError(f"Quantity for design {product_id} must be more than zero")
+            totals[product_id] = totals.get(product_id, 0) + quantity
+        with self.db.transaction() as conn:
+            rows = [(str(uuid.uuid4()), product_id, quantity, kind, day) for product_id, quantity in items]
+            updated = 0
+            for product_id, quantity in totals.items():
+                updated += conn.execute(self.add_sql, (quantity, product_id)).rowcount
+            if updated != len(totals):
+                known = {row[0] for row in conn.execute(
+                    f"SELECT design_id FROM products WHERE design_id IN ({', '.join('?' * len(totals))})",
+                    list(totals))}
+                unknown = ", ".join(sorted(set(totals) - known))
+                raise StockError(f"Unknown design(s): {unknown}")
+            conn.executemany(self.insert_sql, rows)
+            for product_id in totals:
+                self.db.notify("products", UPDATED, product_id)
+            self.db.notify("stock_transactions", RESET)
+        return [row[0] for row in rows]
+
+    def verify(self):
+        """[(design_id, cached stock, ledger balance)] for products that disagree."""
+        return [row for row in self.db.execute(self.balances_sql) if (row[1] or 0) != row[2]]
+
+    def rebuild(self):
+        """Set products.stock to the ledger balance wherever they disagree;
+        returns the number of products corrected."""
+        with self.db.transaction() as conn:
+            changed = conn.execute(
+                f"UPDATE products SET stock = b.balance FROM ({self.balances_sql}) AS b "
+                "WHERE products.design_id = b.design_id AND COALESCE(products.stock, 0) != b.balance").rowcount
+            if changed:
+                self.db.notify("products", RESET)
+        return changed
+
+
+class PartyLedgerError(Exception):
+    """A party ledger entry that cannot be posted; the message is for the user."""
+
+
+class PartyLedger(Repository):
+    """Udhar (credit) per client: credit sales and payments, with balances.
+
+    Entries are written only through post(). Amounts are signed: + the
+    party owes more (sale), - it owes less (payment, settled, reversal).
+    Each entry carries the party's balance after it, in date then posting
+    order, and clients.balance caches the latest; so a party's Udhar is
+    one row, a statement's opening balance one index seek, and the Udhar
+    total a running total over clients.balance (migrations.PARTY_TOTALS).
+    """
+
+    table = "party_ledger"
+    key = "entry_id"
+    columns = ("client_id", "order_id", "kind", "date", "amount", "balance")
+    money = ("amount", "balance")
+
+    def __init__(self, db):
+        super().__init__(db)
+        self.last_before_sql = ("SELECT balance FROM party_ledger WHERE client_id = ? AND date {} ? "
+                                "ORDER BY date DESC, rowid DESC LIMIT 1")
+        # Credit entries, and the entries settling or reversing an order
+        self.credit_sql = ("SELECT order_id, date, amount FROM party_ledger WHERE client_id = ? "
+                           "AND (amount > 0 OR order_id IS NOT NULL) ORDER BY date, rowid")
+
+    def post(self, client_id, amount, kind, day=None, order_id=None):
+        """Record an entry of `amount` paise and move the party's balance;
+        returns its id."""
+        day = day or date.today().isoformat()
+        amount = int(amount)
+        with self.db.transaction() as conn:
+            if not conn.execute("UPDATE clients SET balance = balance + ? WHERE id = ?",
+                                (amount, client_id)).rowcount:
+                raise PartyLedgerError("Unknown client")
+            previous = conn.execute(self.last_before_sql.format("<="), (client_id, day)).fetchone()
+            key = str(uuid.uuid4())
+            cursor = conn.execute(self.insert_sql, (key, client_id, order_id, kind, day, amount,
+                                                    int(previous[0] if previous else 0) + amount))
+            # A back-dated entry moves the running balance of every later one
+            if conn.execute("UPDATE party_ledger SET balance = balance + ? "
+                            "WHERE client_id = ? AND date > ?", (amount, client_id, day)).rowcount:
+                self.db.notify(self.table, RESET)
+            else:
+                self.db.notify(self.table, INSERTED, key, cursor.lastrowid)
+            self.db.notify("clients", UPDATED, client_id)
+        return key
+
+    def pay(self, client_id, amount, day=None):
+        """Record a payment of `amount` paise from the party against its Udhar."""
+        if amount <= 0:
+            raise PartyLedgerError("Payment must be more than zero")
+        return self.post(client_id, -amount, "payment", day)
+
+    def balance(self, client_id):
+        row = self.db.execute("SELECT balance FROM clients WHERE id = ?", (client_id,)).fetchone()
+        return row[0] if row else None
+
+    def statement(self, client_id, start=None, end=None):
+        """(opening balance, entries dated within [start, end] in order).
+
+        Both are read off the (client_id, date) index: the opening balance
+        is the balance of the last entry before `start`.
+        """
+        opening = 0
+        if start:
+            row = self.db.execute(self.last_before_sql.format("<"), (client_id, start)).fetchone()
+            opening = row[0] if row else 0
+        rows = self.db.execute(f"{self.select_all_sql} WHERE client_id = ? AND date BETWEEN ? AND ? "
+                               "ORDER BY date, rowid", (client_id, start or "", end or "9999")).fetchall()
+        return opening, rows
+
+    def aging(self, client_id=None, day=None):
+        """Outstanding Udhar by age as {bucket label: paise} (see AGING_BUCKETS),
+        for one party or for every party that owes.
+
+        Each credit still owed (see owed()) is aged by its date. Only
+        parties with a balance due are read.
+        """
+        today = date.fromisoformat(day) if day else date.today()
+        buckets = {label: 0 for label, _ in AGING_BUCKETS}
+        for _, owed in self.owed(client_id):
+            label = AGING_BUCKETS[-1][0]
+            for entry_day, portion in owed:
+                if entry_day is not None:
+                    try:
+                        age = (today - date.fromisoformat(entry_day)).days
+                    except ValueError:
+                        age = None  # an unreadable date counts as oldest
+                    label = next(label for label, limit in AGING_BUCKETS
+                                 if limit is None or (age is not None and age <= limit))
+                buckets[label] += portion  # owed beyond any credit entry: as old as the last
+        return buckets
+
+    def awaiting_payment(self):
+        """How many credit sales are still owed, across every party that owes."""
+        return sum(sum(entry_day is not None for entry_day, _ in owed) for _, owed in self.owed())
+
+    def owed(self, client_id=None):
+        """[(party, [(credit date, paise still owed on it)], newest first)] for
+        one party or for every party that owes.
+
+        A "settled" or "reversal" entry clears the credit of its own order
+        (see open_credits()); payments then settle the oldest credit first,
+        so what is owed is the newest open credits adding up to the balance;
+        any balance beyond them comes last, dated None.
+        """
+        if client_id is None:
+            owing = self.db.execute("SELECT id, balance FROM clients WHERE balance > 0").fetchall()
+        else:
+            owing = self.db.execute("SELECT id, balance FROM clients WHERE id = ? AND balance > 0",
+                                    (client_id,)).fetchall()
+        parties = []
+        for party, remaining in owing:
+            remaining = int(remaining)
+            owed = []
+            for entry_day, amount in reversed(self.open_credits(party)):
+                portion = min(amount, remaining)
+                owed.append((entry_day, portion))
+                remaining -= portion
+                if remaining <= 0:
+                    break
+            else:
+                owed.append((None, remaining))
+            parties.append((party, owed))
+        return parties
+
+    def open_credits(self, client_id):
+        """[(date, paise)] of the party's credit entries, oldest first, less
+        what was settled or reversed against each entry's own order."""
+        credits, cleared = [], {}
+        for order_id, entry_day, amount in self.db.execute(self.credit_sql, (client_id,)):
+            amount = int(amount)
+            if amount > 0:
+                credits.append([order_id, entry_day, amount])
+            else:
+                cleared[order_id] = cleared.get(order_id, 0) - amount
+        for credit in credits:
+            taken = min(credit[2], cleared.get(credit[0], 0))
+            if taken:
+                credit[2] -= taken
+                cleared[credit[0]] -= taken
+        return [(entry_day, amount) for _, entry_day, amount in credits if amount]
+
+    def verify(self):
+        """[(client id, cached balance, ledger balance)] for parties that disagree."""
+        return self.db.execute(
+            "SELECT c.id, c.balance, COALESCE(l.total, 0) FROM clients c LEFT JOIN "
+            "(SELECT client_id, SUM(amount) AS total FROM party_ledger GROUP BY client_id) l "
+            "ON l.client_id = c.id WHERE c.balance != COALESCE(l.total, 0)").fetchall()
+
+
+class OrderError(Exception):
+    """An order that cannot be placed as entered; the message is for the user."""
+
+
+class OrderRepository(Repository):
+    """Orders against clients and products.
+
+    Placing an order takes the stock through StockLedger ('sale') and
+    inserts the order in one transaction; deleting an order puts the stock
+    back the same way ('return'). total_cost includes the GST held in gst,
+    both in paise and priced by pricing.py.
+    """
+
+    table = "orders"
+    key = "order_id"
+    columns = ("client_id", "product_id", "quantity", "status", "order_date", "total_cost", "gst")
+    money = ("total_cost", "gst")
+
+    def _place(self, conn, client_id, product_id, quantity, status, order_date, amounts=None):
+        if quantity <= 0:
+            raise OrderError("Quantity must be more than zero")
+        if conn.execute("SELECT 1 FROM clients WHERE id = ?", (client_id,)).fetchone() is None:
+            raise OrderError("Unknown client")
+        product = conn.execute("SELECT price, gst_rate FROM products WHERE design_id = ?",
+                               (product_id,)).fetchone()
+        if product is None:
+            raise OrderError(f"Unknown design {product_id}")
+        price, gst_rate = product
+        try:
+            self.db.stock.move(product_id, -quantity, "sale", order_date)
+        except StockError as e:
+            raise OrderError(str(e))
+        key = str(uuid.uuid4())
+        _, gst, total = amounts or order_amounts(price, gst_rate, quantity)
+        cursor = conn.execute(self.insert_sql, (key, client_id, product_id, quantity, status,
+                                                order_date, total, gst))
+        if status != PAID and total:
+            self.db.party_ledger.post(client_id, total, "sale", order_date, key)
+        self.db.notify(self.table, INSERTED, key, cursor.lastrowid)
+        return key
+
+    def place(self, client_id, product_id, quantity, status, order_date):
+        """Place one order and return its id; raises OrderError."""
+        with self.db.transaction() as conn:
+            return self._place(conn, client_id, product_id, quantity, status, order_date)
+
+    def place_many(self, entries, status, order_date):
+        """Place (client_id, product_id, quantity) entries in one transaction.
+
+        An entry that fails is rolled back on its own and reported, the rest
+        are placed. Returns ([order ids], [(entry index, message)]). The
+        whole batch is priced at once with pricing.line_amounts().
+        """
+        entries = list(entries)
+        placed, rejected = [], []
+        with self.db.transaction() as conn:
+            products = dict((key, (price, rate)) for key, price, rate in conn.execute(
+                "SELECT design_id, price, gst_rate FROM products "
+                "WHERE design_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(list({product_id for _, product_id, _ in entries})),)))
+            # Unknown designs are priced at nothing here and rejected by _place()
+            pricing = [products.get(product_id, (0, 0)) for _, product_id, _ in entries]
+            amounts = zip(*line_amounts([price for price, _ in pricing],
+                                        [quantity for _, _, quantity in entries],
+                                        [rate for _, rate in pricing]))
+            for index, ((client_id, product_id, quantity), line) in enumerate(zip(entries, amounts)):
+                try:
+                    with self.db.savepoint("order_entry"):
+                        placed.append(self._place(conn, client_id, product_id, quantity, status,
+                                                  order_date, tuple(int(amount) for amount in line)))
+                except (OrderError, sqlite3.IntegrityError) as e:
+                    rejected.append((index, str(e)))
+        return placed, rejected
+
+    def set_status(self, key, status):
+        """Change an order's status. Marking it Paid settles its Udhar on the
+        party ledger; taking Paid back off owes it again."""
+        with self.db.transaction() as conn:
+            row = conn.execute("SELECT client_id, status, total_cost FROM orders WHERE order_id = ?",
+                               (key,)).fetchone()
+            if row is None:
+                return
+            client_id, old_status, total = row
+            conn.execute("UPDATE orders SET status = ? WHERE order_id = ?", (status, key))
+            if (old_status == PAID) != (status == PAID) and total \
+                    and self.db.clients.get(client_id) is not None:
+                if status == PAID:
+                    self.db.party_ledger.post(client_id, -total, "settled", order_id=key)
+                else:
+                    self.db.party_ledger.post(client_id, total, "sale", order_id=key)
+            self.db.notify(self.table, UPDATED, key)
+
+    def delete(self, key):
+        """Delete an order, return its pieces to stock and take any unpaid
+        amount off the party's Udhar."""
+        with self.db.transaction() as conn:
+            rows = conn.execute("DELETE FROM orders WHERE order_id = ? "
+                                "RETURNING rowid, client_id, product_id, quantity, status, "
+                                "order_date, total_cost", (key,)).fetchall()
+            for rowid, client_id, product_id, quantity, status, order_date, total in rows:
+                if quantity and self.db.products.get(product_id) is not None:
+                    self.db.stock.move(product_id, quantity, "return", order_date)
+                if status != PAID and total and self.db.clients.get(client_id) is not None:
+                    self.db.party_ledger.post(client_id, -total, "reversal", order_id=key)
+                self.db.notify(self.table, DELETED, key, rowid)
+
+
+class SupplierRepository(Repository):
+    table = "suppliers"
+    key = "supplier_id"
+    columns = ("name", "contact", "address")
+
+
+class PurchaseOrderError(Exception):
+    """A purchase order step that cannot be taken; the message is for the user."""
+
+
+# Matches the partial indexes of migration 10, which hold open orders only,
+# so these lookups stay small however much received history piles up.
+OPEN_PO = f"status IN ('{PO_DRAFT}', '{PO_APPROVED}')"
+
+
+class PurchaseOrderRepository(Repository):
+    """Purchase orders: drafted, approved, then received into stock.
+
+    Receiving marks the order received and adds the stock through
+    StockLedger ('receipt') in the same transaction.
+    """
+
+    table = "purchase_orders"
+    key = "po_id"
+    columns = ("supplier_id", "product_id", "quantity", "order_date", "status")
+
+    def open_for_product(self, product_id):
+        """Id of a draft or approved purchase order for the product, or None."""
+        row = self.db.execute(f"SELECT po_id FROM purchase_orders WHERE product_id = ? AND {OPEN_PO}",
+                              (product_id,)).fetchone()
+        return row[0] if row else None
+
+    def open_for_supplier(self, supplier_id, after=None, limit=PO_PAGE_SIZE):
+        """A page of a supplier's open orders, oldest first.
+
+        Pass the (order_date, po_id) of the last row of a page as `after`
+        to get the next one; each page is read straight off the index.
+        """
+        after_date, after_id = after or ("", "")
+        return self.db.execute(
+            f"SELECT {self.key}, {', '.join(self.columns)} FROM purchase_orders "
+            f"WHERE supplier_id = ? AND {OPEN_PO} AND (order_date, po_id) > (?, ?) "
+            "ORDER BY order_date, po_id LIMIT ?",
+            (supplier_id, after_date, after_id, limit)).fetchall()
+
+    def draft(self, supplier_id, product_id, quantity, day=None):
+        if quantity <= 0:
+            raise PurchaseOrderError("Quantity must be more than zero")
+        if self.db.products.get(product_id) is None:
+            raise PurchaseOrderError(f"Unknown design {product_id}")
+        return self.insert(supplier_id, product_id, quantity, day or date.today().isoformat(), PO_DRAFT)
+
+    def approve(self, key):
+        if not self.db.execute("UPDATE purchase_orders SET status = ? WHERE po_id = ? AND status = ?",
+                               (PO_APPROVED, key, PO_DRAFT)).rowcount:
+            raise PurchaseOrderError("Only draft purchase orders can be approved")
+        self.db.notify(self.table, UPDATED, key)
+
+    def receive(self, key, quantity=None, day=None):
+        """Receive one approved order; see receive_many()."""
+        return self.receive_many([(key, quantity)], day)
+
+    def receive_many(self, lines, day=None):
+        """Receive a delivery note of (po_id, quantity) lines in one transaction.
+
+        A quantity of None means as ordered. Every order must be approved;
+        otherwise nothing is received and PurchaseOrderError is raised.
+        Returns the stock_transactions ids.
+        """
+        lines = list(lines)
+        if not lines:
+            return []
+        received = dict(lines)
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                f"UPDATE purchase_orders SET status = ? "
+                f"WHERE po_id IN ({', '.join('?' * len(received))}) AND status = ? "
+                "RETURNING po_id, product_id, quantity",
+                (PO_RECEIVED, *received, PO_APPROVED)).fetchall()
+            if len(rows) != len(received):
+                missing = len(received) - len(rows)
+                raise PurchaseOrderError(f"{missing} of the purchase orders are not approved")
+            movements = [(product_id, received[po_id] if received[po_id] is not None else quantity)
+                         for po_id, product_id, quantity in rows]
+            try:
+                keys = self.db.stock.receive_many(movements, "receipt", day)
+            except StockError as e:
+                raise PurchaseOrderError(str(e))
+            for po_id, _, _ in rows:
+                self.db.notify(self.table, UPDATED, po_id)
+        return keys
+
+
+class Summaries:
+    """Reads over summary_daily and summary_monthly (kept by triggers, see
+    migrations.SUMMARY_LEDGERS). `ledger` is "expenses", "orders" or "gst";
+    totals are in paise, days are YYYY-MM-DD and months YYYY-MM."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def daily(self, ledger, start, end):
+        return self.db.execute(
+            "SELECT day, total, entries FROM summary_daily "
+            "WHERE ledger = ? AND day BETWEEN ? AND ? ORDER BY day",
+            (ledger, start, end)).fetchall()
+
+    def monthly(self, ledger, start, end):
+        return self.db.execute(
+            "SELECT month, total, entries FROM summary_monthly "
+            "WHERE ledger = ? AND month BETWEEN ? AND ? ORDER BY month",
+            (ledger, start, end)).fetchall()
+
+    def month_to_date(self, ledger, day):
+        """(total, entries) from the first of day's month up to day."""
+        return self.db.execute(
+            "SELECT COALESCE(SUM(total), 0), COALESCE(SUM(entries), 0) FROM summary_daily "
+            "WHERE ledger = ? AND day BETWEEN substr(?, 1, 7) || '-01' AND ?",
+            (ledger, day, day)).fetchone()
+
+    def year_over_year(self, ledger, month):
+        """(total for month, total for the same month a year earlier)."""
+        previous = f"{int(month[:4]) - 1:04d}{month[4:]}"
+        totals = dict(self.db.execute(
+            "SELECT month, total FROM summary_monthly WHERE ledger = ? AND month IN (?, ?)",
+            (ledger, month, previous)).fetchall())
+        return totals.get(month, 0), totals.get(previous, 0)
+
+    def gst_monthly(self, start, end):
+        """[(month, taxable value, GST, orders)] of the orders in each month,
+        read from the month rows of the orders and gst ledgers."""
+        return self.db.execute(
+            "SELECT o.month, o.total - COALESCE(g.total, 0), COALESCE(g.total, 0), o.entries "
+            "FROM summary_monthly o LEFT JOIN summary_monthly g ON g.ledger = 'gst' AND g.month = o.month "
+            "WHERE o.ledger = 'orders' AND o.month BETWEEN ? AND ? ORDER BY o.month",
+            (start, end)).fetchall()
+
+
+_db = None
+_db_lock = threading.Lock()
+
+
+def get_db():
+    """Return the process-wide Database, creating it on first use."""
+    global _db
+    with _db_lock:
+        if _db is None:
+            _db = Database()
+        return _db
+
+
+def open_db(path):
+    """Point get_db() at another database file, closing the current one."""
+    global _db
+    with _db_lock:
+        if _db is not None:
+            _db.close()
+        _db = Database(path)
+        return _db
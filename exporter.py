@@ -0,0 +1,261 @@
+"""Streaming export of a table to CSV, Excel or JSON.
+
+    python exporter.py TABLE FILE [--from YYYY-MM-DD] [--to YYYY-MM-DD] [path/to/embroidery.db]
+
+TABLE is clients, employees, products, expenses, orders or
+stock_transactions; the format follows FILE's extension (.csv, .xlsx,
+.json). --from and --to keep expenses or orders dated within the range.
+Money is written in rupees. Rows are read from one cursor a batch at a time and written straight out,
+so memory does not grow with the table. Excel files need openpyxl.
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from datetime import date
+
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QDialog, QDialogButtonBox, QFileDialog, QFormLayout, QLineEdit
+
+from background import BackgroundJob, run_with_progress
+from db import Database, get_db
+from pricing import to_rupees
+
+# Rows fetched from the cursor and written per batch; progress and
+# cancellation are checked between batches.
+EXPORT_BATCH_ROWS = 2000
+
+# Rows an .xlsx sheet can hold, header included.
+EXCEL_MAX_ROWS = 1048576
+
+# Tables that can be exported: table -> date column the range applies to
+# (served by the indexes of migration 11), or None.
+EXPORT_TABLES = {
+    "clients": None,
+    "employees": None,
+    "products": None,
+    "expenses": "date",
+    "orders": "order_date",
+    "stock_transactions": None,
+}
+
+EXPORT_FORMATS = (".csv", ".xlsx", ".json")
+
+
+class ExportFileError(Exception):
+    """The export cannot be written; the message is for the user."""
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def _write_csv(path, columns, batches):
+    # utf-8-sig so Excel shows ₹ and Gujarati text correctly
+    with open(path, "w", newline="", encoding="utf-8-sig") as file:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        for rows in batches:
+            writer.writerows(rows)
+
+
+def _write_json(path, columns, batches):
+    with open(path, "w", encoding="utf-8") as file:
+        separator = "\n"
+        file.write("[")
+        for rows in batches:
+            for row in rows:
+                file.write(separator + json.dumps(dict(zip(columns, row)), ensure_ascii=False,
+                                                  default=float))
+                separator = ",\n"
+        file.write("\n]\n")
+
+
+def _write_excel(path, columns, batches):
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise ExportFileError("Writing Excel files needs openpyxl; "
+                              "install it or export to CSV") from None
+    # write_only streams rows out instead of keeping every cell in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(columns)
+    for rows in batches:
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+
+
+_WRITERS = {".csv": _write_csv, ".xlsx": _write_excel, ".json": _write_json}
+
+
+def export_query(table, start=None, end=None):
+    """Return (sql, params) selecting the table's rows, within [start, end]
+    on its date column when one is given."""
+    if table not in EXPORT_TABLES:
+        raise ExportFileError(f"Cannot export {table}; choose one of {', '.join(EXPORT_TABLES)}")
+    date_column = EXPORT_TABLES[table]
+    if not (start or end):
+        return f"SELECT * FROM {table} ORDER BY rowid", ()
+    if date_column is None:
+        raise ExportFileError(f"{table} has no date to filter on")
+    for day in (start, end):
+        if day:
+            try:
+                date.fromisoformat(day)
+            except ValueError:
+                raise ExportFileError("Dates must be YYYY-MM-DD") from None
+    # Open ends are bounded by strings every ISO date sorts between
+    return (f"SELECT * FROM {table} WHERE {date_column} BETWEEN ? AND ? ORDER BY {date_column}",
+            (start or "", end or "9999"))
+
+
+def export_file(db, table, path, start=None, end=None, progress=None, cancelled=None):
+    """Write the table's rows to FILE; returns the number of rows, or None if cancelled.
+
+    The file is written next to FILE and moved into place only when
+    complete, so a cancelled or failed export leaves FILE untouched.
+    progress(fraction written, rows written) is called after every batch.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _WRITERS:
+        raise ExportFileError("Export to a .csv, .xlsx or .json file")
+    sql, params = export_query(table, start, end)
+    total = db.execute(f"SELECT COUNT(*) FROM ({sql})", params).fetchone()[0]
+    if extension == ".xlsx" and total >= EXCEL_MAX_ROWS:
+        raise ExportFileError(f"{total} rows do not fit in an Excel sheet; export to CSV")
+    cursor = db.execute(sql, params)
+    columns = [description[0] for description in cursor.description]
+    # Paise are written as rupees; the repository of the table names its money columns
+    money = getattr(getattr(db, table, None), "money", ())
+    money = [position for position, column in enumerate(columns) if column in money]
+    written = 0
+
+    def batches():
+        nonlocal written
+        while True:
+            if cancelled and cancelled():
+                raise _Cancelled
+            rows = cursor.fetchmany(EXPORT_BATCH_ROWS)
+            if not rows:
+                return
+            if money:
+                rows = [list(row) for row in rows]
+                for row in rows:
+                    for position in money:
+                        if row[position] is not None:
+                            row[position] = to_rupees(row[position])
+            yield rows
+            written += len(rows)
+            if progress:
+                progress(written / total if total else 1.0, written)
+
+    tmp = f"{path}.tmp"
+    try:
+        _WRITERS[extension](tmp, columns, batches())
+        os.replace(tmp, path)
+    except _Cancelled:
+        return None
+    except OSError as e:
+        raise ExportFileError(str(e)) from None
+    finally:
+        cursor.close()
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return written
+
+
+class Exporter(BackgroundJob):
+    """Runs export_file() in the background.
+
+    progress carries (percent written, rows written) after every batch; the
+    export then ends with finished (rows written, or -1 if cancelled) or
+    failed (message for the user). Cancelling stops before the next batch
+    and discards the partly written file.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(int)
+    errors = (ExportFileError,)
+
+    def work(self, table, path, start=None, end=None):
+        written = export_file(self.db, table, path, start, end, self._progress, self.cancelled)
+        return (-1 if written is None else written,)
+
+    def _progress(self, fraction, written):
+        self.progress.emit(int(fraction * 100), written)
+
+
+class DateRangeDialog(QDialog):
+    """Asks for an optional from/to date; an empty field leaves that end open."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Date Range")
+        layout = QFormLayout(self)
+        self.start_input = QLineEdit()
+        self.start_input.setPlaceholderText("YYYY-MM-DD (optional)")
+        self.end_input = QLineEdit()
+        self.end_input.setPlaceholderText("YYYY-MM-DD (optional)")
+        layout.addRow("From:", self.start_input)
+        layout.addRow("To:", self.end_input)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+    def dates(self):
+        return self.start_input.text().strip() or None, self.end_input.text().strip() or None
+
+
+def export_to_file(parent, table):
+    """Ask for a file (and a date range for dated tables) and export `table`
+    to it in the background, showing progress."""
+    start = end = None
+    if EXPORT_TABLES.get(table):
+        dialog = DateRangeDialog(parent)
+        if dialog.exec_() != QDialog.Accepted:
+            return
+        start, end = dialog.dates()
+    path, chosen = QFileDialog.getSaveFileName(
+        parent, f"Export {table}", f"{table}.csv",
+        "CSV (*.csv);;Excel (*.xlsx);;JSON (*.json)")
+    if not path:
+        return
+    if os.path.splitext(path)[1].lower() not in EXPORT_FORMATS:
+        path += chosen[chosen.index("*") + 1:-1]
+
+    def describe(percent, written):
+        return percent, f"Exporting {table}… {written} rows"
+
+    def result(written):
+        return f"{written} rows exported to {path}" if written >= 0 else None
+
+    run_with_progress(parent, Exporter(), "Export", f"Exporting {table}…", describe, result,
+                      table, path, start, end)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("table", choices=list(EXPORT_TABLES))
+    parser.add_argument("file")
+    parser.add_argument("db", nargs="?")
+    parser.add_argument("--from", dest="start")
+    parser.add_argument("--to", dest="end")
+    args = parser.parse_args()
+
+    database = Database(args.db) if args.db else get_db()
+    began = time.perf_counter()
+    try:
+        written = export_file(database, args.table, args.file, args.start, args.end)
+    except ExportFileError as e:
+        parser.exit(1, f"{e}\n")
+    finally:
+        database.close()
+    print(f"{written} {args.table} rows exported to {args.file} in {time.perf_counter() - began:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
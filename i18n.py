@@ -0,0 +1,172 @@
+"""Interface language: translators loaded once, pages retranslated in place.
+
+Every text a page shows goes through tr() in the page's retranslateUi(),
+with English as the source language. The Hindi and Gujarati catalogues
+live in translations/ as Qt Linguist sources (<code>.ts), kept up to date
+with:
+
+    pylupdate5 yogi_fashion/*.py dashboard.py -ts translations/hi.ts translations/gu.ts
+
+A compiled <code>.qm next to a .ts is used when present (lrelease is not
+part of the PyQt5 wheels, so the .ts is read directly otherwise).
+
+Switching language swaps the installed QTranslator. Qt then sends a
+LanguageChange event to every widget, and each page built so far resets
+its texts from Retranslatable.changeEvent(); no widget is rebuilt and no
+file is read at switch time.
+"""
+import json
+import os
+import threading
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QCoreApplication, QEvent, QLocale, QObject, QTranslator, pyqtSignal
+
+LANGUAGE_FILE = os.path.join(os.path.dirname(__file__), "language.json")
+TRANSLATIONS_DIR = os.path.join(os.path.dirname(__file__), "translations")
+DEFAULT_LANGUAGE = "en"
+
+# Language code -> its name in that language, as the language selector lists it.
+# English is the source language and has no catalogue.
+LANGUAGES = {"en": "English", "hi": "हिन्दी", "gu": "ગુજરાતી"}
+
+
+class TsTranslator(QTranslator):
+    """A QTranslator over the finished messages of a Qt Linguist .ts file."""
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.messages = {}
+        for context in ElementTree.parse(path).getroot().iter("context"):
+            name = context.findtext("name")
+            for message in context.iter("message"):
+                translation = message.find("translation")
+                if translation is None or translation.get("type") or not translation.text:
+                    continue  # unfinished, obsolete or vanished
+                self.messages[(name, message.findtext("source"))] = translation.text
+
+    def translate(self, context, source, disambiguation=None, n=-1):
+        # None tells Qt to try the next translator, then fall back to the source
+        return self.messages.get((context, source))
+
+    def isEmpty(self):
+        return not self.messages
+
+
+def load_translator(language, directory=TRANSLATIONS_DIR):
+    """The translator for a language code, or None for English or when it
+    has no catalogue in `directory`."""
+    if language == DEFAULT_LANGUAGE:
+        return None
+    translator = QTranslator()
+    if translator.load(f"{language}.qm", directory):
+        return translator
+    path = os.path.join(directory, f"{language}.ts")
+    if os.path.exists(path):
+        return TsTranslator(path)
+    return None
+
+
+class LanguageService(QObject):
+    """Holds the interface language and installs its translator.
+
+    The language file is read once at start-up and written on a background
+    thread when the language changes. The translator of every language is
+    loaded once, when the service is created, so a switch only swaps the
+    installed translator. languageChanged is emitted once per change.
+    """
+
+    languageChanged = pyqtSignal(str)
+
+    def __init__(self, path=LANGUAGE_FILE, directory=TRANSLATIONS_DIR, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._language = self._read()
+        self._translators = {code: load_translator(code, directory) for code in LANGUAGES}
+        self._installed = None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="language-writer")
+
+    def _read(self):
+        try:
+            with open(self.path, "r") as file:
+                language = json.load(file).get("language", DEFAULT_LANGUAGE)
+        except (OSError, ValueError):
+            return DEFAULT_LANGUAGE
+        return language if language in LANGUAGES else DEFAULT_LANGUAGE
+
+    def _write(self, language):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as file:
+            json.dump({"language": language}, file)
+        os.replace(tmp, self.path)
+
+    def language(self):
+        return self._language
+
+    def locale(self):
+        """The QLocale of the current language, for dates and day names."""
+        return QLocale(self._language)
+
+    def apply(self):
+        """Install the current language's translator (and only that one)."""
+        app = QCoreApplication.instance()
+        translator = self._translators[self._language]
+        if app is None or translator is self._installed:
+            return
+        # Each call posts LanguageChange to the windows; the posts are
+        # compressed, so pages retranslate once per switch
+        if translator is not None:
+            app.installTranslator(translator)
+        if self._installed is not None:
+            app.removeTranslator(self._installed)
+        self._installed = translator
+
+    def set_language(self, language):
+        if language not in LANGUAGES:
+            raise ValueError(f"unknown language {language!r}")
+        if language == self._language:
+            return
+        self._language = language
+        self.apply()
+        self._writer.submit(self._write, language)
+        self.languageChanged.emit(language)
+
+    def flush(self):
+        """Wait for pending writes of the language file."""
+        self._writer.submit(lambda: None).result()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_language_service():
+    """Return the process-wide LanguageService, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = LanguageService()
+        return _service
+
+
+class Retranslatable:
+    """Mixin for widgets that set their texts in retranslateUi().
+
+    A page calls retranslateUi() once at the end of building itself, and
+    again on every LanguageChange, so a language switch resets texts in
+    place without rebuilding the page.
+    """
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.LanguageChange:
+            self.retranslateUi()
+        super().changeEvent(event)
+
+    def retranslateUi(self):
+        raise NotImplementedError
+
+
+def set_form_labels(form, labels):
+    """Set the row labels of a QFormLayout from (field, text) pairs."""
+    for field, text in labels:
+        form.labelForField(field).setText(text)
@@ -0,0 +1,323 @@
+"""Bulk import of clients, employees, products or expenses from CSV or Excel.
+
+    python importer.py KIND FILE [path/to/embroidery.db]
+
+KIND is clients, employees, products or expenses. The first row of FILE
+names the columns (e.g. name, contact, address; any order, other columns
+are ignored). Products may also have gst_rate (a percentage),
+reorder_point and supplier_id. Rows are read, validated with the rules of the add forms and
+inserted a chunk at a time, one transaction per chunk. Rows that fail are
+written with the reason to FILE.rejects.csv. Excel files need openpyxl.
+"""
+import argparse
+import csv
+import io
+import itertools
+import os
+import re
+import time
+from datetime import date
+
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QFileDialog
+
+from background import BackgroundJob, run_with_progress
+from db import Database, get_db
+from pricing import to_gst_rate, to_paise
+
+# Rows validated and inserted per transaction: big enough that commits cost
+# nothing next to the inserts, small enough that progress moves steadily.
+IMPORT_CHUNK_ROWS = 5000
+
+# Contact numbers accepted for clients: an optional + and 10 to 15 digits.
+CONTACT_RE = re.compile(r'^\+?\d{10,15}$')
+
+
+class ImportFileError(Exception):
+    """The file cannot be imported at all; the message is for the user."""
+
+
+def _number(value, field, convert):
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValueError(f"{field} must be a number") from None
+
+
+def _check_client(values):
+    if not CONTACT_RE.match(values[1]):
+        raise ValueError("Invalid contact number")
+    return values
+
+
+def _check_employee(values):
+    return values
+
+
+def _check_product(values):
+    description, embroidery_type, price, stock, gst_rate, reorder_point, supplier_id = values
+    stock = _number(stock, "Stock", int)
+    if stock < 0:
+        raise ValueError("Stock cannot be negative")
+    try:
+        gst_rate = to_gst_rate(gst_rate) if gst_rate else None
+    except ValueError:
+        raise ValueError("GST rate must be a percentage from 0 to 100") from None
+    if reorder_point:
+        reorder_point = _number(reorder_point, "Reorder point", int)
+        if reorder_point < 0:
+            raise ValueError("Reorder point cannot be negative")
+    return (description, embroidery_type, _number(price, "Price", to_paise), stock, gst_rate,
+            reorder_point if reorder_point != "" else None, supplier_id or None)
+
+
+def _check_expense(values):
+    description, amount, day = values
+    try:
+        day = date.fromisoformat(day).isoformat()
+    except ValueError:
+        raise ValueError("Date must be YYYY-MM-DD") from None
+    return (description, _number(amount, "Amount", to_paise), day)
+
+
+# kind: (columns in repository order, row check, index of a column that
+# must be unique or None, optional columns, {index of a column: kind whose
+# key it must name}). Optional columns may be missing or blank; the others
+# are required. A check returns the values to insert or raises ValueError
+# with the reason.
+IMPORT_KINDS = {
+    "clients": (("name", "contact", "address"), _check_client, 1, (), {}),
+    "employees": (("name", "contact", "role"), _check_employee, None, (), {}),
+    "products": (("description", "embroidery_type", "price", "stock", "gst_rate", "reorder_point",
+                  "supplier_id"),
+                 _check_product, None, ("gst_rate", "reorder_point", "supplier_id"), {6: "suppliers"}),
+    "expenses": (("description", "amount", "date"), _check_expense, None, (), {}),
+}
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))  # a phone number typed into a number cell
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def _read_csv(path):
+    size = os.path.getsize(path) or 1
+    with open(path, "rb") as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        for row in csv.reader(text):
+            yield raw.tell() / size, row
+
+
+def _read_excel(path):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFileError("Reading Excel files needs openpyxl; "
+                              "install it or save the sheet as CSV") from None
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        total = sheet.max_row or 1
+        for number, row in enumerate(sheet.iter_rows(values_only=True), 1):
+            yield min(number / total, 1.0), [_cell(value) for value in row]
+    finally:
+        workbook.close()
+
+
+def read_rows(path):
+    """Yield (fraction of the file read, list of cell strings), header first.
+
+    Reads one row at a time, so memory does not grow with the file.
+    """
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        return _read_excel(path)
+    return _read_csv(path)
+
+
+def _column_positions(header, columns, optional):
+    """The position of each column in `header`; None for a missing optional one."""
+    names = [re.sub(r"[^a-z0-9]+", "_", cell.lower()).strip("_") for cell in header]
+    missing = [column for column in columns if column not in names and column not in optional]
+    if missing:
+        raise ImportFileError(f"Missing column(s): {', '.join(missing)}")
+    return [names.index(column) if column in names else None for column in columns]
+
+
+class _Rejects:
+    """FILE.rejects.csv: each rejected row with its row number and reason.
+
+    Created on the first reject; a file left by an earlier import of the
+    same FILE is removed if this one has none.
+    """
+
+    def __init__(self, path, header):
+        self.path = os.path.splitext(path)[0] + ".rejects.csv"
+        self.header = header
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, number, reason, row):
+        if self._writer is None:
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(["row", "error", *self.header])
+        self._writer.writerow([number, reason, *row])
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def import_file(db, kind, path, progress=None, cancelled=None):
+    """Import FILE into the `kind` table; returns (imported, rejected, rejects path or None).
+
+    progress(fraction read, imported, rejected) is called after every chunk.
+    Once cancelled() returns true the import stops before the next chunk;
+    chunks already committed stay imported.
+    """
+    if kind not in IMPORT_KINDS:
+        raise ImportFileError(f"Cannot import {kind}; choose one of {', '.join(IMPORT_KINDS)}")
+    columns, check, unique, optional, references = IMPORT_KINDS[kind]
+    repository = getattr(db, kind)
+    reader = read_rows(path)
+    rows = enumerate(reader, 1)
+    rejects = None
+    try:
+        try:
+            _, (_, header) = next(rows)
+        except StopIteration:
+            raise ImportFileError("The file is empty") from None
+        positions = _column_positions(header, columns, optional)
+        rejects = _Rejects(path, header)
+        seen = set()
+        imported = 0
+        while not (cancelled and cancelled()):
+            chunk = list(itertools.islice(rows, IMPORT_CHUNK_ROWS))
+            if not chunk:
+                break
+            valid = []
+            for number, (fraction, row) in chunk:
+                if not any(cell.strip() for cell in row):
+                    continue  # blank line
+                values = tuple(row[i].strip() if i is not None and i < len(row) else "" for i in positions)
+                missing = [column for column, value in zip(columns, values)
+                           if not value and column not in optional]
+                try:
+                    if missing:
+                        raise ValueError(f"Missing {', '.join(missing)}")
+                    valid.append((number, row, check(values)))
+                except ValueError as e:
+                    rejects.write(number, str(e), row)
+            for index, target in references.items():
+                target = getattr(db, target)
+                known = target.existing(target.key, [v[index] for _, _, v in valid if v[index] is not None])
+                kept = []
+                for number, row, values in valid:
+                    if values[index] is not None and values[index] not in known:
+                        rejects.write(number, f"Unknown {columns[index]}", row)
+                    else:
+                        kept.append((number, row, values))
+                valid = kept
+            if unique is not None:
+                existing = repository.existing(columns[unique], [v[unique] for _, _, v in valid])
+                kept = []
+                for number, row, values in valid:
+                    if values[unique] in existing or values[unique] in seen:
+                        rejects.write(number, f"{columns[unique].capitalize()} already exists", row)
+                    else:
+                        seen.add(values[unique])
+                        kept.append((number, row, values))
+                valid = kept
+            repository.insert_many(values for _, _, values in valid)
+            imported += len(valid)
+            if progress:
+                progress(fraction, imported, rejects.count)
+    except UnicodeDecodeError:
+        raise ImportFileError("The file is not UTF-8 text; save it as CSV UTF-8") from None
+    except OSError as e:
+        raise ImportFileError(str(e)) from None
+    finally:
+        reader.close()
+        if rejects is not None:
+            rejects.close()
+    return imported, rejects.count, rejects.path if rejects.count else None
+
+
+class Importer(BackgroundJob):
+    """Runs import_file() in the background.
+
+    progress carries (percent of the file read, imported, rejected) after
+    every chunk; the import then ends with finished (imported, rejected,
+    rejects file or "") or failed (message for the user). Cancelling stops
+    after the chunk being inserted; earlier chunks stay imported.
+    """
+
+    progress = pyqtSignal(int, int, int)
+    finished = pyqtSignal(int, int, str)
+    errors = (ImportFileError,)
+
+    def work(self, kind, path):
+        imported, rejected, rejects_path = import_file(
+            self.db, kind, path, self._progress, self.cancelled)
+        return imported, rejected, rejects_path or ""
+
+    def _progress(self, fraction, imported, rejected):
+        self.progress.emit(int(fraction * 100), imported, rejected)
+
+
+def import_from_file(parent, kind):
+    """Ask for a CSV or Excel file and import it into `kind`, showing progress.
+
+    Returns at once; the import runs in the background and the pages'
+    tables pick up the new rows through the data layer's notifications.
+    """
+    path, _ = QFileDialog.getOpenFileName(
+        parent, f"Import {kind}", "", "CSV or Excel (*.csv *.xlsx *.xlsm);;All files (*)")
+    if not path:
+        return
+
+    def describe(percent, imported, rejected):
+        return percent, f"Importing {kind}… {imported} imported, {rejected} rejected"
+
+    def result(imported, rejected, rejects_path):
+        message = f"{imported} {kind} imported."
+        if rejected:
+            message += f"\n{rejected} row(s) rejected; see {rejects_path}"
+        return message
+
+    run_with_progress(parent, Importer(), "Import", f"Importing {kind}…", describe, result, kind, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=list(IMPORT_KINDS))
+    parser.add_argument("file")
+    parser.add_argument("db", nargs="?")
+    args = parser.parse_args()
+
+    database = Database(args.db) if args.db else get_db()
+    start = time.perf_counter()
+    try:
+        imported, rejected, rejects_path = import_file(
+            database, args.kind, args.file,
+            lambda fraction, done, _: print(f"\r{fraction:6.1%}  {done} imported", end="", flush=True))
+    except ImportFileError as e:
+        parser.exit(1, f"{e}\n")
+    finally:
+        database.close()
+    print(f"\n{imported} {args.kind} imported in {time.perf_counter() - start:.1f} s")
+    if rejected:
+        print(f"{rejected} row(s) rejected; see {rejects_path}")
+
+
+if __name__ == "__main__":
+    main()
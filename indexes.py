@@ -0,0 +1,99 @@
+"""EXPLAIN QUERY PLAN diagnostics for the lookups the UI performs.
+
+The indexes themselves are created by migration 4 (see migrations.py).
+Run directly to print the plan of every hot query and flag any table scan:
+
+    python indexes.py [path/to/embroidery.db]
+"""
+import sys
+
+from db import Database, get_db
+
+# (label, sql, sample parameters) for every lookup a click can trigger.
+# The search box goes through the clients_fts full-text index instead of a
+# b-tree, so it is benchmarked separately (benchmarks/bench_search.py).
+HOT_QUERIES = [
+    ("login", "SELECT id, password FROM users WHERE username = ?", ("admin",)),
+    ("register duplicate check", "SELECT 1 FROM users WHERE username = ?", ("admin",)),
+    ("client by id", "SELECT id, name, contact, address FROM clients WHERE id = ?", ("x",)),
+    ("client duplicate contact", "SELECT 1 FROM clients WHERE contact = ?", ("9999999999",)),
+    ("client duplicate contact on update",
+     "SELECT 1 FROM clients WHERE contact = ? AND id != ?", ("9999999999", "x")),
+    ("employee by id", "SELECT id, name, contact, role FROM employees WHERE id = ?", ("x",)),
+    ("product by id",
+     "SELECT design_id, description, embroidery_type, price, stock FROM products WHERE design_id = ?",
+     ("x",)),
+    ("products of supplier", "SELECT design_id FROM products WHERE supplier_id = ?", ("x",)),
+    ("expense by id", "SELECT id, description, amount, date FROM expenses WHERE id = ?", ("x",)),
+    ("orders of client", "SELECT order_id FROM orders WHERE client_id = ?", ("x",)),
+    ("orders of product", "SELECT order_id FROM orders WHERE product_id = ?", ("x",)),
+    ("purchase orders of supplier",
+     "SELECT po_id FROM purchase_orders WHERE supplier_id = ?", ("x",)),
+    ("purchase orders of product",
+     "SELECT po_id FROM purchase_orders WHERE product_id = ?", ("x",)),
+    ("stock movements of product",
+     "SELECT transaction_id FROM stock_transactions WHERE product_id = ?", ("x",)),
+    ("stock balance of product",
+     "SELECT SUM(quantity) FROM stock_transactions WHERE product_id = ?", ("x",)),
+    ("open purchase order of product",
+     "SELECT po_id FROM purchase_orders WHERE product_id = ? AND status IN ('Draft', 'Approved')",
+     ("x",)),
+    ("open purchase orders of supplier",
+     "SELECT po_id FROM purchase_orders WHERE supplier_id = ? AND status IN ('Draft', 'Approved') "
+     "AND (order_date, po_id) > (?, ?) ORDER BY order_date, po_id LIMIT 50",
+     ("x", "", "")),
+    ("expenses in date range",
+     "SELECT * FROM expenses WHERE date BETWEEN ? AND ? ORDER BY date", ("2026-04-01", "2027-03-31")),
+    ("orders in date range",
+     "SELECT * FROM orders WHERE order_date BETWEEN ? AND ? ORDER BY order_date",
+     ("2026-04-01", "2027-03-31")),
+    ("clients by name, next block",
+     "SELECT rowid, id, name, contact, address FROM clients WHERE 1 AND (name, rowid) > (?, ?) "
+     "ORDER BY name ASC, rowid ASC LIMIT ?", ("m", 0, 256)),
+    ("employees with role, next block",
+     "SELECT rowid, id, name, contact, role FROM employees WHERE role = ? AND rowid > ? "
+     "ORDER BY rowid LIMIT ?", ("Tailor", 0, 256)),
+    ("products by price descending, next block",
+     "SELECT rowid, design_id, description, embroidery_type, price, stock FROM products "
+     "WHERE 1 AND (price, rowid) < (?, ?) ORDER BY price DESC, rowid DESC LIMIT ?", (100, 0, 256)),
+    ("party balance before date",
+     "SELECT balance FROM party_ledger WHERE client_id = ? AND date < ? "
+     "ORDER BY date DESC, rowid DESC LIMIT 1", ("x", "2026-04-01")),
+    ("party statement",
+     "SELECT entry_id, client_id, order_id, kind, date, amount, balance FROM party_ledger "
+     "WHERE client_id = ? AND date BETWEEN ? AND ? ORDER BY date, rowid", ("x", "2026-04-01", "9999")),
+    ("parties owing", "SELECT id, balance FROM clients WHERE balance > 0", ()),
+    ("month to date",
+     "SELECT SUM(total) FROM summary_daily WHERE ledger = ? AND day BETWEEN ? AND ?",
+     ("expenses", "2026-10-01", "2026-10-18")),
+    ("year over year",
+     "SELECT month, total FROM summary_monthly WHERE ledger = ? AND month IN (?, ?)",
+     ("expenses", "2026-10", "2025-10")),
+]
+
+
+def explain(db, sql, params=()):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    return [row[3] for row in db.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def table_scans(db, queries=HOT_QUERIES):
+    """Return [(label, detail), ...] for every hot query whose plan scans a table."""
+    scans = []
+    for label, sql, params in queries:
+        for detail in explain(db, sql, params):
+            if detail.startswith("SCAN"):
+                scans.append((label, detail))
+    return scans
+
+
+if __name__ == "__main__":
+    database = Database(sys.argv[1]) if len(sys.argv) > 1 else get_db()
+    for label, sql, params in HOT_QUERIES:
+        print(f"{label}:")
+        for detail in explain(database, sql, params):
+            print(f"    {detail}")
+    scans = table_scans(database)
+    print(f"{len(scans)} hot quer{'y scans' if len(scans) == 1 else 'ies scan'} a table")
+    database.close()
+    sys.exit(1 if scans else 0)
@@ -0,0 +1,374 @@
+"""Invoices (challans) as PDF, one per client per day, rendered locally.
+
+    python invoice.py DAY DIRECTORY [--workers N] [path/to/embroidery.db]
+
+Writes the invoice of every client with orders on DAY (YYYY-MM-DD) to
+DIRECTORY as invoice-NUMBER.pdf. An invoice lists the client's orders of
+the day with their GST, as priced when they were placed (see pricing.py).
+
+Pages are laid out by Qt (QTextDocument printed to a QPdfWriter), which
+shapes Gujarati and Devanagari text; the fonts used are embedded in the
+PDF. Fonts in the fonts/ directory next to this file (e.g. Noto Sans
+Gujarati) are loaded first, so party names render even where the system
+has no font for their script. The company header comes from company.json
+next to this file: {"name": ..., "address": ..., "phone": ..., "gstin": ...}.
+
+A day's invoices are rendered in a pool of worker processes; each worker
+parses the template, loads the fonts and builds the header once and keeps
+them for every invoice it renders.
+"""
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import sqlite3
+import string
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import date
+from functools import lru_cache
+
+from PyQt5.QtCore import QMarginsF, pyqtSignal
+from PyQt5.QtGui import QFontDatabase, QGuiApplication, QPageLayout, QPageSize, QPdfWriter, QTextDocument
+from PyQt5.QtWidgets import QFileDialog, QMessageBox
+
+from background import BackgroundJob, run_with_progress
+from db import Database, get_db
+from pricing import invoice_totals, rupees
+
+COMPANY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "company.json")
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+
+# Tried in order for Latin text, then for the party names' scripts; the
+# first family installed (or in fonts/) for each writing system is used.
+LATIN_FONTS = ("Noto Sans", "Arial", "DejaVu Sans")
+SCRIPT_FONTS = {
+    QFontDatabase.Gujarati: ("Noto Sans Gujarati", "Shruti", "Lohit Gujarati", "Nirmala UI"),
+    QFontDatabase.Devanagari: ("Noto Sans Devanagari", "Mangal", "Lohit Devanagari", "Nirmala UI"),
+}
+
+# Invoices handed to a worker process at a time.
+INVOICE_CHUNK = 25
+
+# A worker process's QGuiApplication, kept for the life of the process
+_app = None
+
+STYLE = """
+body { font-size: 10pt; }
+h1 { font-size: 16pt; margin: 0; }
+h2 { font-size: 12pt; margin: 0; }
+table.lines { border-collapse: collapse; }
+table.lines th { background-color: #eeeeee; border: 1px solid #999999; padding: 3px; }
+table.lines td { border: 1px solid #999999; padding: 3px; }
+td.number, th.number { text-align: right; }
+.muted { color: #555555; }
+"""
+
+TEMPLATE = string.Template("""<html><body style="font-family: $fonts;">
+$header
+<table width="100%"><tr>
+<td><h2>Tax Invoice</h2><span class="muted">No. $number &middot; $date</span></td>
+<td align="right"><b>$client_name</b><br>$client_address<br>$client_contact</td>
+</tr></table>
+<br>
+<table class="lines" width="100%">
+<tr><th>#</th><th>Design</th><th>Description</th><th class="number">Qty</th>
+<th class="number">Rate (&#8377;)</th><th class="number">Taxable (&#8377;)</th>
+<th class="number">GST %</th><th class="number">GST (&#8377;)</th><th class="number">Amount (&#8377;)</th></tr>
+$lines
+<tr><td colspan="5"><b>Total</b></td><td class="number"><b>$net</b></td><td></td>
+<td class="number"><b>$gst</b></td><td class="number"><b>$total</b></td></tr>
+</table>
+<p class="muted">CGST &#8377;$cgst &middot; SGST &#8377;$sgst</p>
+</body></html>""")
+
+LINE = string.Template(
+    "<tr><td>$n</td><td>$design</td><td>$description</td><td class=\"number\">$quantity</td>"
+    "<td class=\"number\">$rate</td><td class=\"number\">$net</td><td class=\"number\">$gst_rate</td>"
+    "<td class=\"number\">$gst</td><td class=\"number\">$total</td></tr>")
+
+DAY_SQL = ("SELECT o.rowid, o.client_id, c.name, c.contact, c.address, o.product_id, p.description, "
+           "p.gst_rate, o.quantity, o.total_cost, o.gst FROM orders o "
+           "LEFT JOIN clients c ON c.id = o.client_id LEFT JOIN products p ON p.design_id = o.product_id "
+           "WHERE o.order_date = ? {} ORDER BY o.client_id, o.rowid")
+
+
+class InvoiceError(Exception):
+    """An invoice cannot be made or written; the message is for the user."""
+
+
+def invoices_for_day(db, day, client_id=None):
+    """[invoice dict] for every client (or just `client_id`) with orders on day.
+
+    An invoice is {"number", "date", "client": (name, contact, address),
+    "lines": [(design, description, quantity, gst rate, net, gst, total)],
+    "net", "gst", "total"}, money in paise. All of the day's orders are
+    read with one query off the order_date index.
+    """
+    try:
+        date.fromisoformat(day)
+    except ValueError:
+        raise InvoiceError("Date must be YYYY-MM-DD") from None
+    if client_id is None:
+        rows = db.execute(DAY_SQL.format(""), (day,)).fetchall()
+    else:
+        rows = db.execute(DAY_SQL.format("AND o.client_id = ?"), (day, client_id)).fetchall()
+    invoices = {}
+    for rowid, client, name, contact, address, design, description, rate, quantity, total, gst in rows:
+        invoice = invoices.get(client)
+        if invoice is None:
+            # Numbered by the day and the client's first order of the day
+            invoice = invoices[client] = {
+                "number": f"{day.replace('-', '')}-{rowid}", "date": day,
+                "client": (name or "", contact or "", address or ""), "lines": []}
+        total, gst = int(total or 0), int(gst or 0)
+        invoice["lines"].append((design, description or "", quantity, rate or 0, total - gst, gst, total))
+    clients = [client for client, invoice in invoices.items() for _ in invoice["lines"]]
+    lines = [line for invoice in invoices.values() for line in invoice["lines"]]
+    totals = invoice_totals(clients, [line[4] for line in lines], [line[5] for line in lines])
+    for client, invoice in invoices.items():
+        invoice["net"], invoice["gst"], invoice["total"] = totals[client]
+    return list(invoices.values())
+
+
+@lru_cache(maxsize=None)
+def company():
+    """The company details from company.json, read once."""
+    try:
+        with open(COMPANY_FILE, encoding="utf-8") as file:
+            details = json.load(file)
+    except (OSError, ValueError):
+        details = {}
+    return {key: str(details.get(key) or "") for key in ("name", "address", "phone", "gstin")}
+
+
+@lru_cache(maxsize=None)
+def header_html():
+    """The company header, built once."""
+    details = company()
+    parts = [f"<h1>{html.escape(details['name'])}</h1>" if details["name"] else ""]
+    for label, key in (("", "address"), ("Phone ", "phone"), ("GSTIN ", "gstin")):
+        if details[key]:
+            parts.append(f"<div class=\"muted\">{label}{html.escape(details[key])}</div>")
+    return "\n".join(parts) + "<hr>"
+
+
+@lru_cache(maxsize=None)
+def font_families():
+    """The CSS font-family list for invoices, worked out once per process.
+
+    Loads the fonts in fonts/ and picks one installed family each for
+    Latin, Gujarati and Devanagari text. Needs a QGuiApplication.
+    """
+    if os.path.isdir(FONTS_DIR):
+        for name in sorted(os.listdir(FONTS_DIR)):
+            if name.lower().endswith((".ttf", ".otf")):
+                QFontDatabase.addApplicationFont(os.path.join(FONTS_DIR, name))
+    fonts = QFontDatabase()
+    installed = set(fonts.families())
+    families = [family for family in LATIN_FONTS if family in installed][:1]
+    for system, preferred in SCRIPT_FONTS.items():
+        supported = set(fonts.families(system))
+        chosen = next((family for family in preferred if family in supported), None)
+        if chosen is None and supported:
+            chosen = sorted(supported)[0]
+        if chosen and chosen not in families:
+            families.append(chosen)
+    return ", ".join(f"'{family}'" for family in families) + ", sans-serif"
+
+
+def invoice_html(invoice):
+    """The invoice laid out with the cached template and header."""
+    name, contact, address = invoice["client"]
+    lines = "\n".join(LINE.substitute(
+        n=n, design=html.escape(design or ""), description=html.escape(description),
+        quantity=quantity, rate=rupees(net // quantity if quantity else 0), net=rupees(net),
+        gst_rate=f"{rate:g}", gst=rupees(gst), total=rupees(total))
+        for n, (design, description, quantity, rate, net, gst, total) in enumerate(invoice["lines"], 1))
+    # Intra-state supply: GST is half central, half state tax, the odd paisa to CGST
+    sgst = invoice["gst"] // 2
+    return TEMPLATE.substitute(
+        fonts=font_families(), header=header_html(), number=invoice["number"], date=invoice["date"],
+        client_name=html.escape(name), client_address=html.escape(address),
+        client_contact=html.escape(contact), lines=lines, net=rupees(invoice["net"]),
+        gst=rupees(invoice["gst"]), total=rupees(invoice["total"]),
+        cgst=rupees(invoice["gst"] - sgst), sgst=rupees(sgst))
+
+
+@lru_cache(maxsize=None)
+def _document():
+    # One document per process, reused for every invoice so the stylesheet
+    # is parsed once; render from one thread per process.
+    document = QTextDocument()
+    document.setDefaultStyleSheet(STYLE)
+    document.setDocumentMargin(0)
+    return document
+
+
+def invoice_path(directory, invoice):
+    return os.path.join(directory, f"invoice-{invoice['number']}.pdf")
+
+
+def write_pdf(invoice, path):
+    """Render one invoice to an A4 PDF at `path`. Needs a QGuiApplication."""
+    document = _document()
+    document.setHtml(invoice_html(invoice))
+    tmp = f"{path}.{os.getpid()}.tmp"
+    writer = QPdfWriter(tmp)
+    writer.setTitle(f"Invoice {invoice['number']}")
+    writer.setCreator("Embroidery")
+    writer.setPageSize(QPageSize(QPageSize.A4))
+    writer.setPageMargins(QMarginsF(12, 12, 12, 12), QPageLayout.Millimeter)
+    document.print_(writer)
+    del writer  # closes the file
+    try:
+        os.replace(tmp, path)
+    except OSError as e:
+        raise InvoiceError(str(e)) from None
+    return path
+
+
+def _start_worker():
+    # Worker processes draw no windows
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    global _app
+    _app = QGuiApplication.instance() or QGuiApplication([sys.argv[0]])
+    font_families()
+    header_html()
+
+
+def _write_chunk(invoices, directory):
+    return [write_pdf(invoice, invoice_path(directory, invoice)) for invoice in invoices]
+
+
+def write_invoices(invoices, directory, workers=None, progress=None, cancelled=None):
+    """Write every invoice to DIRECTORY in a pool of worker processes;
+    returns the paths written, or None if cancelled.
+
+    progress(invoices written, invoices) is called as chunks finish. Once
+    cancelled() returns true no further chunk is started; invoices already
+    written stay.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        raise InvoiceError(str(e)) from None
+    chunks = [invoices[i:i + INVOICE_CHUNK] for i in range(0, len(invoices), INVOICE_CHUNK)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(chunks) or 1))
+    written = []
+    # spawn: a forked copy of a process running Qt is not safe to use
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_start_worker) as pool:
+        pending = {pool.submit(_write_chunk, chunk, directory) for chunk in chunks}
+        try:
+            while pending:
+                if cancelled and cancelled():
+                    pool.shutdown(cancel_futures=True)
+                    return None
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    written.extend(future.result())
+                if done and progress:
+                    progress(len(written), len(invoices))
+        except InvoiceError:
+            pool.shutdown(cancel_futures=True)
+            raise
+    return written
+
+
+class InvoiceBatch(BackgroundJob):
+    """Writes a day's invoices in the background.
+
+    progress carries (invoices written, invoices) as workers finish; the
+    batch then ends with finished (invoices written, or -1 if cancelled)
+    or failed (message for the user). Cancelling starts no further
+    invoices; those written stay.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(int)
+    errors = (InvoiceError,)
+
+    def work(self, day, directory):
+        invoices = invoices_for_day(self.db, day)
+        try:
+            written = write_invoices(invoices, directory, progress=self.progress.emit,
+                                     cancelled=self.cancelled)
+        except (InvoiceError, sqlite3.Error):
+            raise
+        except Exception as e:  # a worker process failed
+            raise InvoiceError(f"Invoices could not be written: {e}") from e
+        return (-1 if written is None else len(written),)
+
+
+def save_invoice(parent, order):
+    """Ask for a file and write the invoice holding `order` (its client's
+    orders of that day) to it. Renders on the GUI thread; one invoice
+    takes a few milliseconds."""
+    db = get_db()
+    row = db.execute("SELECT client_id, order_date FROM orders WHERE order_id = ?", (order,)).fetchone()
+    if row is None:
+        return
+    try:
+        invoices = invoices_for_day(db, row[1] or "", row[0])
+    except InvoiceError as e:
+        QMessageBox.warning(parent, "Invoice", str(e))
+        return
+    invoice = invoices[0]
+    path, _ = QFileDialog.getSaveFileName(
+        parent, "Save Invoice", f"invoice-{invoice['number']}.pdf", "PDF (*.pdf)")
+    if not path:
+        return
+    if not path.lower().endswith(".pdf"):
+        path += ".pdf"
+    try:
+        write_pdf(invoice, path)
+    except InvoiceError as e:
+        QMessageBox.warning(parent, "Invoice", str(e))
+        return
+    QMessageBox.information(parent, "Invoice", f"Invoice {invoice['number']} saved to {path}")
+
+
+def save_day_invoices(parent, day):
+    """Ask for a folder and write every invoice of `day` to it in the
+    background, showing progress."""
+    directory = QFileDialog.getExistingDirectory(parent, f"Invoices of {day}")
+    if not directory:
+        return
+
+    def describe(written, total):
+        return written * 100 // total if total else 100, f"Writing invoices of {day}… {written} of {total}"
+
+    def result(written):
+        return f"{written} invoice(s) written to {directory}" if written >= 0 else None
+
+    run_with_progress(parent, InvoiceBatch(), "Invoices", f"Writing invoices of {day}…", describe, result,
+                      day, directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("day")
+    parser.add_argument("directory")
+    parser.add_argument("db", nargs="?")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    database = Database(args.db) if args.db else get_db()
+    start = time.perf_counter()
+    try:
+        invoices = invoices_for_day(database, args.day)
+        written = write_invoices(invoices, args.directory, args.workers)
+    except InvoiceError as e:
+        parser.exit(1, f"{e}\n")
+    finally:
+        database.close()
+    elapsed = time.perf_counter() - start
+    print(f"{len(written)} invoice(s) written to {args.directory} in {elapsed:.1f} s "
+          f"({len(written) / elapsed if elapsed else 0:.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+class LoadOnShow:
+    """Mixin for pages that read their data the first time they are shown.
+
+    Building a page is then cheap, and a page that is never opened never
+    queries the database. Subclasses implement load_data().
+    """
+
+    _data_loaded = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._data_loaded:
+            self._data_loaded = True
+            self.load_data()
+
+    def load_data(self):
+        raise NotImplementedError
@@ -0,0 +1,499 @@
+"""Versioned schema migrations for embroidery.db.
+
+Each step runs in its own transaction and is recorded in schema_version with
+the time it took. Steps only ever add to the schema (new tables, ADD COLUMN,
+new indexes and triggers), drop an index a newer one supersedes or rewrite
+values in place, which SQLite does without copying, so migrating a large
+database never rebuilds a table.
+
+Run directly to migrate a file and print the timings:
+
+    python migrations.py [path/to/embroidery.db]
+"""
+import logging
+import sys
+import time
+import uuid
+from datetime import date, datetime
+
+from db import Database, get_db
+
+log = logging.getLogger(__name__)
+
+
+class MigrationError(Exception):
+    pass
+
+
+def table_columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def add_columns(conn, table, columns):
+    """ALTER TABLE ADD COLUMN for each (name, type) the table does not have yet."""
+    existing = table_columns(conn, table)
+    for name, column_type in columns:
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+
+
+def initial_schema(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS users
+                 (id TEXT PRIMARY KEY, username TEXT UNIQUE, password TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS employees
+                 (id TEXT PRIMARY KEY, name TEXT, contact TEXT, role TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS clients
+                 (id TEXT PRIMARY KEY, name TEXT, contact TEXT, address TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS suppliers
+                 (supplier_id TEXT PRIMARY KEY, name TEXT, contact TEXT, address TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS products
+                 (design_id TEXT PRIMARY KEY, description TEXT, embroidery_type TEXT,
+                  price REAL, stock INTEGER)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS orders
+                 (order_id TEXT PRIMARY KEY, client_id TEXT, product_id TEXT,
+                  quantity INTEGER, status TEXT, order_date TEXT, total_cost REAL)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS purchase_orders
+                 (po_id TEXT PRIMARY KEY, supplier_id TEXT, product_id TEXT,
+                  quantity INTEGER, order_date TEXT, status TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS stock_transactions
+                 (transaction_id TEXT PRIMARY KEY, product_id TEXT, quantity INTEGER,
+                  type TEXT, date TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS expenses
+                 (id TEXT PRIMARY KEY, description TEXT, amount REAL, date TEXT)''')
+
+
+def product_details(conn):
+    add_columns(conn, "products", [
+        ("thread_color", "TEXT"),
+        ("supplier_id", "TEXT"),
+        ("reorder_point", "INTEGER"),
+        ("category", "TEXT"),
+        ("gst_rate", "REAL"),
+    ])
+
+
+def client_details(conn):
+    add_columns(conn, "clients", [
+        ("email", "TEXT"),
+        ("notes", "TEXT"),
+    ])
+
+
+def lookup_indexes(conn):
+    # Clients used to be added without checking the contact, so one number
+    # can belong to several. The first client keeps it; each later one gets
+    # it with a "-dup<n>" suffix, which the Party page rejects as a contact
+    # until the client is given its own number. Nothing is merged.
+    taken = {contact for (contact,) in conn.execute("SELECT contact FROM clients")}
+    for rowid, contact, n in conn.execute(
+            "SELECT rowid, contact, n FROM (SELECT rowid, contact, ROW_NUMBER() OVER "
+            "(PARTITION BY contact ORDER BY rowid) AS n FROM clients WHERE contact IS NOT NULL) "
+            "WHERE n > 1").fetchall():
+        renamed = f"{contact}-dup{n}"
+        while renamed in taken:
+            n += 1
+            renamed = f"{contact}-dup{n}"
+        taken.add(renamed)
+        conn.execute("UPDATE clients SET contact = ? WHERE rowid = ?", (renamed, rowid))
+        log.warning("client contact %s is shared; one client's contact is now %s", contact, renamed)
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_clients_contact ON clients (contact)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_supplier ON products (supplier_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_client ON orders (client_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_product ON orders (product_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_purchase_orders_supplier ON purchase_orders (supplier_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_purchase_orders_product ON purchase_orders (product_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_stock_transactions_product ON stock_transactions (product_id)")
+    # A sampled ANALYZE keeps this step fast on a million-row database.
+    conn.execute("PRAGMA analysis_limit = 1000")
+    conn.execute("ANALYZE")
+
+
+def client_search_index(conn):
+    # External-content FTS5 index over clients: the text lives only in clients,
+    # the triggers keep the index in step with every insert, update and delete.
+    conn.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS clients_fts USING fts5(
+                        name, contact, address,
+                        content='clients', content_rowid='rowid',
+                        tokenize='unicode61 remove_diacritics 2', prefix='1 2 3')""")
+    conn.execute("""CREATE TRIGGER IF NOT EXISTS clients_fts_insert AFTER INSERT ON clients BEGIN
+                        INSERT INTO clients_fts (rowid, name, contact, address)
+                        VALUES (new.rowid, new.name, new.contact, new.address);
+                    END""")
+    conn.execute("""CREATE TRIGGER IF NOT EXISTS clients_fts_delete AFTER DELETE ON clients BEGIN
+                        INSERT INTO clients_fts (clients_fts, rowid, name, contact, address)
+                        VALUES ('delete', old.rowid, old.name, old.contact, old.address);
+                    END""")
+    conn.execute("""CREATE TRIGGER IF NOT EXISTS clients_fts_update
+                    AFTER UPDATE OF name, contact, address ON clients BEGIN
+                        INSERT INTO clients_fts (clients_fts, rowid, name, contact, address)
+                        VALUES ('delete', old.rowid, old.name, old.contact, old.address);
+                        INSERT INTO clients_fts (rowid, name, contact, address)
+                        VALUES (new.rowid, new.name, new.contact, new.address);
+                    END""")
+    conn.execute("INSERT INTO clients_fts (clients_fts) VALUES ('rebuild')")
+
+
+# Running totals kept in dashboard_totals, per source table: (name, expression
+# over one row of the table, written with {row} for new/old).
+DASHBOARD_TOTALS = {
+    "expenses": [
+        ("expenses_total", "COALESCE({row}.amount, 0)"),
+    ],
+    "orders": [
+        ("paid_total", "CASE WHEN {row}.status = 'Paid' THEN COALESCE({row}.total_cost, 0) ELSE 0 END"),
+        ("unpaid_total", "CASE WHEN {row}.status IS NOT 'Paid' THEN COALESCE({row}.total_cost, 0) ELSE 0 END"),
+        ("unpaid_orders", "{row}.status IS NOT 'Paid'"),
+    ],
+    "employees": [
+        ("employees", "1"),
+    ],
+}
+
+
+def running_total_triggers(conn, target, table, totals):
+    """Create triggers keeping `target` (name, value) rows equal to
+    SUM(expression) over `table`: insert adds the new row's value, delete
+    subtracts the old row's, update adds the difference."""
+    names = ", ".join(f"'{name}'" for name, _ in totals)
+
+    def update(*terms):
+        cases = " ".join(
+            f"WHEN '{name}' THEN " + " ".join(f"{sign} ({expr.format(row=row)})" for sign, row in terms)
+            for name, expr in totals)
+        return f"UPDATE {target} SET value = value + CASE name {cases} END WHERE name IN ({names});"
+
+    conn.execute(f"""CREATE TRIGGER IF NOT EXISTS {target}_{table}_insert AFTER INSERT ON {table} BEGIN
+                         {update(("+", "new"))}
+                     END""")
+    conn.execute(f"""CREATE TRIGGER IF NOT EXISTS {target}_{table}_delete AFTER DELETE ON {table} BEGIN
+                         {update(("-", "old"))}
+                     END""")
+    if any("{row}" in expr for _, expr in totals):
+        conn.execute(f"""CREATE TRIGGER IF NOT EXISTS {target}_{table}_update AFTER UPDATE ON {table} BEGIN
+                             {update(("+", "new"), ("-", "old"))}
+                         END""")
+    for name, expr in totals:
+        conn.execute(f"INSERT OR REPLACE INTO {target} (name, value) "
+                     f"SELECT ?, COALESCE(SUM({expr.format(row=table)}), 0) FROM {table}", (name,))
+
+
+def dashboard_totals(conn):
+    # One row per dashboard figure, so HomePage reads a handful of rows
+    # instead of summing the ledgers on every refresh.
+    conn.execute('''CREATE TABLE IF NOT EXISTS dashboard_totals
+                 (name TEXT PRIMARY KEY, value REAL NOT NULL DEFAULT 0)''')
+    for table, totals in DASHBOARD_TOTALS.items():
+        running_total_triggers(conn, "dashboard_totals", table, totals)
+
+
+# Ledgers rolled up into summary_daily and summary_monthly:
+# ledger -> (table, date column, amount column).
+SUMMARY_LEDGERS = {
+    "expenses": ("expenses", "date", "amount"),
+    "orders": ("orders", "order_date", "total_cost"),
+    "gst": ("orders", "order_date", "gst"),
+}
+
+# (summary table, period column, expression turning a date into the period)
+SUMMARY_PERIODS = (
+    ("summary_daily", "day", "date({date})"),
+    ("summary_monthly", "month", "strftime('%Y-%m', {date})"),
+)
+
+
+def rebuild_summaries(conn, ledgers=None):
+    """Recompute the summary rows of `ledgers` (default all) from their
+    source tables with one grouped query per period. Rows whose date does
+    not parse as YYYY-MM-DD are left out, as they are by the triggers."""
+    for ledger in ledgers or SUMMARY_LEDGERS:
+        table, date_column, amount_column = SUMMARY_LEDGERS[ledger]
+        for summary, period, expr in SUMMARY_PERIODS:
+            key = expr.format(date=date_column)
+            conn.execute(f"DELETE FROM {summary} WHERE ledger = ?", (ledger,))
+            conn.execute(f"INSERT INTO {summary} (ledger, {period}, total, entries) "
+                         f"SELECT ?, {key}, SUM(COALESCE({amount_column}, 0)), COUNT(*) "
+                         f"FROM {table} WHERE {key} IS NOT NULL GROUP BY {key}", (ledger,))
+
+
+def summary_triggers(conn, ledger, table, date_column, amount_column):
+    def add(row):
+        statements = []
+        for summary, period, expr in SUMMARY_PERIODS:
+            key = expr.format(date=f"{row}.{date_column}")
+            statements.append(
+                f"INSERT INTO {summary} (ledger, {period}, total, entries) "
+                f"SELECT '{ledger}', {key}, COALESCE({row}.{amount_column}, 0), 1 WHERE {key} IS NOT NULL "
+                f"ON CONFLICT (ledger, {period}) DO UPDATE "
+                f"SET total = total + excluded.total, entries = entries + 1;")
+        return "\n".join(statements)
+
+    def remove(row):
+        statements = []
+        for summary, period, expr in SUMMARY_PERIODS:
+            key = expr.format(date=f"{row}.{date_column}")
+            statements.append(
+                f"UPDATE {summary} SET total = total - COALESCE({row}.{amount_column}, 0), "
+                f"entries = entries - 1 WHERE ledger = '{ledger}' AND {period} = {key};")
+            statements.append(
+                f"DELETE FROM {summary} WHERE ledger = '{ledger}' AND {period} = {key} AND entries <= 0;")
+        return "\n".join(statements)
+
+    conn.execute(f"""CREATE TRIGGER IF NOT EXISTS summary_{ledger}_insert AFTER INSERT ON {table} BEGIN
+                         {add("new")}
+                     END""")
+    conn.execute(f"""CREATE TRIGGER IF NOT EXISTS summary_{ledger}_delete AFTER DELETE ON {table} BEGIN
+                         {remove("old")}
+                     END""")
+    conn.execute(f"""CREATE TRIGGER IF NOT EXISTS summary_{ledger}_update
+                     AFTER UPDATE OF {date_column}, {amount_column} ON {table} BEGIN
+                         {remove("old")}
+                         {add("new")}
+                     END""")
+
+
+def summary_tables(conn):
+    # Totals per ledger and day/month. Reports read a few hundred of these
+    # rows instead of scanning the ledgers and parsing their text dates.
+    conn.execute('''CREATE TABLE IF NOT EXISTS summary_daily
+                 (ledger TEXT, day TEXT, total REAL NOT NULL, entries INTEGER NOT NULL,
+                  PRIMARY KEY (ledger, day)) WITHOUT ROWID''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS summary_monthly
+                 (ledger TEXT, month TEXT, total REAL NOT NULL, entries INTEGER NOT NULL,
+                  PRIMARY KEY (ledger, month)) WITHOUT ROWID''')
+    # The ledgers there were when this step shipped; money_in_paise adds gst
+    ledgers = ("expenses", "orders")
+    for ledger in ledgers:
+        summary_triggers(conn, ledger, *SUMMARY_LEDGERS[ledger])
+    rebuild_summaries(conn, ledgers)
+
+
+def stock_ledger(conn):
+    # Covering index for the per-product balance (SUM(quantity) GROUP BY
+    # product_id); it also serves every lookup the product_id index did.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_stock_transactions_balance "
+                 "ON stock_transactions (product_id, quantity)")
+    conn.execute("DROP INDEX IF EXISTS idx_stock_transactions_product")
+    # Stock entered before the ledger existed becomes an opening movement,
+    # so every product's ledger adds up to its current stock.
+    rows = conn.execute(
+        "SELECT p.design_id, p.stock - COALESCE(t.balance, 0) FROM products p "
+        "LEFT JOIN (SELECT product_id, SUM(quantity) AS balance FROM stock_transactions "
+        "GROUP BY product_id) t ON t.product_id = p.design_id "
+        "WHERE COALESCE(p.stock, 0) != COALESCE(t.balance, 0)").fetchall()
+    today = date.today().isoformat()
+    conn.executemany("INSERT INTO stock_transactions (transaction_id, product_id, quantity, type, date) "
+                     "VALUES (?, ?, ?, 'opening', ?)",
+                     [(str(uuid.uuid4()), design_id, quantity, today) for design_id, quantity in rows])
+
+
+def low_stock_index(conn):
+    # Partial index holding only the products at or below their reorder
+    # point, so listing them reads those rows and nothing else.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_low_stock ON products (design_id) "
+                 "WHERE stock <= reorder_point")
+
+
+def open_purchase_order_indexes(conn):
+    # Received orders are the bulk of purchase_orders after a few years;
+    # these partial indexes hold only open ones (see db.OPEN_PO), ordered
+    # for paging a supplier's list by (order_date, po_id).
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_purchase_orders_open_supplier "
+                 "ON purchase_orders (supplier_id, order_date, po_id) "
+                 "WHERE status IN ('Draft', 'Approved')")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_purchase_orders_open_product "
+                 "ON purchase_orders (product_id) WHERE status IN ('Draft', 'Approved')")
+
+
+def date_indexes(conn):
+    # Exports filtered to a date range (see exporter.py) read the range, in
+    # date order, straight off these.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses (date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_orders_order_date ON orders (order_date)")
+
+
+# Columns the list pages sort or filter on. A LazyTableModel sorts only on a
+# column leading an index, reading each block as a range off it.
+LIST_INDEXES = {
+    "clients": ("name",),
+    "employees": ("name", "role"),
+    "products": ("description", "embroidery_type", "price"),
+    "expenses": ("amount",),
+    "orders": ("status",),
+}
+
+
+def list_indexes(conn):
+    for table, columns in LIST_INDEXES.items():
+        for column in columns:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})")
+
+
+# Running totals over clients.balance, the cached Udhar of each party
+# (see db.PartyLedger), kept in dashboard_totals. An advance (a balance
+# below zero) is not Udhar and does not lower what other parties owe.
+PARTY_TOTALS = [
+    ("udhar_total", "MAX(COALESCE({row}.balance, 0), 0)"),
+    ("parties_owing", "COALESCE({row}.balance, 0) > 0"),
+]
+
+
+# Running totals over party_ledger kept in dashboard_totals: money taken
+# against Udhar. Settling an order by marking it Paid is in paid_total.
+LEDGER_TOTALS = [
+    ("payments_total", "CASE WHEN {row}.kind = 'payment' THEN -COALESCE({row}.amount, 0) ELSE 0 END"),
+]
+
+
+def party_balances(conn):
+    """Recompute every party_ledger running balance and clients.balance
+    from the entries' amounts."""
+    conn.execute("UPDATE party_ledger SET balance = r.running FROM "
+                 "(SELECT rowid AS entry, SUM(amount) OVER "
+                 " (PARTITION BY client_id ORDER BY date, rowid) AS running FROM party_ledger) AS r "
+                 "WHERE party_ledger.rowid = r.entry")
+    conn.execute("UPDATE clients SET balance = b.total FROM "
+                 "(SELECT client_id, SUM(amount) AS total FROM party_ledger GROUP BY client_id) AS b "
+                 "WHERE clients.id = b.client_id")
+
+
+def party_ledger(conn):
+    # Udhar per party: every credit sale and payment is an entry carrying the
+    # party's running balance after it (in date, then posting, order), and
+    # clients.balance caches the latest. Unpaid orders open the ledger.
+    conn.execute('''CREATE TABLE IF NOT EXISTS party_ledger
+                 (entry_id TEXT PRIMARY KEY, client_id TEXT NOT NULL, order_id TEXT,
+                  kind TEXT NOT NULL, date TEXT NOT NULL, amount REAL NOT NULL,
+                  balance REAL NOT NULL DEFAULT 0)''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_party_ledger_client_date ON party_ledger (client_id, date)")
+    if "balance" not in table_columns(conn, "clients"):
+        conn.execute("ALTER TABLE clients ADD COLUMN balance REAL NOT NULL DEFAULT 0")
+    if conn.execute("SELECT 1 FROM party_ledger LIMIT 1").fetchone() is None:
+        today = date.today().isoformat()
+        conn.executemany(
+            "INSERT INTO party_ledger (entry_id, client_id, order_id, kind, date, amount) "
+            "VALUES (?, ?, ?, 'sale', ?, ?)",
+            [(str(uuid.uuid4()), client_id, order_id, order_date or today, total)
+             for client_id, order_id, order_date, total in conn.execute(
+                 "SELECT o.client_id, o.order_id, o.order_date, o.total_cost FROM orders o "
+                 "JOIN clients c ON c.id = o.client_id "
+                 "WHERE o.status IS NOT 'Paid' AND o.total_cost > 0")])
+    party_balances(conn)
+    # Parties that owe, for aging across all of them (see db.PartyLedger.aging)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_clients_owing ON clients (balance, id) WHERE balance > 0")
+    running_total_triggers(conn, "dashboard_totals", "clients", PARTY_TOTALS)
+
+
+# Money columns converted from rupees to whole paise: table -> columns.
+MONEY_COLUMNS = {
+    "products": ("price",),
+    "orders": ("total_cost",),
+    "expenses": ("amount",),
+    "party_ledger": ("amount",),
+}
+
+
+def money_in_paise(conn):
+    # Amounts become whole paise (see pricing.py) so sums never drift. The
+    # columns keep their REAL type: SQLite stores a whole value in a REAL
+    # column as an integer and reads it back as an exact double, and
+    # changing the type would mean rebuilding each table. orders.gst holds
+    # the GST in total_cost, worked out for existing orders from the
+    # product's rate.
+    add_columns(conn, "orders", [("gst", "INTEGER")])
+    # The running-total and summary triggers would apply the conversion a
+    # row at a time; they are remade and their figures recomputed instead.
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND "
+                                "(name LIKE 'dashboard_totals_%' OR name LIKE 'summary_%')").fetchall():
+        conn.execute(f"DROP TRIGGER {name}")
+    for table, columns in MONEY_COLUMNS.items():
+        conn.execute(f"UPDATE {table} SET {', '.join(f'{c} = ROUND({c} * 100)' for c in columns)} "
+                     f"WHERE {' OR '.join(f'{c} IS NOT NULL' for c in columns)}")
+    conn.execute("UPDATE orders SET gst = 0")
+    conn.execute("UPDATE orders SET gst = total_cost - ROUND(total_cost * 100 / (100 + p.gst_rate)) "
+                 "FROM products AS p WHERE p.design_id = orders.product_id AND p.gst_rate > 0 "
+                 "AND orders.total_cost IS NOT NULL")
+    # Balances are summed again from the converted amounts, not scaled
+    party_balances(conn)
+    for table, totals in DASHBOARD_TOTALS.items():
+        running_total_triggers(conn, "dashboard_totals", table, totals)
+    running_total_triggers(conn, "dashboard_totals", "clients", PARTY_TOTALS)
+    for ledger, (table, date_column, amount_column) in SUMMARY_LEDGERS.items():
+        summary_triggers(conn, ledger, table, date_column, amount_column)
+    rebuild_summaries(conn)
+
+
+def udhar_due_only(conn):
+    # udhar_total summed signed balances, so one party's advance lowered
+    # what the others owe; its triggers are remade counting balances due
+    # only (see PARTY_TOTALS) and the total recomputed.
+    for change in ("insert", "delete", "update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS dashboard_totals_clients_{change}")
+    running_total_triggers(conn, "dashboard_totals", "clients", PARTY_TOTALS)
+
+
+def payments_total(conn):
+    # Payments against Udhar were in no dashboard figure, so the balance
+    # missed the money they brought in.
+    running_total_triggers(conn, "dashboard_totals", "party_ledger", LEDGER_TOTALS)
+
+
+# Ordered (version, name, step). Append new steps; never edit or reorder
+# a step that has shipped.
+MIGRATIONS = [
+    (1, "initial schema", initial_schema),
+    (2, "product details columns", product_details),
+    (3, "client email and notes", client_details),
+    (4, "lookup indexes", lookup_indexes),
+    (5, "client full-text search", client_search_index),
+    (6, "dashboard running totals", dashboard_totals),
+    (7, "daily and monthly summaries", summary_tables),
+    (8, "stock ledger opening balances", stock_ledger),
+    (9, "low stock index", low_stock_index),
+    (10, "open purchase order indexes", open_purchase_order_indexes),
+    (11, "date indexes", date_indexes),
+    (12, "list sort and filter indexes", list_indexes),
+    (13, "party ledger", party_ledger),
+    (14, "money in paise", money_in_paise),
+    (15, "udhar total of balances due", udhar_due_only),
+    (16, "payments total", payments_total),
+]
+
+
+def current_version(db):
+    db.execute('''CREATE TABLE IF NOT EXISTS schema_version
+                 (version INTEGER PRIMARY KEY, name TEXT, applied_at TEXT, duration_ms REAL)''')
+    return db.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
+
+
+def migrate(db=None):
+    """Apply every pending step and return [(version, name, seconds), ...]."""
+    db = db or get_db()
+    applied = []
+    version = current_version(db)
+    for step_version, name, step in MIGRATIONS:
+        if step_version <= version:
+            continue
+        start = time.perf_counter()
+        try:
+            with db.transaction() as conn:
+                step(conn)
+                elapsed = time.perf_counter() - start
+                conn.execute("INSERT INTO schema_version (version, name, applied_at, duration_ms) "
+                             "VALUES (?, ?, ?, ?)",
+                             (step_version, name, datetime.now().isoformat(timespec="seconds"),
+                              elapsed * 1000))
+        except Exception as e:
+            raise MigrationError(f"migration {step_version} ({name}) failed: {e}") from e
+        log.info("migration %d (%s) applied in %.1f ms", step_version, name, elapsed * 1000)
+        applied.append((step_version, name, elapsed))
+    return applied
+
+
+if __name__ == "__main__":
+    database = Database(sys.argv[1]) if len(sys.argv) > 1 else get_db()
+    database.configure()
+    steps = migrate(database)
+    for step_version, name, elapsed in steps:
+        print(f"{step_version:>4}  {name:<40} {elapsed * 1000:>10.1f} ms")
+    print(f"schema at version {current_version(database)} ({len(steps)} step(s) applied)")
+    database.close()
@@ -0,0 +1,127 @@
+"""Money in whole paise, and GST worked out a batch of lines at a time.
+
+Every amount the database holds (prices, order totals, expenses, Udhar)
+is a whole number of paise, so adding them up never drifts. Rupees exist
+only at the edges: to_paise() parses what the user typed or a file holds,
+rupees() formats paise for display.
+
+GST rates are percentages (e.g. 5, 12, 18; 0.25 and 1.5 occur), parsed
+with to_gst_rate(), and are applied in basis points with integer arithmetic, rounding half a paisa
+away from zero on each line. line_amounts() prices a whole batch of lines
+with one set of array operations when NumPy is installed, and with a
+plain loop giving the same paise when it is not.
+"""
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PAISE_PER_RUPEE = 100
+
+# GST rates are applied in hundredths of a percent.
+BASIS_POINTS = 10000
+
+
+def to_paise(value):
+    """Paise in a rupee amount such as "1,250.50", "₹99" or 12.5; raises
+    ValueError if it is not a number. Amounts are rounded to the paisa."""
+    if isinstance(value, float):
+        value = repr(value)  # 0.1 is read as 0.1, not as its binary expansion
+    text = str(value).replace(",", "").replace("₹", "").strip()
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"{value!r} is not an amount") from None
+    if not amount.is_finite():
+        raise ValueError(f"{value!r} is not an amount")
+    return int((amount * PAISE_PER_RUPEE).to_integral_value(ROUND_HALF_UP))
+
+
+def to_rupees(paise):
+    """Paise as an exact Decimal number of rupees, e.g. for a file."""
+    return Decimal(int(paise)).scaleb(-2)
+
+
+def rupees(paise):
+    """Paise formatted as rupees with two decimals, e.g. "1250.50"."""
+    if paise is None:
+        return ""
+    return f"{to_rupees(paise):.2f}"
+
+
+def to_gst_rate(value):
+    """The GST percentage in a text such as "18", "1.5" or "0.25%"; raises
+    ValueError unless it is from 0 to 100 in whole basis points."""
+    text = str(value).replace("%", "").strip()
+    try:
+        rate = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"{value!r} is not a GST rate") from None
+    if not rate.is_finite() or not 0 <= rate <= 100 or (rate * 100) % 1:
+        raise ValueError(f"{value!r} is not a GST rate")
+    return float(rate)
+
+
+def gst_basis_points(rate):
+    """A GST percentage (None for none) in basis points, e.g. 18 -> 1800."""
+    if rate is None:
+        return 0
+    return int((Decimal(repr(rate) if isinstance(rate, float) else str(rate)) * 100)
+               .to_integral_value(ROUND_HALF_UP))
+
+
+def _gst(net, basis_points):
+    # Half a paisa rounds away from zero, so a return is the exact negative of its sale
+    gst = (abs(net) * basis_points + BASIS_POINTS // 2) // BASIS_POINTS
+    return gst if net >= 0 else -gst
+
+
+def order_amounts(price, gst_rate, quantity):
+    """(net, GST, total) in paise for `quantity` pieces at `price` paise."""
+    net = int(price or 0) * quantity
+    gst = _gst(net, gst_basis_points(gst_rate))
+    return net, gst, net + gst
+
+
+def line_amounts(prices, quantities, gst_rates):
+    """(net, GST, total) paise for every line of a batch.
+
+    Takes equal-length sequences of prices in paise, quantities and GST
+    percentages, and returns three NumPy int64 arrays, or three lists
+    without NumPy. Each line is rounded exactly as order_amounts() rounds
+    it on its own.
+    """
+    # A batch uses a handful of distinct rates; each is converted once
+    basis_points = {rate: gst_basis_points(rate) for rate in set(gst_rates)}
+    rates = [basis_points[rate] for rate in gst_rates]
+    if np is None:
+        net = [int(price or 0) * quantity for price, quantity in zip(prices, quantities)]
+        gst = [_gst(amount, rate) for amount, rate in zip(net, rates)]
+        return net, gst, [a + b for a, b in zip(net, gst)]
+    net = (np.asarray([int(price or 0) for price in prices], dtype=np.int64)
+           * np.asarray(quantities, dtype=np.int64))
+    gst = ((np.abs(net) * np.asarray(rates, dtype=np.int64) + BASIS_POINTS // 2)
+           // BASIS_POINTS * np.sign(net))
+    return net, gst, net + gst
+
+
+def invoice_totals(invoices, net, gst):
+    """{invoice: (net, GST, total)} summing the lines of each invoice.
+
+    `invoices` names the invoice of each line; `net` and `gst` are as
+    line_amounts() returns them. Lines are grouped in one pass over the
+    arrays with NumPy.
+    """
+    if np is None:
+        totals = {}
+        for invoice, line_net, line_gst in zip(invoices, net, gst):
+            sums = totals.setdefault(invoice, [0, 0])
+            sums[0] += line_net
+            sums[1] += line_gst
+        return {invoice: (a, b, a + b) for invoice, (a, b) in totals.items()}
+    keys, positions = np.unique(np.asarray(invoices, dtype=object), return_inverse=True)
+    sums = np.zeros((len(keys), 2), dtype=np.int64)
+    np.add.at(sums, positions, np.column_stack((net, gst)))
+    return {key: (int(a), int(b), int(a + b)) for key, (a, b) in zip(keys.tolist(), sums)}
@@ -0,0 +1,48 @@
+"""Month-to-date and year-over-year figures from the summary tables.
+
+    python reports.py [--rebuild] [--day YYYY-MM-DD] [path/to/embroidery.db]
+
+--rebuild recomputes summary_daily and summary_monthly from the expenses and
+orders tables first, e.g. after rows were written with the triggers missing
+or after correcting old dates by hand.
+"""
+import argparse
+import time
+from datetime import date
+
+from db import Database, get_db, RESET
+from migrations import SUMMARY_LEDGERS, SUMMARY_PERIODS, rebuild_summaries
+from pricing import rupees
+
+
+def rebuild(db, ledgers=None):
+    """Rebuild the summaries in one transaction; returns the seconds taken."""
+    start = time.perf_counter()
+    with db.transaction() as conn:
+        rebuild_summaries(conn, ledgers)
+        for summary, _, _ in SUMMARY_PERIODS:
+            db.notify(summary, RESET)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("db", nargs="?")
+    parser.add_argument("--rebuild", action="store_true")
+    parser.add_argument("--day", default=date.today().isoformat())
+    args = parser.parse_args()
+
+    database = Database(args.db) if args.db else get_db()
+    if args.rebuild:
+        print(f"summaries rebuilt in {rebuild(database) * 1000:.1f} ms")
+    month = args.day[:7]
+    print(f"{'ledger':<10} {'month to date':>15} {'entries':>8} {month:>12} {'a year ago':>12}")
+    for ledger in SUMMARY_LEDGERS:
+        total, entries = database.summaries.month_to_date(ledger, args.day)
+        this_year, last_year = database.summaries.year_over_year(ledger, month)
+        print(f"{ledger:<10} {rupees(total):>15} {entries:>8} {rupees(this_year):>12} {rupees(last_year):>12}")
+    database.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Check products.stock against the stock_transactions ledger.
+
+    python stock_check.py [--rebuild] [path/to/embroidery.db]
+
+Lists every product whose cached stock differs from the sum of its ledger
+rows (one grouped query). --rebuild then sets those products' stock to the
+ledger balance. Exits 1 if differences were found and not rebuilt.
+"""
+import argparse
+import sys
+
+from db import Database, get_db
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("db", nargs="?")
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+
+    database = Database(args.db) if args.db else get_db()
+    differences = database.stock.verify()
+    for design_id, stock, balance in differences:
+        print(f"{design_id:<36} stock {stock if stock is not None else '-':>8}  ledger {balance:>8}")
+    print(f"{len(differences)} product(s) differ from the ledger")
+    if differences and args.rebuild:
+        print(f"{database.stock.rebuild()} product(s) rebuilt from the ledger")
+    database.close()
+    return 1 if differences and not args.rebuild else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,423 @@
+import sqlite3
+from collections import OrderedDict
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from db import INSERTED, UPDATED, DELETED, RESET
+from pricing import rupees
+
+# Rows read per query and made visible per fetchMore() as the view scrolls.
+BLOCK_SIZE = 256
+
+# Blocks kept in memory. Older blocks are dropped and re-read when they
+# scroll back into view, so memory does not grow with the table.
+MAX_CACHED_BLOCKS = 8
+
+# Comparisons a filter term may use (see LazyTableModel.set_filter).
+FILTER_OPERATORS = ("=", ">=", "<=")
+
+
+class LazyTableModel(QAbstractTableModel):
+    """Read-only table model over one repository's table, read lazily.
+
+    Rows are read in blocks of BLOCK_SIZE in rowid order, or by one column
+    after sort(). A block is located by keyset: it starts after the
+    (sort value, rowid) of the last row of the block before it, which is
+    remembered, so scrolling never re-reads or skips over earlier rows and
+    the thousandth block costs what the first does. Only the most recently
+    used blocks are cached.
+
+    Sorting and set_filter() run in SQL. Only columns leading an index can
+    be sorted on, so every block is a range read off that index.
+
+    Each cached row is (rowid, key, *columns). `first_column` hides leading
+    columns (e.g. an id the page does not show) while keeping them available
+    through key() and row(). Columns the repository lists in `money` hold
+    paise and are shown as rupees.
+
+    The model subscribes to its table's changes in the data layer and patches
+    only the inserted, updated or removed row, so the view keeps its
+    selection and scroll position. A change that moves a row within a sorted
+    view, or into or out of a filtered one, re-reads the view instead.
+    """
+
+    # (change, key, rowid) from Database.subscribe, queued onto the GUI thread
+    rowChanged = pyqtSignal(str, object, object)
+
+    def __init__(self, repository, headers, first_column=0, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.headers = headers
+        self.first_column = first_column
+        self._names = (repository.key,) + tuple(repository.columns)
+        self._money = {i for i, name in enumerate(self._names) if name in repository.money}
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._sortable = None
+        self._filter = []
+        self._total = 0
+        self._loaded = 0
+        self._blocks = OrderedDict()
+        self._block_after = {0: None}
+        self._fixed_rows = None
+        self._active = False
+        self._build_sql()
+
+        repository.db.subscribe(repository.table, self._table_changed)
+        self.rowChanged.connect(self._apply_change)
+
+    def _build_sql(self):
+        table = self.repository.table
+        select = f"SELECT rowid, {', '.join(self._names)} FROM {table} WHERE "
+        where = " AND ".join(f"{name} {op} ?" for name, op, _ in self._filter) or "1"
+        self._params = tuple(value for _, _, value in self._filter)
+        self._count_sql = f"SELECT COUNT(*) FROM {table} WHERE {where}"
+        self._row_sql = f"{select}{self.repository.key} = ? AND {where}"
+        self._member_sql = f"SELECT 1 FROM {table} WHERE rowid = ? AND {where}"
+        self._is_last_sql = f"SELECT 1 FROM {table} WHERE {where} AND rowid > ? LIMIT 1"
+        self._position_sql = f"SELECT COUNT(*) FROM {table} WHERE {where} AND rowid < ?"
+        column = self.sort_column_name()
+        if column is None:
+            self._seek_sql = f"SELECT rowid FROM {table} WHERE {where} ORDER BY rowid LIMIT 1 OFFSET ?"
+            self._segments = [("rowid", f"{select}{where} ORDER BY rowid LIMIT ?",
+                               f"{select}{where} AND rowid > ? ORDER BY rowid LIMIT ?")]
+            return
+        # SQLite sorts NULL before every value, so ascending order is the rows
+        # with no value (by rowid) then the rest by (value, rowid); descending
+        # is the reverse. Each segment is read off the column's index.
+        direction, after = ("ASC", ">") if self._sort_order == Qt.AscendingOrder else ("DESC", "<")
+        self._seek_sql = (f"SELECT {column}, rowid FROM {table} WHERE {where} "
+                          f"ORDER BY {column} {direction}, rowid {direction} LIMIT 1 OFFSET ?")
+        nulls = ("nulls", f"{select}{where} AND {column} IS NULL ORDER BY rowid {direction} LIMIT ?",
+                 f"{select}{where} AND {column} IS NULL AND rowid {after} ? "
+                 f"ORDER BY rowid {direction} LIMIT ?")
+        values = ("values", f"{select}{where} AND {column} IS NOT NULL "
+                  f"ORDER BY {column} {direction}, rowid {direction} LIMIT ?",
+                  f"{select}{where} AND ({column}, rowid) {after} (?, ?) "
+                  f"ORDER BY {column} {direction}, rowid {direction} LIMIT ?")
+        self._segments = [nulls, values] if direction == "ASC" else [values, nulls]
+
+    # Loading
+
+    def reload(self):
+        """Re-read the row count and drop every cached block."""
+        total = self.repository.db.execute(self._count_sql, self._params).fetchone()[0]
+        self.beginResetModel()
+        self._active = True
+        self._fixed_rows = None
+        self._total = total
+        self._loaded = min(BLOCK_SIZE, total)
+        self._blocks.clear()
+        self._block_after = {0: None}
+        self.endResetModel()
+
+    def set_rows(self, rows, append=False):
+        """Show a fixed list of (key, *columns) rows, e.g. search results,
+        instead of the lazily read table. reload() switches back."""
+        rows = [(None,) + tuple(row) for row in rows]
+        if append and self._fixed_rows is not None:
+            if rows:
+                start = len(self._fixed_rows)
+                self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+                self._fixed_rows.extend(rows)
+                self.endInsertRows()
+            return
+        self.beginResetModel()
+        self._active = True
+        self._fixed_rows = rows
+        self._blocks.clear()
+        self.endResetModel()
+
+    def set_filter(self, terms):
+        """Show only rows matching every (column, operator, value) term, e.g.
+        ("role", "=", "Tailor") or ("date", ">=", "2026-04-01"), and re-read.
+        An empty list shows every row."""
+        for name, op, _ in terms:
+            if name not in self._names or op not in FILTER_OPERATORS:
+                raise ValueError(f"Cannot filter on {name} {op}")
+        self._filter = list(terms)
+        self._build_sql()
+        self.reload()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return self._fixed_rows is None and self._loaded < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(BLOCK_SIZE, self._total - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def _order_key(self, row):
+        """Where a cached row sits in the current order: (rowid,) or (value, rowid)."""
+        column = self.sort_column_name()
+        if column is None:
+            return (row[0],)
+        return (row[1 + self._names.index(column)], row[0])
+
+    def _fetch(self, after):
+        """Up to BLOCK_SIZE rows following the order key `after` (None: from the top)."""
+        db = self.repository.db
+        if after is None:
+            first = 0
+            rows = db.execute(self._segments[0][1], (*self._params, BLOCK_SIZE)).fetchall()
+        else:
+            # A key with no value lies among the NULLs, which go by rowid alone
+            kind = "rowid" if len(after) == 1 else "nulls" if after[0] is None else "values"
+            first = [segment[0] for segment in self._segments].index(kind)
+            key = after[1:] if kind == "nulls" else after
+            rows = db.execute(self._segments[first][2], (*self._params, *key, BLOCK_SIZE)).fetchall()
+        for _, first_sql, _ in self._segments[first + 1:]:
+            if len(rows) >= BLOCK_SIZE:
+                break
+            rows += db.execute(first_sql, (*self._params, BLOCK_SIZE - len(rows))).fetchall()
+        return rows
+
+    def _block(self, number):
+        block = self._blocks.get(number)
+        if block is not None:
+            self._blocks.move_to_end(number)
+            return block
+        db = self.repository.db
+        try:
+            if number in self._block_after:
+                after = self._block_after[number]
+            elif self._blocks.get(number - 1):
+                after = self._order_key(self._blocks[number - 1][-1])
+            else:
+                # Jumped past blocks never read (e.g. dragged the scrollbar):
+                # find the last row before this block once, then continue by keyset.
+                found = db.execute(self._seek_sql, (*self._params, number * BLOCK_SIZE - 1)).fetchone()
+                after = tuple(found) if found else None
+            block = self._fetch(after)
+        except sqlite3.Error:
+            return []
+        self._block_after[number] = after
+        if block:
+            self._block_after[number + 1] = self._order_key(block[-1])
+        self._blocks[number] = block
+        if len(self._blocks) > MAX_CACHED_BLOCKS:
+            self._blocks.popitem(last=False)
+        return block
+
+    # Sorting
+
+    def sortable_columns(self):
+        """View columns that lead an index on the table (and so can be sorted on)."""
+        if self._sortable is None:
+            leading = {row[0] for row in self.repository.db.execute(
+                "SELECT ii.name FROM pragma_index_list(?) il, pragma_index_info(il.name) ii "
+                "WHERE il.partial = 0 AND ii.seqno = 0", (self.repository.table,))}
+            self._sortable = {column for column in range(len(self.headers))
+                              if self.first_column + column < len(self._names)
+                              and self._names[self.first_column + column] in leading}
+        return self._sortable
+
+    def sort_column_name(self):
+        if self._sort_column < 0:
+            return None
+        return self._names[self.first_column + self._sort_column]
+
+    def sort_column(self):
+        return self._sort_column
+
+    def sort_order(self):
+        return self._sort_order
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Order rows by a view column in SQL (-1: rowid order).
+
+        A column that cannot be sorted on (see sortable_columns) is ignored.
+        """
+        if column >= 0 and column not in self.sortable_columns():
+            return
+        if (column, order) == (self._sort_column, self._sort_order):
+            return
+        self._sort_column, self._sort_order = column, order
+        self._build_sql()
+        if self._active and self._fixed_rows is None:
+            self.reload()
+
+    # Incremental updates
+
+    def _table_changed(self, table, change, key, rowid):
+        # May run on a worker thread; the signal hands the change to the GUI thread
+        self.rowChanged.emit(change, key, rowid)
+
+    def _apply_change(self, change, key, rowid):
+        if not self._active:
+            return  # nothing read yet; the first reload() sees the change
+        try:
+            if change == RESET:
+                if self._fixed_rows is None:
+                    self.reload()
+            elif change == UPDATED:
+                self._row_updated(key)
+            elif change == INSERTED:
+                self._row_inserted(rowid)
+            elif change == DELETED:
+                self._row_removed(key, rowid)
+        except sqlite3.Error:
+            self.reload()
+
+    def _find(self, key):
+        """View row of a cached row with this key, or None."""
+        if self._fixed_rows is not None:
+            for row, values in enumerate(self._fixed_rows):
+                if values[1] == key:
+                    return row
+            return None
+        for number, block in self._blocks.items():
+            for offset, values in enumerate(block):
+                if values[1] == key:
+                    return number * BLOCK_SIZE + offset
+        return None
+
+    def _row_updated(self, key):
+        row = self._find(key)
+        if row is None:
+            if (self._filter or self._sort_column >= 0) and self._fixed_rows is None:
+                self.reload()  # may have come into the filter or moved in the sort order
+            return  # otherwise read fresh when scrolled into view
+        if self._fixed_rows is not None:
+            fresh = self.repository.db.execute(self.repository.select_one_sql, (key,)).fetchone()
+            if fresh is None:
+                return
+            self._fixed_rows[row] = (None,) + tuple(fresh)
+        else:
+            fresh = self.repository.db.execute(self._row_sql, (key, *self._params)).fetchone()
+            cached = self._blocks[row // BLOCK_SIZE][row % BLOCK_SIZE]
+            if fresh is None or self._order_key(fresh) != self._order_key(cached):
+                self.reload()  # left the filter, or moved in the sort order
+                return
+            self._blocks[row // BLOCK_SIZE][row % BLOCK_SIZE] = fresh
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def _position(self, rowid):
+        """View row a row with this rowid occupies in rowid order."""
+        db = self.repository.db
+        if db.execute(self._is_last_sql, (*self._params, rowid)).fetchone() is None:
+            return self._total - 1  # the usual case: appended at the end
+        return db.execute(self._position_sql, (*self._params, rowid)).fetchone()[0]
+
+    def _invalidate_from(self, row):
+        """Drop cached blocks at or after `row`; their rows have shifted."""
+        first = row // BLOCK_SIZE
+        for number in [n for n in self._blocks if n >= first]:
+            del self._blocks[number]
+        for number in [n for n in self._block_after if n >= first and n > 0]:
+            del self._block_after[number]
+
+    def _row_inserted(self, rowid):
+        if self._fixed_rows is not None:
+            return  # search results are not extended by unrelated inserts
+        if self._filter and self.repository.db.execute(
+                self._member_sql, (rowid, *self._params)).fetchone() is None:
+            return
+        if self._sort_column >= 0:
+            self.reload()
+            return
+        self._total += 1
+        row = self._position(rowid)
+        if row < self._loaded or self._loaded == self._total - 1:
+            self._invalidate_from(row)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._loaded += 1
+            self.endInsertRows()
+
+    def _row_removed(self, key, rowid):
+        row = self._find(key)
+        if self._fixed_rows is not None:
+            if row is not None:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._fixed_rows[row]
+                self.endRemoveRows()
+            return
+        if row is None:
+            if self._filter or self._sort_column >= 0 or rowid is None:
+                self.reload()  # cannot tell where, or whether, it was shown
+                return
+            row = self._position(rowid)
+        self._total -= 1
+        if row < self._loaded:
+            self._invalidate_from(row)
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._loaded -= 1
+            self.endRemoveRows()
+
+    # Row access for pages
+
+    def row(self, row):
+        """Return (key, *columns) for a view row, or None."""
+        if self._fixed_rows is not None:
+            if 0 <= row < len(self._fixed_rows):
+                return self._fixed_rows[row][1:]
+            return None
+        if not 0 <= row < self._loaded:
+            return None
+        block = self._block(row // BLOCK_SIZE)
+        offset = row % BLOCK_SIZE
+        return block[offset][1:] if offset < len(block) else None
+
+    def key(self, row):
+        values = self.row(row)
+        return values[0] if values else None
+
+    def set_headers(self, headers):
+        """Replace the column titles (same columns), e.g. in another language."""
+        self.headers = headers
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(headers) - 1)
+
+    # QAbstractTableModel
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self._fixed_rows is not None:
+            return len(self._fixed_rows)
+        return self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        values = self.row(index.row())
+        if values is None:
+            return None
+        position = self.first_column + index.column()
+        value = values[position]
+        if position in self._money:
+            return rupees(value)
+        if isinstance(value, float):
+            return f"{value:g}"  # a GST rate of 18 shows as 18, not 18.0
+        return "" if value is None else str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section] if section < len(self.headers) else None
+        return str(section + 1)
+
+
+def enable_sorting(view):
+    """Sort a view over a LazyTableModel by clicking its header, in SQL.
+
+    Clicking a column that cannot be sorted on leaves the order, and the
+    header's sort indicator, as they were.
+    """
+    model = view.model()
+    header = view.horizontalHeader()
+
+    def keep_indicator(column, order):
+        if column >= 0 and column not in model.sortable_columns():
+            header.blockSignals(True)
+            header.setSortIndicator(model.sort_column(), model.sort_order())
+            header.blockSignals(False)
+
+    # Start unsorted, so enabling sorting does not read anything yet
+    header.setSortIndicator(-1, Qt.AscendingOrder)
+    view.setSortingEnabled(True)
+    header.sortIndicatorChanged.connect(keep_indicator)
@@ -0,0 +1,34 @@
+"""A background job reports how it ended, however its work fails."""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtCore import QCoreApplication, pyqtSignal
+
+from background import BackgroundJob
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+class BuggyJob(BackgroundJob):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int)
+
+    def work(self):
+        return {}["missing"]
+
+
+def test_unexpected_error_fails_the_job(app):
+    job = BuggyJob(db=object())
+    failures = []
+    job.failed.connect(failures.append)
+    job.start()
+    assert job.wait(5000)
+    app.processEvents()
+    assert failures == ["Unexpected error: 'missing'"]
@@ -0,0 +1,95 @@
+"""import_file() imports the good rows and reports each bad one."""
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from db import Database
+from importer import ImportFileError, import_file
+from migrations import migrate
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "import.db"))
+    database.configure()
+    migrate(database)
+    yield database
+    database.close()
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        csv.writer(file).writerows(rows)
+    return str(path)
+
+
+def rejects(path):
+    with open(path, newline="", encoding="utf-8") as file:
+        return [(row[0], row[1]) for row in list(csv.reader(file))[1:]]
+
+
+def test_bad_rows_are_reported(db, tmp_path):
+    path = write_csv(tmp_path / "expenses.csv", [
+        ["Description", "Amount", "Date", "Notes"],
+        ["Tea", "49.50", "2026-03-06", ""],
+        ["Bus", "lots", "2026-03-06", ""],
+        ["", "10", "2026-03-06", ""],
+        ["Rent", "5000", "06/03/2026", ""],
+        ["Thread", "1,250", "2026-03-07", "bulk"],
+    ])
+    imported, rejected, rejects_path = import_file(db, "expenses", path)
+    assert (imported, rejected) == (2, 3)
+    assert rejects(rejects_path) == [("3", "Amount must be a number"), ("4", "Missing description"),
+                                     ("5", "Date must be YYYY-MM-DD")]
+    assert dict(db.execute("SELECT description, amount FROM expenses")) == {"Tea": 4950, "Thread": 125000}
+
+
+def test_duplicate_contacts_are_rejected(db, tmp_path):
+    db.clients.insert("Ramesh", "9000000001", "Surat")
+    path = write_csv(tmp_path / "clients.csv", [
+        ["name", "contact", "address"],
+        ["Suresh", "9000000001", "Vapi"],
+        ["Mahesh", "9000000002", "Navsari"],
+        ["Naresh", "9000000002", "Bardoli"],
+        ["Dinesh", "12345", "Valsad"],
+    ])
+    imported, rejected, rejects_path = import_file(db, "clients", path)
+    assert (imported, rejected) == (1, 3)
+    assert sorted(rejects(rejects_path)) == [("2", "Contact already exists"), ("4", "Contact already exists"),
+                                             ("5", "Invalid contact number")]
+    assert dict(db.execute("SELECT contact, name FROM clients")) == {"9000000001": "Ramesh",
+                                                                     "9000000002": "Mahesh"}
+
+
+def test_bad_row_leaves_nothing_behind(db, tmp_path):
+    supplier_id = db.suppliers.insert("Surat Threads", "9000000009", "Surat")
+    path = write_csv(tmp_path / "products.csv", [
+        ["description", "embroidery_type", "price", "stock", "gst_rate", "supplier_id"],
+        ["Zari", "Zardosi", "100", "5", "5", supplier_id],
+        ["Mirror", "Kutch", "50", "3", "", "no-such-supplier"],
+        ["Aari", "Aari", "75", "2", "250", ""],
+    ])
+    imported, rejected, _ = import_file(db, "products", path)
+    assert (imported, rejected) == (1, 2)
+    # Neither the rejected products nor their opening stock were recorded
+    assert db.execute("SELECT description, stock, gst_rate FROM products").fetchall() == [("Zari", 5, 5.0)]
+    assert db.execute("SELECT quantity, type FROM stock_transactions").fetchall() == [(5, "opening")]
+    assert db.stock.verify() == []
+
+
+def test_previous_rejects_are_removed(db, tmp_path):
+    write_csv(tmp_path / "expenses.rejects.csv", [["row", "error"], ["2", "old"]])
+    path = write_csv(tmp_path / "expenses.csv", [["description", "amount", "date"], ["Tea", "5", "2026-03-06"]])
+    assert import_file(db, "expenses", path) == (1, 0, None)
+    assert not os.path.exists(tmp_path / "expenses.rejects.csv")
+
+
+def test_missing_columns_stop_the_import(db, tmp_path):
+    path = write_csv(tmp_path / "clients.csv", [["name", "address"], ["Ramesh", "Surat"]])
+    with pytest.raises(ImportFileError, match="Missing column"):
+        import_file(db, "clients", path)
+    assert db.execute("SELECT COUNT(*) FROM clients").fetchone()[0] == 0
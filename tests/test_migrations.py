@@ -0,0 +1,82 @@
+"""Migration 14 (money in paise) rewrites every stored amount in place.
+
+Run from the repository root:
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import migrations
+from db import Database
+
+
+def migrate_to(db, version, monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(migrations, "MIGRATIONS", [step for step in migrations.MIGRATIONS if step[0] <= version])
+        migrations.migrate(db)
+
+
+def rupee_database(path, monkeypatch):
+    """A database at step 13 holding amounts in rupees, as one written
+    before money_in_paise would."""
+    db = Database(str(path))
+    db.configure()
+    migrate_to(db, 12, monkeypatch)
+    db.executemany("INSERT INTO products (design_id, description, price, stock, gst_rate) VALUES (?, ?, ?, ?, ?)",
+                   [("p5", "Zari", 199.99, 10, 5), ("p0", "Thread", 12.5, 10, 0)])
+    db.execute("INSERT INTO clients (id, name, contact, address) VALUES ('c', 'Ramesh', '9000000001', 'Surat')")
+    db.executemany("INSERT INTO orders (order_id, client_id, product_id, quantity, status, order_date, total_cost) "
+                   "VALUES (?, 'c', ?, 1, ?, '2026-03-05', ?)",
+                   [("paid", "p5", "Paid", 210.0),
+                    # 100.125 is exact in binary, so * 100 is a true half paisa
+                    ("unpaid", "p5", "Pending", 100.125),
+                    ("untaxed", "p0", "Paid", 12.5),
+                    ("unknown", "gone", "Paid", 7.25)])
+    db.execute("INSERT INTO expenses (id, description, amount, date) VALUES ('e', 'Tea', 49.5, '2026-03-06')")
+    # The party ledger step opens the ledger from these unpaid orders
+    migrate_to(db, 13, monkeypatch)
+    return db
+
+
+def test_money_in_paise(tmp_path, monkeypatch):
+    db = rupee_database(tmp_path / "rupees.db", monkeypatch)
+    assert [version for version, _, _ in migrations.migrate(db)][0] == 14
+
+    assert dict(db.execute("SELECT design_id, price FROM products")) == {"p5": 19999, "p0": 1250}
+    assert dict(db.execute("SELECT id, amount FROM expenses")) == {"e": 4950}
+    orders = {key: (total, gst) for key, total, gst in db.execute("SELECT order_id, total_cost, gst FROM orders")}
+    assert orders == {
+        "paid": (21000, 1000),    # 210.00 at 5%: 200.00 + 10.00 GST
+        "unpaid": (10013, 477),   # ROUND(10012.5); GST = 10013 - ROUND(10013 * 100 / 105)
+        "untaxed": (1250, 0),
+        "unknown": (725, 0),      # no product, so no GST rate
+    }
+
+    assert db.execute("SELECT amount, balance FROM party_ledger").fetchall() == [(10013, 10013)]
+    assert db.execute("SELECT balance FROM clients").fetchone()[0] == 10013
+    totals = dict(db.execute("SELECT name, value FROM dashboard_totals"))
+    assert (totals["paid_total"], totals["unpaid_total"], totals["expenses_total"],
+            totals["udhar_total"]) == (22975, 10013, 4950, 10013)
+    monthly = dict(db.execute("SELECT ledger, total FROM summary_monthly WHERE month = '2026-03'"))
+    assert monthly == {"orders": 32988, "gst": 1477, "expenses": 4950}
+
+    # The triggers remade by the step add paise from now on, not rupees
+    db.execute("INSERT INTO expenses (id, description, amount, date) VALUES ('f', 'Bus', 300, '2026-03-07')")
+    assert db.execute("SELECT value FROM dashboard_totals WHERE name = 'expenses_total'").fetchone()[0] == 5250
+    db.close()
+
+
+def test_shared_contacts_get_suffixes(tmp_path, monkeypatch):
+    db = Database(str(tmp_path / "shared.db"))
+    db.configure()
+    migrate_to(db, 3, monkeypatch)
+    db.executemany("INSERT INTO clients (id, name, contact, address) VALUES (?, ?, ?, 'Surat')",
+                   [("a", "Ramesh", "9000000001"), ("b", "Suresh", "9000000001"),
+                    ("c", "Mahesh", "9000000001-dup2"), ("d", "Naresh", "9000000001")])
+    migrations.migrate(db)
+    assert dict(db.execute("SELECT id, contact FROM clients")) == {
+        "a": "9000000001", "b": "9000000001-dup3", "c": "9000000001-dup2", "d": "9000000001-dup4"}
+    db.close()
@@ -0,0 +1,89 @@
+"""Udhar on the party ledger: aging, open credits and the dashboard figures."""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+from dashboard import Dashboard
+from db import Database
+from migrations import migrate
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "ledger.db"))
+    database.configure()
+    migrate(database)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def client(db):
+    return db.clients.insert("Ramesh", "9000000001", "Surat")
+
+
+@pytest.fixture
+def product(db):
+    return db.products.insert("Zari", "Zardosi", 10000, 100)
+
+
+def test_payment_counts_in_balance_and_clears_notice(app, db, client, product):
+    db.orders.place(client, product, 1, "Pending", "2026-03-05")
+    dashboard = Dashboard(db)
+    figures = dashboard.figures()
+    assert figures["balance"] == "0.00"
+    assert "1 order(s) awaiting payment" in figures["notifications"]
+
+    db.party_ledger.pay(client, 10000)
+    figures = dashboard.figures()
+    assert figures["balance"] == "100.00"
+    assert figures["udhar"] == "0.00"
+    assert "awaiting payment" not in figures["notifications"]
+
+
+def test_part_payment_leaves_newer_orders_awaiting(app, db, client, product):
+    for day in ("2026-03-01", "2026-03-02", "2026-03-03"):
+        db.orders.place(client, product, 1, "Pending", day)
+    db.party_ledger.pay(client, 15000)
+    # The oldest order is paid off and half of the second
+    assert db.party_ledger.awaiting_payment() == 2
+    assert "2 order(s) awaiting payment" in Dashboard(db).figures()["notifications"]
+
+
+@pytest.fixture
+def old_and_new(db, client, product):
+    """An order of 100.00 from January and one of 200.00 from March, unpaid."""
+    return (db.orders.place(client, product, 1, "Pending", "2026-01-05"),
+            db.orders.place(client, product, 2, "Pending", "2026-03-05"))
+
+
+def test_aging_after_an_order_is_settled(db, client, old_and_new):
+    db.orders.set_status(old_and_new[1], "Paid")
+    # The March order's own credit is cleared, not the oldest
+    assert db.party_ledger.aging(client, "2026-03-10") == {"0-30": 0, "31-60": 0, "60+": 10000}
+
+
+def test_open_credits_after_an_order_is_deleted(db, client, old_and_new):
+    db.orders.delete(old_and_new[1])
+    assert db.party_ledger.open_credits(client) == [("2026-01-05", 10000)]
+    assert db.party_ledger.aging(client, "2026-03-10") == {"0-30": 0, "31-60": 0, "60+": 10000}
+
+
+def test_aging_after_a_back_dated_payment(db, client, old_and_new):
+    db.party_ledger.pay(client, 15000, "2026-02-01")
+    # Payments settle the oldest credit first, whenever they are dated
+    assert db.party_ledger.aging(client, "2026-03-10") == {"0-30": 15000, "31-60": 0, "60+": 0}
+    # and the back-dated entry moves the running balance of the later one
+    _, entries = db.party_ledger.statement(client)
+    assert [(entry[4], entry[6]) for entry in entries] == [
+        ("2026-01-05", 10000), ("2026-02-01", -5000), ("2026-03-05", 15000)]
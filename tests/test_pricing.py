@@ -0,0 +1,29 @@
+"""GST rates typed or imported are checked before they price an order.
+
+Run from the repository root:
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pricing import gst_basis_points, to_gst_rate
+
+
+@pytest.mark.parametrize("text, rate", [("18", 18.0), ("0", 0.0), ("1.5", 1.5), (" 0.25% ", 0.25), ("100", 100.0)])
+def test_gst_rates(text, rate):
+    assert to_gst_rate(text) == rate
+
+
+@pytest.mark.parametrize("text", ["", "GST", "-5", "100.01", "0.125", "nan", "inf"])
+def test_bad_gst_rates(text):
+    with pytest.raises(ValueError):
+        to_gst_rate(text)
+
+
+def test_rate_round_trips_to_basis_points():
+    assert gst_basis_points(to_gst_rate("0.25")) == 25
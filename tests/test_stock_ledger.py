@@ -0,0 +1,66 @@
+"""StockLedger keeps products.stock equal to the sum of its movements."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from db import Database, StockError
+from migrations import migrate
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "stock.db"))
+    database.configure()
+    migrate(database)
+    yield database
+    database.close()
+
+
+def stock(db, design_id):
+    return db.execute("SELECT stock FROM products WHERE design_id = ?", (design_id,)).fetchone()[0]
+
+
+def movements(db):
+    return db.execute("SELECT COUNT(*) FROM stock_transactions").fetchone()[0]
+
+
+def test_move_below_zero_is_refused(db):
+    design_id = db.products.insert("Zari", "Zardosi", 10000, 3)
+    with pytest.raises(StockError, match="Only 3"):
+        db.stock.move(design_id, -4, "sale")
+    assert stock(db, design_id) == 3
+    assert movements(db) == 1  # the opening stock only
+
+    db.stock.move(design_id, -3, "sale")
+    assert stock(db, design_id) == 0
+
+
+def test_receive_many_records_nothing_for_an_unknown_design(db):
+    design_id = db.products.insert("Zari", "Zardosi", 10000, 3)
+    with pytest.raises(StockError, match="Unknown design"):
+        db.stock.receive_many([(design_id, 5), ("gone", 2), (design_id, 1)])
+    assert stock(db, design_id) == 3
+    assert movements(db) == 1
+
+    db.stock.receive_many([(design_id, 5), (design_id, 1)])
+    assert stock(db, design_id) == 9
+    assert movements(db) == 3
+
+
+def test_verify_and_rebuild_agree_with_products_stock(db):
+    first = db.products.insert("Zari", "Zardosi", 10000, 3)
+    second = db.products.insert("Mirror", "Kutch", 5000, 0)
+    db.stock.receive_many([(first, 2), (second, 4)])
+    db.stock.move(second, -1, "sale")
+    assert db.stock.verify() == []
+    assert db.stock.rebuild() == 0
+
+    # A balance changed behind the ledger's back is reported, then corrected
+    db.execute("UPDATE products SET stock = 50 WHERE design_id = ?", (first,))
+    assert db.stock.verify() == [(first, 50, 5)]
+    assert db.stock.rebuild() == 1
+    assert (stock(db, first), stock(db, second)) == (5, 3)
+    assert db.stock.verify() == []
@@ -0,0 +1,53 @@
+"""LazyTableModel keeps its cached blocks in step with changed rows."""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+from db import Database
+from migrations import migrate
+from table_model import BLOCK_SIZE, MAX_CACHED_BLOCKS, LazyTableModel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "model.db"))
+    database.configure()
+    migrate(database)
+    yield database
+    database.close()
+
+
+def test_sorted_update_of_uncached_row_reloads(app, db):
+    rows = 3000
+    with db.transaction():
+        for n in range(rows):
+            db.employees.insert(f"emp{n:04d}", "9000000000", "Tailor")
+    model = LazyTableModel(db.employees, ["ID", "Name", "Contact", "Role"])
+    model.reload()
+    model.sort(1)
+    while model.canFetchMore():
+        model.fetchMore()
+    key = model.key(2000)
+    # Read the last blocks, then the first, so row 2000's block is dropped
+    last = (rows - 1) // BLOCK_SIZE
+    for number in list(range(last - 3, last + 1)) + list(range(MAX_CACHED_BLOCKS - 4)):
+        model.row(number * BLOCK_SIZE)
+    assert 2000 // BLOCK_SIZE not in model._blocks
+
+    db.employees.update(key, "a_first", "9000000000", "Tailor")
+
+    while model.canFetchMore():
+        model.fetchMore()  # as the view does after the reload
+    assert model.row(0)[:2] == (key, "a_first")
+    assert model.row(rows - 1)[1] == "emp2999"
+    assert len({model.key(row) for row in range(rows)}) == rows
@@ -1,12 +1,166 @@
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QApplication
 
-def load_theme():
-    theme_file = os.path.join(os.path.dirname(__file__), "theme.json")
-    
-    try:
-        with open(theme_file, "r") as file:
-            data = json.load(file)
-            return data.get("theme", "light")  # default to 'light'
-    except Exception:
-        return "light"
+THEME_FILE = os.path.join(os.path.dirname(__file__), "theme.json")
+DEFAULT_THEME = "light"
+THEMES = ("light", "dark")
+
+# Palette per theme. Every colour the pages used to set inline lives here.
+PALETTES = {
+    "dark": {
+        "auth_background": "qlineargradient(x1:0, y1:0, x2:1, y2:1, "
+                           "stop:0 #0f2027, stop:0.5 #203a43, stop:1 #2c5364)",
+        "text": "white",
+        "enter_button": "#00c9a7",
+        "enter_text": "#fff",
+        "main_background": "#121212",
+        "menu_button": "#37474f",
+        "menu_text": "white",
+        "back_button": "#455a64",
+        "home_background": "#1e1e2f",
+        "box_background": "#2a2a40",
+        "box_border": "#444",
+        "cards": ["#394b59", "#3d5a4d", "#6f6743", "#5a4b5c", "#5e4c3c"],
+        "table_background": "#1e1e1e",
+        "input_background": "#2e2e2e",
+        "button_background": "#37474f",
+    },
+    "light": {
+        "auth_background": "qlineargradient(x1:0, y1:0, x2:1, y2:1, "
+                           "stop:0 #e0f7fa, stop:1 #ffffff)",
+        "text": "black",
+        "enter_button": "#0288d1",
+        "enter_text": "white",
+        "main_background": "#f5f5f5",
+        "menu_button": "#b3e5fc",
+        "menu_text": "black",
+        "back_button": "#81d4fa",
+        "home_background": "#f0f4f7",
+        "box_background": "#ffffff",
+        "box_border": "#ccc",
+        "cards": ["#b3e5fc", "#c8e6c9", "#fff9c4", "#e1bee7", "#ffe0b2"],
+        "table_background": "#ffffff",
+        "input_background": "#ffffff",
+        "button_background": "#b3e5fc",
+    },
+}
+
+
+def build_stylesheet(theme):
+    """Application-wide stylesheet for a theme.
+
+    Pages are matched by objectName (authPage, mainPage, homePage, partyPage)
+    and dynamic properties (menu, card) instead of setting styles widget by
+    widget, so switching theme is a single QApplication.setStyleSheet().
+    Rules for inner pages come after the mainPage rules they override.
+    """
+    p = PALETTES[theme]
+    rules = [
+        f"QWidget#authPage, QWidget#authPage QWidget {{ background-color: {p['auth_background']};"
+        f" color: {p['text']}; }}",
+        f"QWidget#authPage QPushButton#enterButton {{ background-color: {p['enter_button']};"
+        f" color: {p['enter_text']}; padding: 12px; border-radius: 10px; }}",
+        f"QWidget#mainPage, QWidget#mainPage QWidget {{ background-color: {p['main_background']};"
+        f" color: {p['text']}; }}",
+        f"QWidget#mainPage QPushButton[menu=\"true\"] {{ background-color: {p['menu_button']};"
+        f" color: {p['menu_text']}; padding: 6px; border-radius: 8px; }}",
+        f"QWidget#mainPage QPushButton#backButton {{ background-color: {p['back_button']};"
+        f" color: {p['menu_text']}; padding: 5px; border-radius: 5px; }}",
+        f"QWidget#homePage, QWidget#homePage QWidget {{ background-color: {p['home_background']};"
+        f" color: {p['text']}; }}",
+        f"QWidget#homePage QLabel#notificationBox {{ background-color: {p['box_background']};"
+        f" border: 1px solid {p['box_border']}; padding: 8px; }}",
+        "QWidget#homePage QLabel#dashboardTitle { margin-top: 10px; }",
+        "QWidget#homePage QLabel#notificationTitle { margin-top: 20px; }",
+        f"QWidget#partyPage QTableView {{ background-color: {p['table_background']};"
+        f" color: {p['text']}; }}",
+        f"QWidget#partyPage QLineEdit {{ background-color: {p['input_background']};"
+        f" color: {p['text']}; }}",
+        f"QWidget#partyPage QPushButton {{ background-color: {p['button_background']};"
+        f" color: {p['text']}; }}",
+    ]
+    for index, color in enumerate(p["cards"]):
+        card = f"QWidget#homePage QFrame[card=\"{index}\"]"
+        rules.append(f"{card}, {card} QLabel {{ background-color: {color}; color: {p['text']}; }}")
+        rules.append(f"{card} {{ padding: 10px; border-radius: 10px; }}")
+    return "\n".join(rules)
+
+
+class ThemeService(QObject):
+    """Holds the current theme in memory and applies it application-wide.
+
+    The theme file is read once at start-up and written on a background
+    thread when the theme changes. themeChanged is emitted once per change
+    for the few widgets whose text depends on the theme.
+    """
+
+    themeChanged = pyqtSignal(str)
+
+    def __init__(self, path=THEME_FILE, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._theme = self._read()
+        self._stylesheets = {}
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="theme-writer")
+
+    def _read(self):
+        try:
+            with open(self.path, "r") as file:
+                theme = json.load(file).get("theme", DEFAULT_THEME)
+        except (OSError, ValueError):
+            return DEFAULT_THEME
+        return theme if theme in THEMES else DEFAULT_THEME
+
+    def _write(self, theme):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as file:
+            json.dump({"theme": theme}, file)
+        os.replace(tmp, self.path)
+
+    def theme(self):
+        return self._theme
+
+    def stylesheet(self, theme=None):
+        theme = theme or self._theme
+        if theme not in self._stylesheets:
+            self._stylesheets[theme] = build_stylesheet(theme)
+        return self._stylesheets[theme]
+
+    def apply(self):
+        app = QApplication.instance()
+        if app is not None:
+            app.setStyleSheet(self.stylesheet())
+
+    def set_theme(self, theme):
+        if theme not in THEMES:
+            raise ValueError(f"unknown theme {theme!r}")
+        if theme == self._theme:
+            return
+        self._theme = theme
+        self.apply()
+        self._writer.submit(self._write, theme)
+        self.themeChanged.emit(theme)
+
+    def toggle(self):
+        self.set_theme("light" if self._theme == "dark" else "dark")
+
+    def flush(self):
+        """Wait for pending writes of the theme file."""
+        self._writer.submit(lambda: None).result()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_theme_service():
+    """Return the process-wide ThemeService, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ThemeService()
+        return _service
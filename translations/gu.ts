@@ -0,0 +1,1315 @@
+<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE TS>
+<TS version="2.1" language="gu">
+<context>
+    <name>App</name>
+    <message>
+        <location filename="../yogi_fashion/app.py" line="33"/>
+        <source>Database upgrade failed</source>
+        <translation>ડેટાબેઝ અપગ્રેડ નિષ્ફળ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/app.py" line="33"/>
+        <source>The database could not be upgraded, so the app cannot start.
+
+{0}</source>
+        <translation>ડેટાબેઝ અપગ્રેડ થઈ શક્યો નહીં, તેથી એપ શરૂ થઈ શકતી નથી.
+
+{0}</translation>
+    </message>
+</context>
+<context>
+    <name>CrudPage</name>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="115"/>
+        <source>Update Selected</source>
+        <translation>પસંદ કરેલું અપડેટ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="116"/>
+        <source>Delete Selected</source>
+        <translation>પસંદ કરેલું કાઢી નાખો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="117"/>
+        <source>Import from File</source>
+        <translation>ફાઇલમાંથી આયાત કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="118"/>
+        <source>Export</source>
+        <translation>નિકાસ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="134"/>
+        <source>Error</source>
+        <translation>ભૂલ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="137"/>
+        <source>Success</source>
+        <translation>સફળ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="154"/>
+        <source>Database error: {0}</source>
+        <translation>ડેટાબેઝ ભૂલ: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="160"/>
+        <source>All fields are required</source>
+        <translation>બધી વિગતો આવશ્યક છે</translation>
+    </message>
+</context>
+<context>
+    <name>Dashboard</name>
+    <message>
+        <location filename="../dashboard.py" line="53"/>
+        <source>⚠️ {0}: {1} left (reorder at {2}), purchase order drafted</source>
+        <translation>⚠️ {0}: {1} બાકી (ફરી ઓર્ડર {2} પર), ખરીદ ઓર્ડરનો મુસદ્દો બન્યો</translation>
+    </message>
+    <message>
+        <location filename="../dashboard.py" line="55"/>
+        <source>⚠️ {0}: {1} left (reorder at {2}), no supplier set</source>
+        <translation>⚠️ {0}: {1} બાકી (ફરી ઓર્ડર {2} પર), કોઈ સપ્લાયર નક્કી નથી</translation>
+    </message>
+    <message>
+        <location filename="../dashboard.py" line="58"/>
+        <source>📦 {0} order(s) awaiting payment</source>
+        <translation>📦 {0} ઓર્ડર ચુકવણીની રાહમાં</translation>
+    </message>
+    <message>
+        <location filename="../dashboard.py" line="59"/>
+        <source>No new notifications</source>
+        <translation>કોઈ નવી સૂચના નથી</translation>
+    </message>
+</context>
+<context>
+    <name>EmployeePage</name>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Name:</source>
+        <translation>નામ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Contact:</source>
+        <translation>સંપર્ક:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Role:</source>
+        <translation>ભૂમિકા:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Add Employee</source>
+        <translation>કર્મચારી ઉમેરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="33"/>
+        <source>Show only role… (Enter)</source>
+        <translation>ફક્ત આ ભૂમિકા બતાવો… (Enter)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>ID</source>
+        <translation>આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Name</source>
+        <translation>નામ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Contact</source>
+        <translation>સંપર્ક</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Role</source>
+        <translation>ભૂમિકા</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Employee added</source>
+        <translation>કર્મચારી ઉમેરાયો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Failed to add employee: {0}</source>
+        <translation>કર્મચારી ઉમેરી શકાયો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Employee updated</source>
+        <translation>કર્મચારી અપડેટ થયો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Failed to update employee: {0}</source>
+        <translation>કર્મચારી અપડેટ થઈ શક્યો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Select an employee to update</source>
+        <translation>અપડેટ કરવા માટે કર્મચારી પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Employee deleted</source>
+        <translation>કર્મચારી કાઢી નાખ્યો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Failed to delete employee: {0}</source>
+        <translation>કર્મચારી કાઢી શકાયો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Select an employee to delete</source>
+        <translation>કાઢવા માટે કર્મચારી પસંદ કરો</translation>
+    </message>
+</context>
+<context>
+    <name>ExpensePage</name>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Description:</source>
+        <translation>વર્ણન:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Amount:</source>
+        <translation>રકમ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Date:</source>
+        <translation>તારીખ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Add Expense</source>
+        <translation>ખર્ચ ઉમેરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="54"/>
+        <source>YYYY-MM-DD</source>
+        <translation>YYYY-MM-DD</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="55"/>
+        <source>From YYYY-MM-DD</source>
+        <translation>થી YYYY-MM-DD</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="56"/>
+        <source>To YYYY-MM-DD</source>
+        <translation>સુધી YYYY-MM-DD</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="57"/>
+        <source>Filter</source>
+        <translation>ફિલ્ટર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>ID</source>
+        <translation>આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Description</source>
+        <translation>વર્ણન</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Amount</source>
+        <translation>રકમ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Date</source>
+        <translation>તારીખ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="27"/>
+        <source>Dates must be YYYY-MM-DD</source>
+        <translation>તારીખો YYYY-MM-DD માં હોવી જોઈએ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Expense added</source>
+        <translation>ખર્ચ ઉમેરાયો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="36"/>
+        <source>Amount must be a number</source>
+        <translation>રકમ સંખ્યા હોવી જોઈએ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Failed to add expense: {0}</source>
+        <translation>ખર્ચ ઉમેરી શકાયો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Expense updated</source>
+        <translation>ખર્ચ અપડેટ થયો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Failed to update expense: {0}</source>
+        <translation>ખર્ચ અપડેટ થઈ શક્યો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Select an expense to update</source>
+        <translation>અપડેટ કરવા માટે ખર્ચ પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Expense deleted</source>
+        <translation>ખર્ચ કાઢી નાખ્યો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Failed to delete expense: {0}</source>
+        <translation>ખર્ચ કાઢી શકાયો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Select an expense to delete</source>
+        <translation>કાઢવા માટે ખર્ચ પસંદ કરો</translation>
+    </message>
+</context>
+<context>
+    <name>HomePage</name>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="74"/>
+        <source>📊 Dashboard</source>
+        <translation>📊 ડેશબોર્ડ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="75"/>
+        <source>💰 Total Balance</source>
+        <translation>💰 કુલ બેલેન્સ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="76"/>
+        <source>💸 Total Expenses</source>
+        <translation>💸 કુલ ખર્ચ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="77"/>
+        <source>👤 Total Employees</source>
+        <translation>👤 કુલ કર્મચારીઓ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="78"/>
+        <source>🧵 Total Machines</source>
+        <translation>🧵 કુલ મશીનો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="79"/>
+        <source>💳 Total Udhar</source>
+        <translation>💳 કુલ ઉધાર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="80"/>
+        <source>🔔 Recent Notifications</source>
+        <translation>🔔 તાજેતરની સૂચનાઓ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="84"/>
+        <source>No new notifications</source>
+        <translation>કોઈ નવી સૂચના નથી</translation>
+    </message>
+</context>
+<context>
+    <name>LoginPage</name>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="143"/>
+        <source>Error</source>
+        <translation>ભૂલ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="143"/>
+        <source>Failed to login: {0}</source>
+        <translation>લૉગિન થઈ શક્યું નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="147"/>
+        <source>🧵 Yogi Fashion Login</source>
+        <translation>🧵 યોગી ફેશન લૉગિન</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="148"/>
+        <source>Username:</source>
+        <translation>વપરાશકર્તા નામ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="148"/>
+        <source>Password:</source>
+        <translation>પાસવર્ડ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="151"/>
+        <source>🔐 Login</source>
+        <translation>🔐 લૉગિન</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="152"/>
+        <source>📝 Go to Register</source>
+        <translation>📝 નોંધણી પર જાઓ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="161"/>
+        <source>⏳ Checking password...</source>
+        <translation>⏳ પાસવર્ડ તપાસી રહ્યા છીએ...</translation>
+    </message>
+</context>
+<context>
+    <name>MainPage</name>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="117"/>
+        <source>🧵 Yogi Fashion</source>
+        <translation>🧵 યોગી ફેશન</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="119"/>
+        <source>Home</source>
+        <translation>હોમ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="120"/>
+        <source>Party Details</source>
+        <translation>પાર્ટી વિગતો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="121"/>
+        <source>Order Details</source>
+        <translation>ઓર્ડર વિગતો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="122"/>
+        <source>Supplier Details</source>
+        <translation>સપ્લાયર વિગતો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="123"/>
+        <source>Material Details</source>
+        <translation>માલ વિગતો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="124"/>
+        <source>Employee Details</source>
+        <translation>કર્મચારી વિગતો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="125"/>
+        <source>Expense Details</source>
+        <translation>ખર્ચ વિગતો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="129"/>
+        <source>🔙 Back</source>
+        <translation>🔙 પાછા</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="130"/>
+        <source>📌 Select an option from the menu</source>
+        <translation>📌 મેનુમાંથી વિકલ્પ પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="159"/>
+        <source>📄 {0} Page Opened</source>
+        <translation>📄 {0} પેજ ખુલ્યું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="174"/>
+        <source>🌞 Light Mode</source>
+        <translation>🌞 લાઇટ મોડ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="174"/>
+        <source>🌙 Dark Mode</source>
+        <translation>🌙 ડાર્ક મોડ</translation>
+    </message>
+</context>
+<context>
+    <name>MaterialPage</name>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Description:</source>
+        <translation>વર્ણન:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Embroidery Type:</source>
+        <translation>ભરતકામનો પ્રકાર:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Price:</source>
+        <translation>કિંમત:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Stock:</source>
+        <translation>સ્ટોક:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Add Product</source>
+        <translation>ઉત્પાદન ઉમેરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="106"/>
+        <source>Show only embroidery type… (Enter)</source>
+        <translation>ફક્ત આ ભરતકામ પ્રકાર બતાવો… (Enter)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Design ID</source>
+        <translation>ડિઝાઇન આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Description</source>
+        <translation>વર્ણન</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Type</source>
+        <translation>પ્રકાર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Price</source>
+        <translation>કિંમત</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Stock</source>
+        <translation>સ્ટોક</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="107"/>
+        <source>Export Stock Movements</source>
+        <translation>સ્ટોક હેરફેર નિકાસ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Product added</source>
+        <translation>ઉત્પાદન ઉમેરાયું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="70"/>
+        <source>Price and Stock must be numbers</source>
+        <translation>કિંમત અને સ્ટોક સંખ્યા હોવા જોઈએ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Failed to add product: {0}</source>
+        <translation>ઉત્પાદન ઉમેરી શકાયું નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Product updated</source>
+        <translation>ઉત્પાદન અપડેટ થયું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Failed to update product: {0}</source>
+        <translation>ઉત્પાદન અપડેટ થઈ શક્યું નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Select a product to update</source>
+        <translation>અપડેટ કરવા માટે ઉત્પાદન પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Product deleted</source>
+        <translation>ઉત્પાદન કાઢી નાખ્યું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Failed to delete product: {0}</source>
+        <translation>ઉત્પાદન કાઢી શકાયું નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Select a product to delete</source>
+        <translation>કાઢવા માટે ઉત્પાદન પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="72"/>
+        <source>Stock cannot be negative</source>
+        <translation>સ્ટોક ઋણ ન હોઈ શકે</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="53"/>
+        <source>Database error: {0}</source>
+        <translation>ડેટાબેઝ ભૂલ: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="80"/>
+        <source>Reorder point must be a whole number</source>
+        <translation>ફરી ઓર્ડર સ્તર પૂર્ણ સંખ્યા હોવી જોઈએ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="82"/>
+        <source>Reorder point cannot be negative</source>
+        <translation>ફરી ઓર્ડર સ્તર ઋણ ન હોઈ શકે</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Reorder Point:</source>
+        <translation>ફરી ઓર્ડર સ્તર:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Supplier:</source>
+        <translation>સપ્લાયર:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Reorder Point</source>
+        <translation>ફરી ઓર્ડર સ્તર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="104"/>
+        <source>Optional; alerts at or below this stock</source>
+        <translation>વૈકલ્પિક; આ સ્ટોક કે ઓછા પર સૂચના</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="105"/>
+        <source>No supplier</source>
+        <translation>કોઈ સપ્લાયર નહીં</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="76"/>
+        <source>GST rate must be a percentage from 0 to 100</source>
+        <translation>જીએસટી દર 0 થી 100 સુધીની ટકાવારી હોવી જોઈએ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>GST %:</source>
+        <translation>જીએસટી %:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>GST %</source>
+        <translation>જીએસટી %</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="103"/>
+        <source>Optional; e.g. 5, 12 or 18</source>
+        <translation>વૈકલ્પિક; દા.ત. 5, 12 કે 18</translation>
+    </message>
+</context>
+<context>
+    <name>OrderPage</name>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="122"/>
+        <source>📦 Orders</source>
+        <translation>📦 ઓર્ડર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="123"/>
+        <source>Client contact number</source>
+        <translation>ક્લાયન્ટનો સંપર્ક નંબર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="125"/>
+        <source>YYYY-MM-DD</source>
+        <translation>YYYY-MM-DD</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Client Contact:</source>
+        <translation>ક્લાયન્ટ સંપર્ક:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Quantity:</source>
+        <translation>જથ્થો:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Status:</source>
+        <translation>સ્થિતિ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Date:</source>
+        <translation>તારીખ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="132"/>
+        <source>Place Order</source>
+        <translation>ઓર્ડર આપો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="136"/>
+        <source>Pending</source>
+        <translation>બાકી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="136"/>
+        <source>Delivered</source>
+        <translation>પહોંચાડ્યું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="136"/>
+        <source>Paid</source>
+        <translation>ચૂકવાયું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="140"/>
+        <source>All Statuses</source>
+        <translation>બધી સ્થિતિઓ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Order ID</source>
+        <translation>ઓર્ડર આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Client ID</source>
+        <translation>ક્લાયન્ટ આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Design ID</source>
+        <translation>ડિઝાઇન આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Quantity</source>
+        <translation>જથ્થો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Status</source>
+        <translation>સ્થિતિ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Date</source>
+        <translation>તારીખ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Total (₹)</source>
+        <translation>કુલ (₹)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>GST (₹)</source>
+        <translation>જીએસટી (₹)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="144"/>
+        <source>Set Status of Selected</source>
+        <translation>પસંદ કરેલાની સ્થિતિ બદલો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="145"/>
+        <source>Delete Selected</source>
+        <translation>પસંદ કરેલું કાઢી નાખો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="146"/>
+        <source>Export</source>
+        <translation>નિકાસ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="147"/>
+        <source>Invoice for Selected</source>
+        <translation>પસંદ કરેલાનું બિલ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="148"/>
+        <source>Invoices for Date</source>
+        <translation>તારીખનાં બિલ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="300"/>
+        <source>Error</source>
+        <translation>ભૂલ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="191"/>
+        <source>Database error: {0}</source>
+        <translation>ડેટાબેઝ ભૂલ: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="286"/>
+        <source>Date must be YYYY-MM-DD</source>
+        <translation>તારીખ YYYY-MM-DD માં હોવી જોઈએ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="194"/>
+        <source>No client with contact {0}</source>
+        <translation>સંપર્ક {0} વાળો કોઈ ક્લાયન્ટ નથી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="217"/>
+        <source>Failed to place order: {0}</source>
+        <translation>ઓર્ડર આપી શકાયો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="220"/>
+        <source>✅ Order placed: {0} × {1} = ₹{2} (GST ₹{3})</source>
+        <translation>✅ ઓર્ડર અપાયો: {0} × {1} = ₹{2} (જીએસટી ₹{3})</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="296"/>
+        <source>Success</source>
+        <translation>સફળ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="269"/>
+        <source>Order status updated</source>
+        <translation>ઓર્ડરની સ્થિતિ અપડેટ થઈ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="271"/>
+        <source>Failed to update order: {0}</source>
+        <translation>ઓર્ડર અપડેટ થઈ શક્યો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="273"/>
+        <source>Select an order to update</source>
+        <translation>અપડેટ કરવા માટે ઓર્ડર પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="280"/>
+        <source>Select an order to invoice</source>
+        <translation>બિલ માટે ઓર્ડર પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="296"/>
+        <source>Order deleted and stock returned</source>
+        <translation>ઓર્ડર કાઢી નાખ્યો અને સ્ટોક પાછો આવ્યો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="298"/>
+        <source>Failed to delete order: {0}</source>
+        <translation>ઓર્ડર કાઢી શકાયો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="300"/>
+        <source>Select an order to delete</source>
+        <translation>કાઢવા માટે ઓર્ડર પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="124"/>
+        <source>Description or design ID</source>
+        <translation>વર્ણન કે ડિઝાઇન આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Design:</source>
+        <translation>ડિઝાઇન:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="133"/>
+        <source>Add to Batch</source>
+        <translation>બેચમાં ઉમેરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="134"/>
+        <source>Place Batch</source>
+        <translation>બેચના ઓર્ડર આપો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="135"/>
+        <source>Remove from Batch</source>
+        <translation>બેચમાંથી દૂર કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="184"/>
+        <source>Client contact, design and date are required</source>
+        <translation>ગ્રાહક સંપર્ક, ડિઝાઇન અને તારીખ જરૂરી છે</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="229"/>
+        <source>{0}: {1} × {2}</source>
+        <translation>{0}: {1} × {2}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="243"/>
+        <source>Add orders to the batch first</source>
+        <translation>પહેલાં બેચમાં ઓર્ડર ઉમેરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="252"/>
+        <source>Failed to place orders: {0}</source>
+        <translation>ઓર્ડર આપવામાં નિષ્ફળ: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="260"/>
+        <source>✅ {0} order(s) placed, {1} left in the batch</source>
+        <translation>✅ {0} ઓર્ડર અપાયા, {1} બેચમાં બાકી</translation>
+    </message>
+</context>
+<context>
+    <name>PartyPage</name>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="131"/>
+        <source>Name:</source>
+        <translation>નામ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="131"/>
+        <source>Contact:</source>
+        <translation>સંપર્ક:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="131"/>
+        <source>Address:</source>
+        <translation>સરનામું:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="135"/>
+        <source>Add Client</source>
+        <translation>ક્લાયન્ટ ઉમેરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="140"/>
+        <source>Name</source>
+        <translation>નામ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="140"/>
+        <source>Contact</source>
+        <translation>સંપર્ક</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="140"/>
+        <source>Address</source>
+        <translation>સરનામું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="138"/>
+        <source>Import from File</source>
+        <translation>ફાઇલમાંથી આયાત કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="139"/>
+        <source>Export</source>
+        <translation>નિકાસ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="301"/>
+        <source>Error</source>
+        <translation>ભૂલ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="271"/>
+        <source>Database error: {0}</source>
+        <translation>ડેટાબેઝ ભૂલ: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="239"/>
+        <source>Success</source>
+        <translation>સફળ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="193"/>
+        <source>Client added</source>
+        <translation>ક્લાયન્ટ ઉમેરાયું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="195"/>
+        <source>Failed to add client: {0}</source>
+        <translation>ક્લાયન્ટ ઉમેરી શકાયું નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="225"/>
+        <source>Client updated</source>
+        <translation>ક્લાયન્ટ અપડેટ થયું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="227"/>
+        <source>Failed to update client: {0}</source>
+        <translation>ક્લાયન્ટ અપડેટ થઈ શક્યું નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="200"/>
+        <source>Select a client to update</source>
+        <translation>અપડેટ કરવા માટે ક્લાયન્ટ પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="128"/>
+        <source>Party Details</source>
+        <translation>પાર્ટી વિગતો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="129"/>
+        <source>Search by Name or Contact</source>
+        <translation>નામ અથવા સંપર્ક દ્વારા શોધો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="130"/>
+        <source>🔍 Search</source>
+        <translation>🔍 શોધો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="136"/>
+        <source>Update Client</source>
+        <translation>ક્લાયન્ટ અપડેટ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="141"/>
+        <source>Payment amount</source>
+        <translation>ચુકવણી રકમ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="142"/>
+        <source>Record Payment</source>
+        <translation>ચુકવણી નોંધો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="143"/>
+        <source>Kind</source>
+        <translation>પ્રકાર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="143"/>
+        <source>Date</source>
+        <translation>તારીખ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="143"/>
+        <source>Amount</source>
+        <translation>રકમ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="143"/>
+        <source>Balance</source>
+        <translation>બાકી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="208"/>
+        <source>Name, Contact, and Address are required</source>
+        <translation>નામ, સંપર્ક, અને સરનામું આવશ્યક છે</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="212"/>
+        <source>Invalid contact number</source>
+        <translation>અમાન્ય સંપર્ક નંબર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="220"/>
+        <source>Contact number already exists</source>
+        <translation>સંપર્ક નંબર પહેલેથી અસ્તિત્વમાં છે</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="280"/>
+        <source>Select a client to see Udhar</source>
+        <translation>ઉધાર જોવા માટે ક્લાયન્ટ પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="284"/>
+        <source>Udhar: ₹{0}  ({1} days)</source>
+        <translation>ઉધાર: ₹{0}  ({1} દિવસ)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="288"/>
+        <source>Select a client for the payment</source>
+        <translation>ચુકવણી માટે ક્લાયન્ટ પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="293"/>
+        <source>Invalid amount</source>
+        <translation>અમાન્ય રકમ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="301"/>
+        <source>Failed to record payment: {0}</source>
+        <translation>ચુકવણી નોંધી શકાઈ નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="137"/>
+        <source>Delete Selected</source>
+        <translation>પસંદ કરેલું કાઢી નાખો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="232"/>
+        <source>Select a client to delete</source>
+        <translation>કાઢવા માટે ક્લાયન્ટ પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="239"/>
+        <source>Client deleted</source>
+        <translation>ક્લાયન્ટ કાઢી નાખ્યું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="241"/>
+        <source>Failed to delete client: {0}</source>
+        <translation>ક્લાયન્ટ કાઢી શકાયું નહીં: {0}</translation>
+    </message>
+</context>
+<context>
+    <name>RegisterPage</name>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="82"/>
+        <source>Error</source>
+        <translation>ભૂલ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="60"/>
+        <source>Failed to register: {0}</source>
+        <translation>નોંધણી થઈ શકી નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="64"/>
+        <source>🧵 Yogi Fashion Register</source>
+        <translation>🧵 યોગી ફેશન નોંધણી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="65"/>
+        <source>Username:</source>
+        <translation>વપરાશકર્તા નામ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="65"/>
+        <source>Password:</source>
+        <translation>પાસવર્ડ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="65"/>
+        <source>Confirm Password:</source>
+        <translation>પાસવર્ડની પુષ્ટિ કરો:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="69"/>
+        <source>📝 Register</source>
+        <translation>📝 નોંધણી કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="70"/>
+        <source>🔐 Go to Login</source>
+        <translation>🔐 લૉગિન પર જાઓ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="78"/>
+        <source>All fields are required</source>
+        <translation>બધી વિગતો આવશ્યક છે</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="82"/>
+        <source>Passwords do not match</source>
+        <translation>પાસવર્ડ મેળ ખાતા નથી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="89"/>
+        <source>⏳ Creating account...</source>
+        <translation>⏳ ખાતું બનાવી રહ્યા છીએ...</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="92"/>
+        <source>Success</source>
+        <translation>સફળ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="92"/>
+        <source>Registration successful! Please login.</source>
+        <translation>નોંધણી સફળ! કૃપા કરીને લૉગિન કરો.</translation>
+    </message>
+</context>
+<context>
+    <name>SupplierPage</name>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="101"/>
+        <source>🚚 Suppliers &amp; Purchase Orders</source>
+        <translation>🚚 સપ્લાયર અને ખરીદ ઓર્ડર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="102"/>
+        <source>Name:</source>
+        <translation>નામ:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="102"/>
+        <source>Contact:</source>
+        <translation>સંપર્ક:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="102"/>
+        <source>Address:</source>
+        <translation>સરનામું:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="106"/>
+        <source>Add Supplier</source>
+        <translation>સપ્લાયર ઉમેરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="107"/>
+        <source>Name</source>
+        <translation>નામ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="107"/>
+        <source>Contact</source>
+        <translation>સંપર્ક</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="107"/>
+        <source>Address</source>
+        <translation>સરનામું</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Design ID</source>
+        <translation>ડિઝાઇન આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="109"/>
+        <source>Create Purchase Order</source>
+        <translation>ખરીદ ઓર્ડર બનાવો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>PO ID</source>
+        <translation>ખરીદ ઓર્ડર આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Supplier ID</source>
+        <translation>સપ્લાયર આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Quantity</source>
+        <translation>જથ્થો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Date</source>
+        <translation>તારીખ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Status</source>
+        <translation>સ્થિતિ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="112"/>
+        <source>Show More</source>
+        <translation>વધુ બતાવો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="113"/>
+        <source>Approve Selected</source>
+        <translation>પસંદ કરેલા મંજૂર કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="114"/>
+        <source>Receive Selected</source>
+        <translation>પસંદ કરેલા મેળવો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="233"/>
+        <source>Error</source>
+        <translation>ભૂલ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="153"/>
+        <source>Database error: {0}</source>
+        <translation>ડેટાબેઝ ભૂલ: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="228"/>
+        <source>Success</source>
+        <translation>સફળ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="180"/>
+        <source>Supplier added</source>
+        <translation>સપ્લાયર ઉમેરાયો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="182"/>
+        <source>Failed to add supplier: {0}</source>
+        <translation>સપ્લાયર ઉમેરી શકાયો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="184"/>
+        <source>All fields are required</source>
+        <translation>બધી વિગતો આવશ્યક છે</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="190"/>
+        <source>Select a supplier first</source>
+        <translation>પહેલાં સપ્લાયર પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="202"/>
+        <source>Failed to create purchase order: {0}</source>
+        <translation>ખરીદ ઓર્ડર બની શક્યો નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="207"/>
+        <source>Select purchase orders to approve</source>
+        <translation>મંજૂર કરવા માટે ખરીદ ઓર્ડર પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="214"/>
+        <source>{0} purchase order(s) approved</source>
+        <translation>{0} ખરીદ ઓર્ડર મંજૂર</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="218"/>
+        <source>Failed to approve: {0}</source>
+        <translation>મંજૂર થઈ શક્યું નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="224"/>
+        <source>Select purchase orders to receive</source>
+        <translation>મેળવવા માટે ખરીદ ઓર્ડર પસંદ કરો</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="228"/>
+        <source>{0} purchase order(s) received into stock</source>
+        <translation>{0} ખરીદ ઓર્ડર સ્ટોકમાં મેળવ્યા</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="233"/>
+        <source>Failed to receive: {0}</source>
+        <translation>મેળવી શકાયું નહીં: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="108"/>
+        <source>Description or design ID</source>
+        <translation>વર્ણન કે ડિઝાઇન આઈડી</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="193"/>
+        <source>Choose a design</source>
+        <translation>એક ડિઝાઇન પસંદ કરો</translation>
+    </message>
+</context>
+<context>
+    <name>WelcomePage</name>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="196"/>
+        <source>✨ Welcome to Yogi Fashion ✨</source>
+        <translation>✨ યોગી ફેશનમાં સ્વાગત છે ✨</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="197"/>
+        <source>🚀 Enter</source>
+        <translation>🚀 પ્રવેશ કરો</translation>
+    </message>
+</context>
+</TS>
@@ -0,0 +1,1315 @@
+<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE TS>
+<TS version="2.1" language="hi">
+<context>
+    <name>App</name>
+    <message>
+        <location filename="../yogi_fashion/app.py" line="33"/>
+        <source>Database upgrade failed</source>
+        <translation>डेटाबेस अपग्रेड विफल</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/app.py" line="33"/>
+        <source>The database could not be upgraded, so the app cannot start.
+
+{0}</source>
+        <translation>डेटाबेस अपग्रेड नहीं हो सका, इसलिए ऐप शुरू नहीं हो सकता।
+
+{0}</translation>
+    </message>
+</context>
+<context>
+    <name>CrudPage</name>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="115"/>
+        <source>Update Selected</source>
+        <translation>चयनित अपडेट करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="116"/>
+        <source>Delete Selected</source>
+        <translation>चयनित हटाएँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="117"/>
+        <source>Import from File</source>
+        <translation>फ़ाइल से आयात करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="118"/>
+        <source>Export</source>
+        <translation>निर्यात करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="134"/>
+        <source>Error</source>
+        <translation>त्रुटि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="137"/>
+        <source>Success</source>
+        <translation>सफल</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="154"/>
+        <source>Database error: {0}</source>
+        <translation>डेटाबेस त्रुटि: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/crud_page.py" line="160"/>
+        <source>All fields are required</source>
+        <translation>सभी फ़ील्ड आवश्यक हैं</translation>
+    </message>
+</context>
+<context>
+    <name>Dashboard</name>
+    <message>
+        <location filename="../dashboard.py" line="53"/>
+        <source>⚠️ {0}: {1} left (reorder at {2}), purchase order drafted</source>
+        <translation>⚠️ {0}: {1} बचे (पुनः ऑर्डर {2} पर), खरीद ऑर्डर का मसौदा बना</translation>
+    </message>
+    <message>
+        <location filename="../dashboard.py" line="55"/>
+        <source>⚠️ {0}: {1} left (reorder at {2}), no supplier set</source>
+        <translation>⚠️ {0}: {1} बचे (पुनः ऑर्डर {2} पर), कोई सप्लायर तय नहीं</translation>
+    </message>
+    <message>
+        <location filename="../dashboard.py" line="58"/>
+        <source>📦 {0} order(s) awaiting payment</source>
+        <translation>📦 {0} ऑर्डर भुगतान की प्रतीक्षा में</translation>
+    </message>
+    <message>
+        <location filename="../dashboard.py" line="59"/>
+        <source>No new notifications</source>
+        <translation>कोई नई सूचना नहीं</translation>
+    </message>
+</context>
+<context>
+    <name>EmployeePage</name>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Name:</source>
+        <translation>नाम:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Contact:</source>
+        <translation>संपर्क:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Role:</source>
+        <translation>भूमिका:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Add Employee</source>
+        <translation>कर्मचारी जोड़ें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="33"/>
+        <source>Show only role… (Enter)</source>
+        <translation>केवल यह भूमिका दिखाएँ… (Enter)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>ID</source>
+        <translation>आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Name</source>
+        <translation>नाम</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Contact</source>
+        <translation>संपर्क</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Role</source>
+        <translation>भूमिका</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Employee added</source>
+        <translation>कर्मचारी जोड़ा गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Failed to add employee: {0}</source>
+        <translation>कर्मचारी नहीं जोड़ा जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Employee updated</source>
+        <translation>कर्मचारी अपडेट हुआ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Failed to update employee: {0}</source>
+        <translation>कर्मचारी अपडेट नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Select an employee to update</source>
+        <translation>अपडेट करने के लिए कर्मचारी चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Employee deleted</source>
+        <translation>कर्मचारी हटाया गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Failed to delete employee: {0}</source>
+        <translation>कर्मचारी नहीं हटाया जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/employee_page.py" line="19"/>
+        <source>Select an employee to delete</source>
+        <translation>हटाने के लिए कर्मचारी चुनें</translation>
+    </message>
+</context>
+<context>
+    <name>ExpensePage</name>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Description:</source>
+        <translation>विवरण:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Amount:</source>
+        <translation>राशि:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Date:</source>
+        <translation>तारीख:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Add Expense</source>
+        <translation>खर्च जोड़ें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="54"/>
+        <source>YYYY-MM-DD</source>
+        <translation>YYYY-MM-DD</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="55"/>
+        <source>From YYYY-MM-DD</source>
+        <translation>से YYYY-MM-DD</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="56"/>
+        <source>To YYYY-MM-DD</source>
+        <translation>तक YYYY-MM-DD</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="57"/>
+        <source>Filter</source>
+        <translation>फ़िल्टर</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>ID</source>
+        <translation>आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Description</source>
+        <translation>विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Amount</source>
+        <translation>राशि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Date</source>
+        <translation>तारीख</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="27"/>
+        <source>Dates must be YYYY-MM-DD</source>
+        <translation>तारीखें YYYY-MM-DD में होनी चाहिए</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Expense added</source>
+        <translation>खर्च जोड़ा गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="36"/>
+        <source>Amount must be a number</source>
+        <translation>राशि एक संख्या होनी चाहिए</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Failed to add expense: {0}</source>
+        <translation>खर्च नहीं जोड़ा जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Expense updated</source>
+        <translation>खर्च अपडेट हुआ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Failed to update expense: {0}</source>
+        <translation>खर्च अपडेट नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Select an expense to update</source>
+        <translation>अपडेट करने के लिए खर्च चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Expense deleted</source>
+        <translation>खर्च हटाया गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Failed to delete expense: {0}</source>
+        <translation>खर्च नहीं हटाया जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/expense_page.py" line="40"/>
+        <source>Select an expense to delete</source>
+        <translation>हटाने के लिए खर्च चुनें</translation>
+    </message>
+</context>
+<context>
+    <name>HomePage</name>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="74"/>
+        <source>📊 Dashboard</source>
+        <translation>📊 डैशबोर्ड</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="75"/>
+        <source>💰 Total Balance</source>
+        <translation>💰 कुल शेष</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="76"/>
+        <source>💸 Total Expenses</source>
+        <translation>💸 कुल खर्च</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="77"/>
+        <source>👤 Total Employees</source>
+        <translation>👤 कुल कर्मचारी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="78"/>
+        <source>🧵 Total Machines</source>
+        <translation>🧵 कुल मशीनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="79"/>
+        <source>💳 Total Udhar</source>
+        <translation>💳 कुल उधार</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="80"/>
+        <source>🔔 Recent Notifications</source>
+        <translation>🔔 हाल की सूचनाएँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/home.py" line="84"/>
+        <source>No new notifications</source>
+        <translation>कोई नई सूचना नहीं</translation>
+    </message>
+</context>
+<context>
+    <name>LoginPage</name>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="143"/>
+        <source>Error</source>
+        <translation>त्रुटि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="143"/>
+        <source>Failed to login: {0}</source>
+        <translation>लॉगिन नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="147"/>
+        <source>🧵 Yogi Fashion Login</source>
+        <translation>🧵 योगी फ़ैशन लॉगिन</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="148"/>
+        <source>Username:</source>
+        <translation>उपयोगकर्ता नाम:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="148"/>
+        <source>Password:</source>
+        <translation>पासवर्ड:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="151"/>
+        <source>🔐 Login</source>
+        <translation>🔐 लॉगिन</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="152"/>
+        <source>📝 Go to Register</source>
+        <translation>📝 रजिस्टर पर जाएँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="161"/>
+        <source>⏳ Checking password...</source>
+        <translation>⏳ पासवर्ड जाँचा जा रहा है...</translation>
+    </message>
+</context>
+<context>
+    <name>MainPage</name>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="117"/>
+        <source>🧵 Yogi Fashion</source>
+        <translation>🧵 योगी फ़ैशन</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="119"/>
+        <source>Home</source>
+        <translation>होम</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="120"/>
+        <source>Party Details</source>
+        <translation>पार्टी विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="121"/>
+        <source>Order Details</source>
+        <translation>ऑर्डर विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="122"/>
+        <source>Supplier Details</source>
+        <translation>सप्लायर विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="123"/>
+        <source>Material Details</source>
+        <translation>माल विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="124"/>
+        <source>Employee Details</source>
+        <translation>कर्मचारी विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="125"/>
+        <source>Expense Details</source>
+        <translation>खर्च विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="129"/>
+        <source>🔙 Back</source>
+        <translation>🔙 वापस</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="130"/>
+        <source>📌 Select an option from the menu</source>
+        <translation>📌 मेनू से कोई विकल्प चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="159"/>
+        <source>📄 {0} Page Opened</source>
+        <translation>📄 {0} पेज खुला</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="174"/>
+        <source>🌞 Light Mode</source>
+        <translation>🌞 लाइट मोड</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/main_page.py" line="174"/>
+        <source>🌙 Dark Mode</source>
+        <translation>🌙 डार्क मोड</translation>
+    </message>
+</context>
+<context>
+    <name>MaterialPage</name>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Description:</source>
+        <translation>विवरण:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Embroidery Type:</source>
+        <translation>कढ़ाई का प्रकार:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Price:</source>
+        <translation>कीमत:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Stock:</source>
+        <translation>स्टॉक:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Add Product</source>
+        <translation>उत्पाद जोड़ें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="106"/>
+        <source>Show only embroidery type… (Enter)</source>
+        <translation>केवल यह कढ़ाई प्रकार दिखाएँ… (Enter)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Design ID</source>
+        <translation>डिज़ाइन आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Description</source>
+        <translation>विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Type</source>
+        <translation>प्रकार</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Price</source>
+        <translation>कीमत</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Stock</source>
+        <translation>स्टॉक</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="107"/>
+        <source>Export Stock Movements</source>
+        <translation>स्टॉक आवाजाही निर्यात करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Product added</source>
+        <translation>उत्पाद जोड़ा गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="70"/>
+        <source>Price and Stock must be numbers</source>
+        <translation>कीमत और स्टॉक संख्याएँ होनी चाहिए</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Failed to add product: {0}</source>
+        <translation>उत्पाद नहीं जोड़ा जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Product updated</source>
+        <translation>उत्पाद अपडेट हुआ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Failed to update product: {0}</source>
+        <translation>उत्पाद अपडेट नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Select a product to update</source>
+        <translation>अपडेट करने के लिए उत्पाद चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Product deleted</source>
+        <translation>उत्पाद हटाया गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Failed to delete product: {0}</source>
+        <translation>उत्पाद नहीं हटाया जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Select a product to delete</source>
+        <translation>हटाने के लिए उत्पाद चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="72"/>
+        <source>Stock cannot be negative</source>
+        <translation>स्टॉक ऋणात्मक नहीं हो सकता</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="53"/>
+        <source>Database error: {0}</source>
+        <translation>डेटाबेस त्रुटि: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="80"/>
+        <source>Reorder point must be a whole number</source>
+        <translation>पुनः ऑर्डर स्तर पूर्ण संख्या होना चाहिए</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="82"/>
+        <source>Reorder point cannot be negative</source>
+        <translation>पुनः ऑर्डर स्तर ऋणात्मक नहीं हो सकता</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Reorder Point:</source>
+        <translation>पुनः ऑर्डर स्तर:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Supplier:</source>
+        <translation>आपूर्तिकर्ता:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>Reorder Point</source>
+        <translation>पुनः ऑर्डर स्तर</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="104"/>
+        <source>Optional; alerts at or below this stock</source>
+        <translation>वैकल्पिक; इस स्टॉक या कम पर सूचना</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="105"/>
+        <source>No supplier</source>
+        <translation>कोई आपूर्तिकर्ता नहीं</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="76"/>
+        <source>GST rate must be a percentage from 0 to 100</source>
+        <translation>जीएसटी दर 0 से 100 तक का प्रतिशत होनी चाहिए</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>GST %:</source>
+        <translation>जीएसटी %:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="87"/>
+        <source>GST %</source>
+        <translation>जीएसटी %</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/material_page.py" line="103"/>
+        <source>Optional; e.g. 5, 12 or 18</source>
+        <translation>वैकल्पिक; जैसे 5, 12 या 18</translation>
+    </message>
+</context>
+<context>
+    <name>OrderPage</name>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="122"/>
+        <source>📦 Orders</source>
+        <translation>📦 ऑर्डर</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="123"/>
+        <source>Client contact number</source>
+        <translation>क्लाइंट का संपर्क नंबर</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="125"/>
+        <source>YYYY-MM-DD</source>
+        <translation>YYYY-MM-DD</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Client Contact:</source>
+        <translation>क्लाइंट संपर्क:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Quantity:</source>
+        <translation>मात्रा:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Status:</source>
+        <translation>स्थिति:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Date:</source>
+        <translation>तारीख:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="132"/>
+        <source>Place Order</source>
+        <translation>ऑर्डर दें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="136"/>
+        <source>Pending</source>
+        <translation>बाकी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="136"/>
+        <source>Delivered</source>
+        <translation>पहुँचा दिया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="136"/>
+        <source>Paid</source>
+        <translation>भुगतान हुआ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="140"/>
+        <source>All Statuses</source>
+        <translation>सभी स्थितियाँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Order ID</source>
+        <translation>ऑर्डर आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Client ID</source>
+        <translation>क्लाइंट आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Design ID</source>
+        <translation>डिज़ाइन आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Quantity</source>
+        <translation>मात्रा</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Status</source>
+        <translation>स्थिति</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Date</source>
+        <translation>तारीख</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>Total (₹)</source>
+        <translation>कुल (₹)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="141"/>
+        <source>GST (₹)</source>
+        <translation>जीएसटी (₹)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="144"/>
+        <source>Set Status of Selected</source>
+        <translation>चयनित की स्थिति बदलें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="145"/>
+        <source>Delete Selected</source>
+        <translation>चयनित हटाएँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="146"/>
+        <source>Export</source>
+        <translation>निर्यात करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="147"/>
+        <source>Invoice for Selected</source>
+        <translation>चयनित का बिल</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="148"/>
+        <source>Invoices for Date</source>
+        <translation>तारीख के बिल</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="300"/>
+        <source>Error</source>
+        <translation>त्रुटि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="191"/>
+        <source>Database error: {0}</source>
+        <translation>डेटाबेस त्रुटि: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="286"/>
+        <source>Date must be YYYY-MM-DD</source>
+        <translation>तारीख YYYY-MM-DD में होनी चाहिए</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="194"/>
+        <source>No client with contact {0}</source>
+        <translation>संपर्क {0} वाला कोई क्लाइंट नहीं</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="217"/>
+        <source>Failed to place order: {0}</source>
+        <translation>ऑर्डर नहीं दिया जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="220"/>
+        <source>✅ Order placed: {0} × {1} = ₹{2} (GST ₹{3})</source>
+        <translation>✅ ऑर्डर दिया गया: {0} × {1} = ₹{2} (जीएसटी ₹{3})</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="296"/>
+        <source>Success</source>
+        <translation>सफल</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="269"/>
+        <source>Order status updated</source>
+        <translation>ऑर्डर की स्थिति अपडेट हुई</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="271"/>
+        <source>Failed to update order: {0}</source>
+        <translation>ऑर्डर अपडेट नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="273"/>
+        <source>Select an order to update</source>
+        <translation>अपडेट करने के लिए ऑर्डर चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="280"/>
+        <source>Select an order to invoice</source>
+        <translation>बिल के लिए ऑर्डर चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="296"/>
+        <source>Order deleted and stock returned</source>
+        <translation>ऑर्डर हटाया गया और स्टॉक वापस आया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="298"/>
+        <source>Failed to delete order: {0}</source>
+        <translation>ऑर्डर नहीं हटाया जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="300"/>
+        <source>Select an order to delete</source>
+        <translation>हटाने के लिए ऑर्डर चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="124"/>
+        <source>Description or design ID</source>
+        <translation>विवरण या डिज़ाइन आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="126"/>
+        <source>Design:</source>
+        <translation>डिज़ाइन:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="133"/>
+        <source>Add to Batch</source>
+        <translation>बैच में जोड़ें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="134"/>
+        <source>Place Batch</source>
+        <translation>बैच के ऑर्डर दें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="135"/>
+        <source>Remove from Batch</source>
+        <translation>बैच से हटाएं</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="184"/>
+        <source>Client contact, design and date are required</source>
+        <translation>ग्राहक संपर्क, डिज़ाइन और तारीख आवश्यक हैं</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="229"/>
+        <source>{0}: {1} × {2}</source>
+        <translation>{0}: {1} × {2}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="243"/>
+        <source>Add orders to the batch first</source>
+        <translation>पहले बैच में ऑर्डर जोड़ें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="252"/>
+        <source>Failed to place orders: {0}</source>
+        <translation>ऑर्डर देने में विफल: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/order_page.py" line="260"/>
+        <source>✅ {0} order(s) placed, {1} left in the batch</source>
+        <translation>✅ {0} ऑर्डर दिए गए, {1} बैच में बाकी</translation>
+    </message>
+</context>
+<context>
+    <name>PartyPage</name>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="131"/>
+        <source>Name:</source>
+        <translation>नाम:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="131"/>
+        <source>Contact:</source>
+        <translation>संपर्क:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="131"/>
+        <source>Address:</source>
+        <translation>पता:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="135"/>
+        <source>Add Client</source>
+        <translation>क्लाइंट जोड़ें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="140"/>
+        <source>Name</source>
+        <translation>नाम</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="140"/>
+        <source>Contact</source>
+        <translation>संपर्क</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="140"/>
+        <source>Address</source>
+        <translation>पता</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="138"/>
+        <source>Import from File</source>
+        <translation>फ़ाइल से आयात करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="139"/>
+        <source>Export</source>
+        <translation>निर्यात करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="301"/>
+        <source>Error</source>
+        <translation>त्रुटि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="271"/>
+        <source>Database error: {0}</source>
+        <translation>डेटाबेस त्रुटि: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="239"/>
+        <source>Success</source>
+        <translation>सफल</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="193"/>
+        <source>Client added</source>
+        <translation>क्लाइंट जोड़ा गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="195"/>
+        <source>Failed to add client: {0}</source>
+        <translation>क्लाइंट नहीं जोड़ा जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="225"/>
+        <source>Client updated</source>
+        <translation>क्लाइंट अपडेट हुआ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="227"/>
+        <source>Failed to update client: {0}</source>
+        <translation>क्लाइंट अपडेट नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="200"/>
+        <source>Select a client to update</source>
+        <translation>अपडेट करने के लिए क्लाइंट चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="128"/>
+        <source>Party Details</source>
+        <translation>पार्टी विवरण</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="129"/>
+        <source>Search by Name or Contact</source>
+        <translation>नाम या संपर्क से खोजें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="130"/>
+        <source>🔍 Search</source>
+        <translation>🔍 खोजें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="136"/>
+        <source>Update Client</source>
+        <translation>क्लाइंट अपडेट करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="141"/>
+        <source>Payment amount</source>
+        <translation>भुगतान राशि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="142"/>
+        <source>Record Payment</source>
+        <translation>भुगतान दर्ज करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="143"/>
+        <source>Kind</source>
+        <translation>प्रकार</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="143"/>
+        <source>Date</source>
+        <translation>तारीख</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="143"/>
+        <source>Amount</source>
+        <translation>राशि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="143"/>
+        <source>Balance</source>
+        <translation>बाकी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="208"/>
+        <source>Name, Contact, and Address are required</source>
+        <translation>नाम, संपर्क और पता आवश्यक हैं</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="212"/>
+        <source>Invalid contact number</source>
+        <translation>अमान्य संपर्क नंबर</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="220"/>
+        <source>Contact number already exists</source>
+        <translation>संपर्क नंबर पहले से मौजूद है</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="280"/>
+        <source>Select a client to see Udhar</source>
+        <translation>उधार देखने के लिए क्लाइंट चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="284"/>
+        <source>Udhar: ₹{0}  ({1} days)</source>
+        <translation>उधार: ₹{0}  ({1} दिन)</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="288"/>
+        <source>Select a client for the payment</source>
+        <translation>भुगतान के लिए क्लाइंट चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="293"/>
+        <source>Invalid amount</source>
+        <translation>अमान्य राशि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="301"/>
+        <source>Failed to record payment: {0}</source>
+        <translation>भुगतान दर्ज नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="137"/>
+        <source>Delete Selected</source>
+        <translation>चयनित हटाएँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="232"/>
+        <source>Select a client to delete</source>
+        <translation>हटाने के लिए क्लाइंट चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="239"/>
+        <source>Client deleted</source>
+        <translation>क्लाइंट हटाया गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/party_page.py" line="241"/>
+        <source>Failed to delete client: {0}</source>
+        <translation>क्लाइंट नहीं हटाया जा सका: {0}</translation>
+    </message>
+</context>
+<context>
+    <name>RegisterPage</name>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="82"/>
+        <source>Error</source>
+        <translation>त्रुटि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="60"/>
+        <source>Failed to register: {0}</source>
+        <translation>रजिस्टर नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="64"/>
+        <source>🧵 Yogi Fashion Register</source>
+        <translation>🧵 योगी फ़ैशन रजिस्टर</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="65"/>
+        <source>Username:</source>
+        <translation>उपयोगकर्ता नाम:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="65"/>
+        <source>Password:</source>
+        <translation>पासवर्ड:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="65"/>
+        <source>Confirm Password:</source>
+        <translation>पासवर्ड की पुष्टि करें:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="69"/>
+        <source>📝 Register</source>
+        <translation>📝 रजिस्टर करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="70"/>
+        <source>🔐 Go to Login</source>
+        <translation>🔐 लॉगिन पर जाएँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="78"/>
+        <source>All fields are required</source>
+        <translation>सभी फ़ील्ड आवश्यक हैं</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="82"/>
+        <source>Passwords do not match</source>
+        <translation>पासवर्ड मेल नहीं खाते</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="89"/>
+        <source>⏳ Creating account...</source>
+        <translation>⏳ खाता बनाया जा रहा है...</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="92"/>
+        <source>Success</source>
+        <translation>सफल</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="92"/>
+        <source>Registration successful! Please login.</source>
+        <translation>रजिस्ट्रेशन सफल! कृपया लॉगिन करें।</translation>
+    </message>
+</context>
+<context>
+    <name>SupplierPage</name>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="101"/>
+        <source>🚚 Suppliers &amp; Purchase Orders</source>
+        <translation>🚚 सप्लायर और खरीद ऑर्डर</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="102"/>
+        <source>Name:</source>
+        <translation>नाम:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="102"/>
+        <source>Contact:</source>
+        <translation>संपर्क:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="102"/>
+        <source>Address:</source>
+        <translation>पता:</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="106"/>
+        <source>Add Supplier</source>
+        <translation>सप्लायर जोड़ें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="107"/>
+        <source>Name</source>
+        <translation>नाम</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="107"/>
+        <source>Contact</source>
+        <translation>संपर्क</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="107"/>
+        <source>Address</source>
+        <translation>पता</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Design ID</source>
+        <translation>डिज़ाइन आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="109"/>
+        <source>Create Purchase Order</source>
+        <translation>खरीद ऑर्डर बनाएँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>PO ID</source>
+        <translation>खरीद ऑर्डर आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Supplier ID</source>
+        <translation>सप्लायर आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Quantity</source>
+        <translation>मात्रा</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Date</source>
+        <translation>तारीख</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="110"/>
+        <source>Status</source>
+        <translation>स्थिति</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="112"/>
+        <source>Show More</source>
+        <translation>और दिखाएँ</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="113"/>
+        <source>Approve Selected</source>
+        <translation>चयनित स्वीकृत करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="114"/>
+        <source>Receive Selected</source>
+        <translation>चयनित प्राप्त करें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="233"/>
+        <source>Error</source>
+        <translation>त्रुटि</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="153"/>
+        <source>Database error: {0}</source>
+        <translation>डेटाबेस त्रुटि: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="228"/>
+        <source>Success</source>
+        <translation>सफल</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="180"/>
+        <source>Supplier added</source>
+        <translation>सप्लायर जोड़ा गया</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="182"/>
+        <source>Failed to add supplier: {0}</source>
+        <translation>सप्लायर नहीं जोड़ा जा सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="184"/>
+        <source>All fields are required</source>
+        <translation>सभी फ़ील्ड आवश्यक हैं</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="190"/>
+        <source>Select a supplier first</source>
+        <translation>पहले सप्लायर चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="202"/>
+        <source>Failed to create purchase order: {0}</source>
+        <translation>खरीद ऑर्डर नहीं बन सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="207"/>
+        <source>Select purchase orders to approve</source>
+        <translation>स्वीकृत करने के लिए खरीद ऑर्डर चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="214"/>
+        <source>{0} purchase order(s) approved</source>
+        <translation>{0} खरीद ऑर्डर स्वीकृत</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="218"/>
+        <source>Failed to approve: {0}</source>
+        <translation>स्वीकृत नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="224"/>
+        <source>Select purchase orders to receive</source>
+        <translation>प्राप्त करने के लिए खरीद ऑर्डर चुनें</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="228"/>
+        <source>{0} purchase order(s) received into stock</source>
+        <translation>{0} खरीद ऑर्डर स्टॉक में प्राप्त</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="233"/>
+        <source>Failed to receive: {0}</source>
+        <translation>प्राप्त नहीं हो सका: {0}</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="108"/>
+        <source>Description or design ID</source>
+        <translation>विवरण या डिज़ाइन आईडी</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/supplier_page.py" line="193"/>
+        <source>Choose a design</source>
+        <translation>एक डिज़ाइन चुनें</translation>
+    </message>
+</context>
+<context>
+    <name>WelcomePage</name>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="196"/>
+        <source>✨ Welcome to Yogi Fashion ✨</source>
+        <translation>✨ योगी फ़ैशन में स्वागत है ✨</translation>
+    </message>
+    <message>
+        <location filename="../yogi_fashion/auth_pages.py" line="197"/>
+        <source>🚀 Enter</source>
+        <translation>🚀 प्रवेश करें</translation>
+    </message>
+</context>
+</TS>
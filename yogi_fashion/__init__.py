@@ -0,0 +1,11 @@
+"""Yogi Fashion, the embroidery workshop's desktop application.
+
+Start it from the repository root with:
+
+    python -m yogi_fashion
+
+Each page has one implementation, in one module of this package; the pages
+over a single table (employees, products, expenses) share CrudPage. The
+data layer and the services the pages use (db, migrations, pricing,
+theme, i18n, alerts, ...) are the top-level modules next to it.
+"""
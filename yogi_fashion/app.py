@@ -0,0 +1,48 @@
+import sys
+from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtWidgets import QApplication, QStackedWidget, QMessageBox
+from db import get_db, Checkpointer
+from migrations import migrate, MigrationError
+from theme import get_theme_service
+from i18n import get_language_service
+from alerts import get_reorder_alerts
+from .auth_pages import RegisterPage, LoginPage, WelcomePage
+from .main_page import MainPage
+
+
+def create_window():
+    """The register, login, welcome and main pages, in that order, in a
+    QStackedWidget showing the register page."""
+    stacked_widget = QStackedWidget()
+    for page in (RegisterPage, LoginPage, WelcomePage, MainPage):
+        stacked_widget.addWidget(page(stacked_widget))
+    stacked_widget.setCurrentIndex(0)
+    return stacked_widget
+
+
+def main(argv=None):
+    """Run the application until its window is closed; returns the exit code."""
+    app = QApplication(sys.argv if argv is None else argv)
+    get_language_service().apply()  # Before any page sets its texts, see i18n.py
+    db = get_db()
+    db.configure()  # WAL journaling, shared by every instance on this file
+    try:
+        migrate(db)  # Bring the schema up to date
+    except MigrationError as e:
+        # The failed step was rolled back; the database is as it was
+        QMessageBox.critical(None, QCoreApplication.translate("App", "Database upgrade failed"),
+                             QCoreApplication.translate("App", "The database could not be upgraded, "
+                                                        "so the app cannot start.\n\n{0}").format(e))
+        db.close()
+        return 1
+    reorder_alerts = get_reorder_alerts()  # Watches stock from here on
+    app.aboutToQuit.connect(reorder_alerts.wait)
+    checkpointer = Checkpointer(db)
+    checkpointer.start()
+    app.aboutToQuit.connect(checkpointer.stop)
+    app.aboutToQuit.connect(db.close)
+    get_theme_service().apply()  # One stylesheet for every page, see theme.py
+
+    window = create_window()
+    window.showMaximized()
+    return app.exec_()
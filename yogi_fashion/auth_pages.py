@@ -0,0 +1,200 @@
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QPushButton, QVBoxLayout, QLineEdit, QMessageBox, QFormLayout
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+from auth import AuthWorker
+from i18n import Retranslatable, set_form_labels
+
+class RegisterPage(Retranslatable, QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+        self.setObjectName("authPage")
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.stacked_widget = stacked_widget
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+        layout.addStretch()
+
+        self.title = QLabel()
+        self.title.setFont(QFont("Arial", 20, QFont.Bold))
+        self.title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title)
+
+        self.form_layout = QFormLayout()
+        self.username_input = QLineEdit()
+        self.password_input = QLineEdit()
+        self.password_input.setEchoMode(QLineEdit.Password)
+        self.confirm_password_input = QLineEdit()
+        self.confirm_password_input.setEchoMode(QLineEdit.Password)
+        self.form_layout.addRow(QLabel(), self.username_input)
+        self.form_layout.addRow(QLabel(), self.password_input)
+        self.form_layout.addRow(QLabel(), self.confirm_password_input)
+        layout.addLayout(self.form_layout)
+
+        self.register_button = QPushButton()
+        self.register_button.setFont(QFont("Arial", 14))
+        self.register_button.clicked.connect(self.handle_register)
+        layout.addWidget(self.register_button, alignment=Qt.AlignCenter)
+
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.status_label)
+
+        self.login_button = QPushButton()
+        self.login_button.setFont(QFont("Arial", 14))
+        self.login_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1))
+        layout.addWidget(self.login_button, alignment=Qt.AlignCenter)
+
+        layout.addStretch()
+        self.setLayout(layout)
+        self.retranslateUi()
+
+        # Hashing runs on a worker thread so the window stays responsive
+        self.auth = AuthWorker(parent=self)
+        self.auth.busyChanged.connect(self.set_busy)
+        self.auth.succeeded.connect(self.registered)
+        self.auth.rejected.connect(lambda message: QMessageBox.warning(self, self.tr("Error"), message))
+        self.auth.failed.connect(lambda message: QMessageBox.critical(
+            self, self.tr("Error"), self.tr("Failed to register: {0}").format(message)))
+
+    def retranslateUi(self):
+        self.title.setText(self.tr("🧵 Yogi Fashion Register"))
+        set_form_labels(self.form_layout, (
+            (self.username_input, self.tr("Username:")),
+            (self.password_input, self.tr("Password:")),
+            (self.confirm_password_input, self.tr("Confirm Password:"))))
+        self.register_button.setText(self.tr("📝 Register"))
+        self.login_button.setText(self.tr("🔐 Go to Login"))
+
+    def handle_register(self):
+        username = self.username_input.text()
+        password = self.password_input.text()
+        confirm_password = self.confirm_password_input.text()
+
+        if not username or not password or not confirm_password:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("All fields are required"))
+            return
+
+        if password != confirm_password:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Passwords do not match"))
+            return
+
+        self.auth.register(username, password)
+
+    def set_busy(self, busy):
+        self.register_button.setEnabled(not busy)
+        self.status_label.setText(self.tr("⏳ Creating account...") if busy else "")
+
+    def registered(self, user_id):
+        QMessageBox.information(self, self.tr("Success"), self.tr("Registration successful! Please login."))
+        self.stacked_widget.setCurrentIndex(1)
+
+class LoginPage(Retranslatable, QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+        self.setObjectName("authPage")
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.stacked_widget = stacked_widget
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+        layout.addStretch()
+
+        self.title = QLabel()
+        self.title.setFont(QFont("Arial", 20, QFont.Bold))
+        self.title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title)
+
+        self.form_layout = QFormLayout()
+        self.username_input = QLineEdit()
+        self.password_input = QLineEdit()
+        self.password_input.setEchoMode(QLineEdit.Password)
+        self.form_layout.addRow(QLabel(), self.username_input)
+        self.form_layout.addRow(QLabel(), self.password_input)
+        layout.addLayout(self.form_layout)
+
+        self.login_button = QPushButton()
+        self.login_button.setFont(QFont("Arial", 14))
+        self.login_button.clicked.connect(self.handle_login)
+        layout.addWidget(self.login_button, alignment=Qt.AlignCenter)
+
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.status_label)
+
+        self.register_button = QPushButton()
+        self.register_button.setFont(QFont("Arial", 14))
+        self.register_button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(0))
+        layout.addWidget(self.register_button, alignment=Qt.AlignCenter)
+
+        layout.addStretch()
+        self.setLayout(layout)
+        self.retranslateUi()
+
+        # Password checks run on a worker thread so the window stays responsive
+        self.auth = AuthWorker(parent=self)
+        self.auth.busyChanged.connect(self.set_busy)
+        self.auth.succeeded.connect(self.logged_in)
+        self.auth.rejected.connect(lambda message: QMessageBox.warning(self, self.tr("Error"), message))
+        self.auth.failed.connect(lambda message: QMessageBox.critical(
+            self, self.tr("Error"), self.tr("Failed to login: {0}").format(message)))
+
+    def retranslateUi(self):
+        self.title.setText(self.tr("🧵 Yogi Fashion Login"))
+        set_form_labels(self.form_layout, (
+            (self.username_input, self.tr("Username:")),
+            (self.password_input, self.tr("Password:"))))
+        self.login_button.setText(self.tr("🔐 Login"))
+        self.register_button.setText(self.tr("📝 Go to Register"))
+
+    def handle_login(self):
+        username = self.username_input.text()
+        password = self.password_input.text()
+        self.auth.login(username, password)
+
+    def set_busy(self, busy):
+        self.login_button.setEnabled(not busy)
+        self.status_label.setText(self.tr("⏳ Checking password...") if busy else "")
+
+    def logged_in(self, user_id):
+        self.password_input.clear()
+        self.stacked_widget.setCurrentIndex(2)
+
+class WelcomePage(Retranslatable, QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+        self.setObjectName("authPage")
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.stacked_widget = stacked_widget
+        self.initUI()
+
+    def initUI(self):
+        self.layout = QVBoxLayout()
+
+        self.welcome_label = QLabel()
+        self.welcome_label.setFont(QFont("Arial", 20, QFont.Bold))
+        self.welcome_label.setAlignment(Qt.AlignCenter)
+
+        self.enter_button = QPushButton()
+        self.enter_button.setObjectName("enterButton")
+        self.enter_button.setFont(QFont("Arial", 14, QFont.Bold))
+        self.enter_button.clicked.connect(self.go_to_main)
+
+        self.layout.addStretch()
+        self.layout.addWidget(self.welcome_label)
+        self.layout.addWidget(self.enter_button, alignment=Qt.AlignCenter)
+        self.layout.addStretch()
+
+        self.setLayout(self.layout)
+        self.retranslateUi()
+
+    def retranslateUi(self):
+        self.welcome_label.setText(self.tr("✨ Welcome to Yogi Fashion ✨"))
+        self.enter_button.setText(self.tr("🚀 Enter"))
+
+    def go_to_main(self):
+        self.stacked_widget.setCurrentIndex(3)
@@ -0,0 +1,228 @@
+import sqlite3
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QPushButton,
+    QTableView, QMessageBox, QLabel, QComboBox
+)
+from PyQt5.QtCore import QCoreApplication
+from db import get_db, StockError, PartyLedgerError, OrderError, PurchaseOrderError
+from table_model import LazyTableModel, enable_sorting
+from lazy_page import LoadOnShow
+from i18n import Retranslatable, set_form_labels
+from importer import import_from_file
+from exporter import export_to_file
+
+# Texts of the base class are looked up under "CrudPage"; self.tr() would use
+# the subclass's name at run time, which pylupdate5 cannot know.
+translate = QCoreApplication.translate
+
+# Repository errors whose message is written for the user
+USER_ERRORS = (StockError, PartyLedgerError, OrderError, PurchaseOrderError)
+
+
+class CrudPage(Retranslatable, LoadOnShow, QWidget):
+    """A form, a lazily read table and add/update/delete/import/export
+    buttons over one repository.
+
+    `kind` names the repository on Database, which is also the kind the
+    importer and exporter take. The form has one field per repository
+    column, in the order insert() and update() take them; parse() turns
+    the typed texts into those values. Every field must be filled in
+    except those of the columns in `optional`. create_field() may give a
+    column a QComboBox instead; its current item's data is the value.
+    Trailing columns listed in `hidden` are left out of the table.
+
+    Subclasses set their labels, headers and messages in retranslateUi()
+    (see set_texts()), and may add a filter above the table with
+    add_filter() and filter_terms(), or buttons with add_buttons().
+    """
+
+    kind = None
+    optional = ()
+    hidden = ()
+
+    def __init__(self):
+        super().__init__()
+        self.repository = getattr(get_db(), self.kind)
+        self.messages = {}
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+
+        # Form for adding a row
+        self.form_layout = QFormLayout()
+        self.inputs = {}
+        for column in self.repository.columns:
+            self.inputs[column] = self.create_field(column)
+            self.form_layout.addRow(QLabel(), self.inputs[column])
+        self.add_button = QPushButton()
+        self.add_button.clicked.connect(self.add_row)
+        self.form_layout.addWidget(self.add_button)
+        layout.addLayout(self.form_layout)
+
+        self.add_filter(layout)
+
+        # Table for displaying rows
+        self.model = LazyTableModel(self.repository, [""] * (len(self.repository.columns) + 1 - len(self.hidden)), parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        enable_sorting(self.table)
+        layout.addWidget(self.table)
+
+        # Buttons for update/delete
+        button_layout = QHBoxLayout()
+        self.update_button = QPushButton()
+        self.update_button.clicked.connect(self.update_row)
+        self.delete_button = QPushButton()
+        self.delete_button.clicked.connect(self.delete_row)
+        self.import_button = QPushButton()
+        self.import_button.clicked.connect(lambda: import_from_file(self, self.kind))
+        self.export_button = QPushButton()
+        self.export_button.clicked.connect(lambda: export_to_file(self, self.kind))
+        button_layout.addWidget(self.update_button)
+        button_layout.addWidget(self.delete_button)
+        button_layout.addWidget(self.import_button)
+        button_layout.addWidget(self.export_button)
+        self.add_buttons(button_layout)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+        self.retranslateUi()
+
+    def create_field(self, column):
+        """The form field for a column; a QLineEdit by default."""
+        return QLineEdit()
+
+    def add_filter(self, layout):
+        """Add widgets filtering the table to `layout`; none by default."""
+
+    def add_buttons(self, layout):
+        """Add buttons after the standard ones; none by default."""
+
+    def filter_terms(self):
+        """Filter terms for LazyTableModel.set_filter(); raises ValueError
+        with a message for the user if the filter cannot be read."""
+        return []
+
+    def parse(self, values):
+        """The form's texts as the values insert() and update() take; raises
+        ValueError with a message for the user."""
+        return values
+
+    def retranslateUi(self):
+        self.update_button.setText(translate("CrudPage", "Update Selected"))
+        self.delete_button.setText(translate("CrudPage", "Delete Selected"))
+        self.import_button.setText(translate("CrudPage", "Import from File"))
+        self.export_button.setText(translate("CrudPage", "Export"))
+
+    def set_texts(self, labels, add, headers, messages):
+        """Set the form labels (one per column), the add button, the table
+        headers (key first, none for hidden columns) and the messages of this page's actions:
+        added, updated, deleted, add_failed, update_failed, delete_failed
+        (with {0} for the error), select_update and select_delete."""
+        set_form_labels(self.form_layout, zip(self.inputs.values(), labels))
+        self.add_button.setText(add)
+        self.model.set_headers(headers)
+        self.messages = messages
+
+    def error(self, message):
+        QMessageBox.warning(self, translate("CrudPage", "Error"), message)
+
+    def failed(self, message, error):
+        QMessageBox.critical(self, translate("CrudPage", "Error"), message.format(error))
+
+    def done(self, message):
+        QMessageBox.information(self, translate("CrudPage", "Success"), message)
+
+    def load_data(self):
+        self.load_rows()
+
+    def load_rows(self):
+        try:
+            self.model.reload()
+        except sqlite3.Error as e:
+            self.failed(translate("CrudPage", "Database error: {0}"), e)
+
+    def filter_rows(self):
+        try:
+            self.model.set_filter(self.filter_terms())
+        except ValueError as e:
+            self.error(str(e))
+        except sqlite3.Error as e:
+            self.failed(translate("CrudPage", "Database error: {0}"), e)
+
+    def form_values(self):
+        """Parsed form values, or None after telling the user what is wrong."""
+        values = [field_text(field) for field in self.inputs.values()]
+        if not all(value or column in self.optional for column, value in zip(self.inputs, values)):
+            self.error(translate("CrudPage", "All fields are required"))
+            return None
+        try:
+            return self.parse(values)
+        except ValueError as e:
+            self.error(str(e))
+            return None
+
+    def add_row(self):
+        values = self.form_values()
+        if values is None:
+            return
+        try:
+            self.repository.insert(*values)
+        except USER_ERRORS as e:
+            self.error(str(e))
+            return
+        except sqlite3.Error as e:
+            self.failed(self.messages["add_failed"], e)
+            return
+        for field in self.inputs.values():
+            clear_field(field)
+        self.done(self.messages["added"])
+
+    def update_row(self):
+        selected = self.table.currentIndex().row()
+        if selected < 0:
+            self.error(self.messages["select_update"])
+            return
+        values = self.form_values()
+        if values is None:
+            return
+        try:
+            self.repository.update(self.model.key(selected), *values)
+        except USER_ERRORS as e:
+            self.error(str(e))
+            return
+        except sqlite3.Error as e:
+            self.failed(self.messages["update_failed"], e)
+            return
+        self.done(self.messages["updated"])
+
+    def delete_row(self):
+        selected = self.table.currentIndex().row()
+        if selected < 0:
+            self.error(self.messages["select_delete"])
+            return
+        try:
+            self.repository.delete(self.model.key(selected))
+        except USER_ERRORS as e:
+            self.error(str(e))
+            return
+        except sqlite3.Error as e:
+            self.failed(self.messages["delete_failed"], e)
+            return
+        self.done(self.messages["deleted"])
+
+
+def field_text(field):
+    if isinstance(field, QComboBox):
+        return field.currentData() or ""
+    return field.text()
+
+
+def clear_field(field):
+    if isinstance(field, QComboBox):
+        field.setCurrentIndex(0)
+    else:
+        field.clear()
@@ -0,0 +1,33 @@
+from PyQt5.QtWidgets import QLineEdit
+from .crud_page import CrudPage
+
+class EmployeePage(CrudPage):
+    kind = "employees"
+
+    def add_filter(self, layout):
+        # Filter by role, applied in SQL
+        self.role_filter = QLineEdit()
+        self.role_filter.returnPressed.connect(self.filter_rows)
+        layout.addWidget(self.role_filter)
+
+    def filter_terms(self):
+        role = self.role_filter.text().strip()
+        return [("role", "=", role)] if role else []
+
+    def retranslateUi(self):
+        super().retranslateUi()
+        self.set_texts(
+            [self.tr("Name:"), self.tr("Contact:"), self.tr("Role:")],
+            self.tr("Add Employee"),
+            [self.tr("ID"), self.tr("Name"), self.tr("Contact"), self.tr("Role")],
+            {
+                "added": self.tr("Employee added"),
+                "updated": self.tr("Employee updated"),
+                "deleted": self.tr("Employee deleted"),
+                "add_failed": self.tr("Failed to add employee: {0}"),
+                "update_failed": self.tr("Failed to update employee: {0}"),
+                "delete_failed": self.tr("Failed to delete employee: {0}"),
+                "select_update": self.tr("Select an employee to update"),
+                "select_delete": self.tr("Select an employee to delete"),
+            })
+        self.role_filter.setPlaceholderText(self.tr("Show only role… (Enter)"))
@@ -0,0 +1,57 @@
+from PyQt5.QtWidgets import QHBoxLayout, QLineEdit, QPushButton
+from PyQt5.QtCore import QDate
+from pricing import to_paise
+from .crud_page import CrudPage
+
+class ExpensePage(CrudPage):
+    kind = "expenses"
+
+    def add_filter(self, layout):
+        # Filter by date range, applied in SQL
+        filter_layout = QHBoxLayout()
+        self.from_filter = QLineEdit()
+        self.to_filter = QLineEdit()
+        self.filter_button = QPushButton()
+        self.filter_button.clicked.connect(self.filter_rows)
+        filter_layout.addWidget(self.from_filter)
+        filter_layout.addWidget(self.to_filter)
+        filter_layout.addWidget(self.filter_button)
+        layout.addLayout(filter_layout)
+
+    def filter_terms(self):
+        terms = []
+        for op, field in ((">=", self.from_filter), ("<=", self.to_filter)):
+            day = field.text().strip()
+            if day:
+                if not QDate.fromString(day, "yyyy-MM-dd").isValid():
+                    raise ValueError(self.tr("Dates must be YYYY-MM-DD"))
+                terms.append(("date", op, day))
+        return terms
+
+    def parse(self, values):
+        description, amount, date = values
+        try:
+            return description, to_paise(amount), date
+        except ValueError:
+            raise ValueError(self.tr("Amount must be a number")) from None
+
+    def retranslateUi(self):
+        super().retranslateUi()
+        self.set_texts(
+            [self.tr("Description:"), self.tr("Amount:"), self.tr("Date:")],
+            self.tr("Add Expense"),
+            [self.tr("ID"), self.tr("Description"), self.tr("Amount"), self.tr("Date")],
+            {
+                "added": self.tr("Expense added"),
+                "updated": self.tr("Expense updated"),
+                "deleted": self.tr("Expense deleted"),
+                "add_failed": self.tr("Failed to add expense: {0}"),
+                "update_failed": self.tr("Failed to update expense: {0}"),
+                "delete_failed": self.tr("Failed to delete expense: {0}"),
+                "select_update": self.tr("Select an expense to update"),
+                "select_delete": self.tr("Select an expense to delete"),
+            })
+        self.inputs["date"].setPlaceholderText(self.tr("YYYY-MM-DD"))
+        self.from_filter.setPlaceholderText(self.tr("From YYYY-MM-DD"))
+        self.to_filter.setPlaceholderText(self.tr("To YYYY-MM-DD"))
+        self.filter_button.setText(self.tr("Filter"))
@@ -1,18 +1,24 @@
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGridLayout, QFrame
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
-from theme import load_theme
+from dashboard import Dashboard
+from alerts import get_reorder_alerts
+from lazy_page import LoadOnShow
+from i18n import Retranslatable
 
-class HomePage(QWidget):
+class HomePage(Retranslatable, LoadOnShow, QWidget):
     def __init__(self):
         super().__init__()
+        self.setObjectName("homePage")
+        self.setAttribute(Qt.WA_StyledBackground)
         self.initUI()
 
     def initUI(self):
         layout = QVBoxLayout()
 
         # Title Label
-        self.title = QLabel("\U0001F4CA Dashboard")
+        self.title = QLabel()
+        self.title.setObjectName("dashboardTitle")
         self.title.setFont(QFont("Arial", 18, QFont.Bold))
         self.title.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.title)
@@ -21,11 +27,12 @@ class HomePage(QWidget):
         card_layout = QGridLayout()
         card_layout.setSpacing(15)
 
-        self.total_balance = self.create_card("\U0001F4B0 Total Balance", "\u20B90", "#b3e5fc")   # Light Blue
-        self.total_expense = self.create_card("\U0001F4B8 Total Expenses", "\u20B90", "#c8e6c9")  # Light Green
-        self.total_employees = self.create_card("\U0001F464 Total Employees", "0", "#fff9c4")    # Light Yellow
-        self.total_machines = self.create_card("\U0001F9F5 Total Machines", "0", "#e1bee7")      # Light Purple
-        self.total_udhar = self.create_card("\U0001F4B3 Total Udhar", "\u20B90", "#ffe0b2")       # Light Orange
+        # Card colours come from theme.PALETTES, by card number
+        self.total_balance = self.create_card("", "\u20B90", 0)
+        self.total_expense = self.create_card("", "\u20B90", 1)
+        self.total_employees = self.create_card("", "0", 2)
+        self.total_machines = self.create_card("", "0", 3)
+        self.total_udhar = self.create_card("", "\u20B90", 4)
 
         cards = [
             self.total_balance,
@@ -44,23 +51,49 @@ class HomePage(QWidget):
         layout.addLayout(card_layout)
 
         # Notifications Section
-        self.notification_label = QLabel("\U0001F514 Recent Notifications")
+        self.notification_label = QLabel()
+        self.notification_label.setObjectName("notificationTitle")
         self.notification_label.setFont(QFont("Arial", 14, QFont.Bold))
         layout.addWidget(self.notification_label)
 
-        self.notification_box = QLabel("No new notifications")
+        self.notification_box = QLabel()
+        self.notification_box.setObjectName("notificationBox")
         self.notification_box.setFrameShape(QFrame.Box)
         self.notification_box.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         self.notification_box.setWordWrap(True)
         layout.addWidget(self.notification_box)
 
         self.setLayout(layout)
-        self.update_theme()
 
-    def create_card(self, title, value, bg_color):
+        # Figures come from running totals, so a refresh costs the same at any ledger size
+        self.dashboard = Dashboard(alerts=get_reorder_alerts(), parent=self)
+        self.dashboard.changed.connect(self.show_figures)
+        self.retranslateUi()
+
+    def retranslateUi(self):
+        self.title.setText(self.tr("📊 Dashboard"))
+        self.total_balance.findChildren(QLabel)[0].setText(self.tr("💰 Total Balance"))
+        self.total_expense.findChildren(QLabel)[0].setText(self.tr("💸 Total Expenses"))
+        self.total_employees.findChildren(QLabel)[0].setText(self.tr("👤 Total Employees"))
+        self.total_machines.findChildren(QLabel)[0].setText(self.tr("🧵 Total Machines"))
+        self.total_udhar.findChildren(QLabel)[0].setText(self.tr("💳 Total Udhar"))
+        self.notification_label.setText(self.tr("🔔 Recent Notifications"))
+        if self._data_loaded:
+            self.dashboard.refresh()  # notifications are worded by the dashboard
+        else:
+            self.notification_box.setText(self.tr("No new notifications"))
+
+    def load_data(self):
+        self.dashboard.refresh()
+
+    def show_figures(self, figures):
+        self.update_data(figures["balance"], figures["expenses"], figures["employees"],
+                         figures["machines"], figures["udhar"], figures["notifications"])
+
+    def create_card(self, title, value, number):
         card = QFrame()
         card.setFrameShape(QFrame.StyledPanel)
-        card.setProperty("bg_color", bg_color)
+        card.setProperty("card", str(number))
         card_layout = QVBoxLayout()
 
         title_label = QLabel(title)
@@ -84,33 +117,3 @@ class HomePage(QWidget):
         self.total_machines.findChildren(QLabel)[1].setText(f"{machines}")
         self.total_udhar.findChildren(QLabel)[1].setText(f"\u20B9{udhar}")
         self.notification_box.setText(notifications)
-
-    def update_theme(self):
-        theme = load_theme()
-        if theme == "dark":
-            self.setStyleSheet("background-color: #1e1e2f; color: white;")
-            box_style = "background-color: #2a2a40; border: 1px solid #444; padding: 8px;"
-        else:
-            self.setStyleSheet("background-color: #f0f4f7; color: black;")
-            box_style = "background-color: #ffffff; border: 1px solid #ccc; padding: 8px;"
-
-        card_colors = (
-            ["#b3e5fc", "#c8e6c9", "#fff9c4", "#e1bee7", "#ffe0b2"]
-            if theme == "light"
-            else ["#394b59", "#3d5a4d", "#6f6743", "#5a4b5c", "#5e4c3c"]
-        )
-
-        for idx, card in enumerate([
-            self.total_balance,
-            self.total_expense,
-            self.total_employees,
-            self.total_machines,
-            self.total_udhar,
-        ]):
-            card.setStyleSheet(
-                f"background-color: {card_colors[idx]}; color: {'white' if theme == 'dark' else 'black'}; padding: 10px; border-radius: 10px;"
-            )
-
-        self.notification_box.setStyleSheet(box_style)
-        self.title.setStyleSheet("margin-top: 10px;")
-        self.notification_label.setStyleSheet("margin-top: 20px;")
\ No newline at end of file
@@ -0,0 +1,174 @@
+from importlib import import_module
+from PyQt5.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QFrame, QComboBox
+from PyQt5.QtCore import QTimer, QDateTime, Qt
+from PyQt5.QtGui import QFont
+from theme import get_theme_service
+from i18n import LANGUAGES, Retranslatable, get_language_service
+
+# Menu entry -> (module in this package, page class). A page's module is
+# imported when the page is first opened, so start-up loads none of them.
+PAGES = {
+    "Home": ("home", "HomePage"),
+    "Party Details": ("party_page", "PartyPage"),
+    "Order Details": ("order_page", "OrderPage"),
+    "Supplier Details": ("supplier_page", "SupplierPage"),
+    "Material Details": ("material_page", "MaterialPage"),
+    "Employee Details": ("employee_page", "EmployeePage"),
+    "Expense Details": ("expense_page", "ExpensePage"),
+}
+
+class MainPage(Retranslatable, QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+        self.setObjectName("mainPage")
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.stacked_widget = stacked_widget
+        self.initUI()
+
+    def change_language(self, index):
+        # Built pages retranslate themselves on the LanguageChange that follows
+        get_language_service().set_language(self.language_selector.itemData(index))
+
+    def show_language(self, language):
+        self.language_selector.blockSignals(True)
+        self.language_selector.setCurrentIndex(self.language_selector.findData(language))
+        self.language_selector.blockSignals(False)
+
+    def initUI(self):
+        self.layout = QVBoxLayout()
+
+        # Header
+        self.header = QHBoxLayout()
+        self.logo = QLabel()
+        self.logo.setFont(QFont("Arial", 18, QFont.Bold))
+
+        self.language_selector = QComboBox()
+        for code, name in LANGUAGES.items():
+            self.language_selector.addItem(name, code)
+        self.show_language(get_language_service().language())
+        self.language_selector.currentIndexChanged.connect(self.change_language)
+        get_language_service().languageChanged.connect(self.show_language)
+
+        self.theme_button = QPushButton()
+        self.theme_button.setFont(QFont("Arial", 10))
+        self.theme_button.clicked.connect(self.toggle_theme)
+
+        self.date_time_label = QLabel()
+        self.date_time_label.setFont(QFont("Arial", 10))
+        timer = QTimer(self)
+        timer.timeout.connect(self.update_datetime)
+        timer.start(1000)
+
+        self.header.addWidget(self.logo)
+        self.header.addStretch()
+        self.header.addWidget(self.date_time_label)
+        self.header.addWidget(self.language_selector)
+        self.header.addWidget(self.theme_button)
+
+        # Side Menu; buttons are keyed by page name, whatever the language
+        self.side_menu = QVBoxLayout()
+        self.buttons = {}
+        for name in PAGES:
+            btn = QPushButton()
+            btn.setProperty("menu", True)
+            btn.setFont(QFont("Arial", 12))
+            btn.clicked.connect(lambda checked, page=name: self.open_page(page))
+            self.buttons[name] = btn
+            self.side_menu.addWidget(btn)
+        self.side_menu.addStretch()
+
+        # Main Layout
+        self.main_layout = QHBoxLayout()
+        self.side_menu_frame = QFrame()
+        self.side_menu_frame.setLayout(self.side_menu)
+
+        self.content_frame = QFrame()
+        self.content_layout = QVBoxLayout()
+
+        # Back button
+        self.back_button = QPushButton()
+        self.back_button.setObjectName("backButton")
+        self.back_button.setFont(QFont("Arial", 10))
+        self.back_button.clicked.connect(self.show_dashboard)
+        self.back_button.setVisible(False)
+
+        self.dashboard = QLabel()
+        self.dashboard.setFont(QFont("Arial", 16, QFont.Bold))
+        self.dashboard.setAlignment(Qt.AlignCenter)
+
+        self.content_layout.addWidget(self.back_button, alignment=Qt.AlignLeft)
+        self.content_layout.addWidget(self.dashboard)
+        self.content_frame.setLayout(self.content_layout)
+
+        # Pages are built on first open and read their data when first shown
+        self.pages = {}
+
+        self.main_layout.addWidget(self.side_menu_frame, 1)
+        self.main_layout.addWidget(self.content_frame, 4)
+
+        self.layout.addLayout(self.header)
+        self.layout.addLayout(self.main_layout)
+        self.setLayout(self.layout)
+        self.retranslateUi()
+
+        get_theme_service().themeChanged.connect(self.update_theme_button)
+
+    def retranslateUi(self):
+        self.logo.setText(self.tr("🧵 Yogi Fashion"))
+        titles = {
+            "Home": self.tr("Home"),
+            "Party Details": self.tr("Party Details"),
+            "Order Details": self.tr("Order Details"),
+            "Supplier Details": self.tr("Supplier Details"),
+            "Material Details": self.tr("Material Details"),
+            "Employee Details": self.tr("Employee Details"),
+            "Expense Details": self.tr("Expense Details"),
+        }
+        for name, button in self.buttons.items():
+            button.setText(titles[name])
+        self.back_button.setText(self.tr("🔙 Back"))
+        self.dashboard.setText(self.tr("📌 Select an option from the menu"))
+        self.update_theme_button(get_theme_service().theme())
+        # Day and month names in the header follow the language too
+        self.setLocale(get_language_service().locale())
+        self.update_datetime()
+
+    def update_datetime(self):
+        current = self.locale().toString(QDateTime.currentDateTime(), "dddd, dd MMM yyyy hh:mm:ss")
+        self.date_time_label.setText(current)
+
+    def get_page(self, page):
+        widget = self.pages.get(page)
+        if widget is None:
+            module, name = PAGES[page]
+            factory = getattr(import_module(f"{__package__}.{module}"), name)
+            widget = self.pages[page] = factory()
+        return widget
+
+    def open_page(self, page):
+        if page in PAGES:
+            for i in reversed(range(self.content_layout.count())):
+                widget = self.content_layout.itemAt(i).widget()
+                if widget is not None:
+                    widget.setParent(None)
+            self.content_layout.addWidget(self.back_button, alignment=Qt.AlignLeft)
+            self.content_layout.addWidget(self.get_page(page))
+            self.back_button.setVisible(True)
+        else:
+            self.show_dashboard()
+            self.dashboard.setText(self.tr("📄 {0} Page Opened").format(page))
+
+    def show_dashboard(self):
+        for i in reversed(range(self.content_layout.count())):
+            widget = self.content_layout.itemAt(i).widget()
+            if widget is not None:
+                widget.setParent(None)
+        self.content_layout.addWidget(self.back_button, alignment=Qt.AlignLeft)
+        self.content_layout.addWidget(self.dashboard)
+        self.back_button.setVisible(False)
+
+    def toggle_theme(self):
+        get_theme_service().toggle()
+
+    def update_theme_button(self, theme):
+        self.theme_button.setText(self.tr("🌞 Light Mode") if theme == "dark" else self.tr("🌙 Dark Mode"))
@@ -0,0 +1,107 @@
+import sqlite3
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QLineEdit, QPushButton, QComboBox
+from db import get_db
+from exporter import export_to_file
+from pricing import to_gst_rate, to_paise
+from .crud_page import CrudPage
+
+class MaterialPage(CrudPage):
+    kind = "products"
+    # A product without both is not watched by the reorder alerts
+    optional = ("gst_rate", "reorder_point", "supplier_id")
+    hidden = ("supplier_id",)
+
+    # suppliers changed; from any thread
+    suppliersChanged = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        get_db().subscribe("suppliers", self._suppliers_changed)
+        self.suppliersChanged.connect(self.load_suppliers)
+
+    def _suppliers_changed(self, table, change, key, rowid):
+        self.suppliersChanged.emit()
+
+    def create_field(self, column):
+        if column != "supplier_id":
+            return super().create_field(column)
+        self.supplier_input = QComboBox()
+        self.supplier_input.addItem("", None)  # no supplier; named in retranslateUi()
+        return self.supplier_input
+
+    def add_filter(self, layout):
+        # Filter by embroidery type, applied in SQL
+        self.type_filter = QLineEdit()
+        self.type_filter.returnPressed.connect(self.filter_rows)
+        layout.addWidget(self.type_filter)
+
+    def add_buttons(self, layout):
+        self.movements_button = QPushButton()
+        self.movements_button.clicked.connect(lambda: export_to_file(self, "stock_transactions"))
+        layout.addWidget(self.movements_button)
+
+    def load_data(self):
+        super().load_data()
+        self.load_suppliers()
+
+    def load_suppliers(self):
+        current = self.supplier_input.currentData()
+        try:
+            suppliers = get_db().execute("SELECT supplier_id, name FROM suppliers ORDER BY name").fetchall()
+        except sqlite3.Error as e:
+            self.failed(self.tr("Database error: {0}"), e)
+            return
+        while self.supplier_input.count() > 1:
+            self.supplier_input.removeItem(1)
+        for supplier_id, name in suppliers:
+            self.supplier_input.addItem(name or supplier_id, supplier_id)
+        self.supplier_input.setCurrentIndex(max(self.supplier_input.findData(current), 0))
+
+    def filter_terms(self):
+        embroidery_type = self.type_filter.text().strip()
+        return [("embroidery_type", "=", embroidery_type)] if embroidery_type else []
+
+    def parse(self, values):
+        description, embroidery_type, price, stock, gst_rate, reorder_point, supplier_id = values
+        try:
+            price, stock = to_paise(price), int(stock)
+        except ValueError:
+            raise ValueError(self.tr("Price and Stock must be numbers")) from None
+        if stock < 0:
+            raise ValueError(self.tr("Stock cannot be negative"))
+        try:
+            gst_rate = to_gst_rate(gst_rate) if gst_rate else None
+        except ValueError:
+            raise ValueError(self.tr("GST rate must be a percentage from 0 to 100")) from None
+        try:
+            reorder_point = int(reorder_point) if reorder_point else None
+        except ValueError:
+            raise ValueError(self.tr("Reorder point must be a whole number")) from None
+        if reorder_point is not None and reorder_point < 0:
+            raise ValueError(self.tr("Reorder point cannot be negative"))
+        return description, embroidery_type, price, stock, gst_rate, reorder_point, supplier_id or None
+
+    def retranslateUi(self):
+        super().retranslateUi()
+        self.set_texts(
+            [self.tr("Description:"), self.tr("Embroidery Type:"), self.tr("Price:"), self.tr("Stock:"),
+             self.tr("GST %:"), self.tr("Reorder Point:"), self.tr("Supplier:")],
+            self.tr("Add Product"),
+            [self.tr("Design ID"), self.tr("Description"), self.tr("Type"), self.tr("Price"), self.tr("Stock"),
+             self.tr("GST %"), self.tr("Reorder Point")],
+            {
+                "added": self.tr("Product added"),
+                "updated": self.tr("Product updated"),
+                "deleted": self.tr("Product deleted"),
+                "add_failed": self.tr("Failed to add product: {0}"),
+                "update_failed": self.tr("Failed to update product: {0}"),
+                "delete_failed": self.tr("Failed to delete product: {0}"),
+                "select_update": self.tr("Select a product to update"),
+                "select_delete": self.tr("Select a product to delete"),
+            })
+        self.inputs["gst_rate"].setPlaceholderText(self.tr("Optional; e.g. 5, 12 or 18"))
+        self.inputs["reorder_point"].setPlaceholderText(self.tr("Optional; alerts at or below this stock"))
+        self.supplier_input.setItemText(0, self.tr("No supplier"))
+        self.type_filter.setPlaceholderText(self.tr("Show only embroidery type… (Enter)"))
+        self.movements_button.setText(self.tr("Export Stock Movements"))
@@ -0,0 +1,300 @@
+import sqlite3
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QPushButton,
+    QTableView, QMessageBox, QLabel, QComboBox, QSpinBox, QListWidget, QListWidgetItem
+)
+from PyQt5.QtCore import Qt, QDate
+from PyQt5.QtGui import QFont
+from db import get_db, OrderError, ORDER_STATUSES
+from table_model import LazyTableModel, enable_sorting
+from lazy_page import LoadOnShow
+from exporter import export_to_file
+from pricing import rupees
+from invoice import save_invoice, save_day_invoices
+from i18n import Retranslatable, set_form_labels
+from .product_picker import ProductPicker
+
+# A batch entry's (client id, design ID, quantity), and the text it is listed with
+ENTRY_ROLE = Qt.UserRole
+LABEL_ROLE = Qt.UserRole + 1
+
+class OrderPage(Retranslatable, LoadOnShow, QWidget):
+    def __init__(self):
+        super().__init__()
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+
+        self.title = QLabel()
+        self.title.setFont(QFont("Arial", 16, QFont.Bold))
+        self.title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title)
+
+        # Form for placing orders. Client, status and date stay filled in and
+        # Enter places the order, so a run of orders is typed without the mouse.
+        # Statuses are shown translated and kept as item data.
+        self.form_layout = QFormLayout()
+        self.contact_input = QLineEdit()
+        self.design_input = ProductPicker()
+        self.quantity_input = QSpinBox()
+        self.quantity_input.setRange(1, 100000)
+        self.status_input = QComboBox()
+        for status in ORDER_STATUSES:
+            self.status_input.addItem(status, status)
+        self.date_input = QLineEdit(QDate.currentDate().toString("yyyy-MM-dd"))
+        self.form_layout.addRow(QLabel(), self.contact_input)
+        self.form_layout.addRow(QLabel(), self.design_input)
+        self.form_layout.addRow(QLabel(), self.quantity_input)
+        self.form_layout.addRow(QLabel(), self.status_input)
+        self.form_layout.addRow(QLabel(), self.date_input)
+        self.add_button = QPushButton()
+        self.add_button.clicked.connect(self.add_order)
+        self.form_layout.addWidget(self.add_button)
+        layout.addLayout(self.form_layout)
+        self.design_input.returnPressed.connect(self.add_order)
+        self.quantity_input.lineEdit().returnPressed.connect(self.add_order)
+
+        # Result of the last order, shown without a dialog to keep entry fast
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        # A batch of orders collected from the form and placed together, in
+        # one transaction; orders that fail stay listed with the reason
+        batch_layout = QHBoxLayout()
+        self.batch_list = QListWidget()
+        self.batch_list.setSelectionMode(QListWidget.ExtendedSelection)
+        self.batch_list.setMaximumHeight(120)
+        batch_buttons = QVBoxLayout()
+        self.batch_button = QPushButton()
+        self.batch_button.clicked.connect(self.add_to_batch)
+        self.place_batch_button = QPushButton()
+        self.place_batch_button.clicked.connect(self.place_batch)
+        self.remove_batch_button = QPushButton()
+        self.remove_batch_button.clicked.connect(self.remove_from_batch)
+        batch_buttons.addWidget(self.batch_button)
+        batch_buttons.addWidget(self.place_batch_button)
+        batch_buttons.addWidget(self.remove_batch_button)
+        batch_layout.addWidget(self.batch_list)
+        batch_layout.addLayout(batch_buttons)
+        layout.addLayout(batch_layout)
+
+        # Filter by status, applied in SQL
+        self.status_filter = QComboBox()
+        self.status_filter.addItem("", None)
+        for status in ORDER_STATUSES:
+            self.status_filter.addItem(status, status)
+        self.status_filter.currentIndexChanged.connect(self.filter_orders)
+        layout.addWidget(self.status_filter)
+
+        # Table for displaying orders
+        self.model = LazyTableModel(get_db().orders, [""] * 8, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        enable_sorting(self.table)
+        layout.addWidget(self.table)
+
+        # Buttons for status/delete/export
+        button_layout = QHBoxLayout()
+        self.status_button = QPushButton()
+        self.status_button.clicked.connect(self.update_order)
+        self.delete_button = QPushButton()
+        self.delete_button.clicked.connect(self.delete_order)
+        self.export_button = QPushButton()
+        self.export_button.clicked.connect(lambda: export_to_file(self, "orders"))
+        self.invoice_button = QPushButton()
+        self.invoice_button.clicked.connect(self.invoice_order)
+        self.day_invoices_button = QPushButton()
+        self.day_invoices_button.clicked.connect(self.invoice_day)
+        button_layout.addWidget(self.status_button)
+        button_layout.addWidget(self.delete_button)
+        button_layout.addWidget(self.export_button)
+        button_layout.addWidget(self.invoice_button)
+        button_layout.addWidget(self.day_invoices_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+        self.retranslateUi()
+
+    def retranslateUi(self):
+        self.title.setText(self.tr("📦 Orders"))
+        self.contact_input.setPlaceholderText(self.tr("Client contact number"))
+        self.design_input.setPlaceholderText(self.tr("Description or design ID"))
+        self.date_input.setPlaceholderText(self.tr("YYYY-MM-DD"))
+        set_form_labels(self.form_layout, (
+            (self.contact_input, self.tr("Client Contact:")),
+            (self.design_input, self.tr("Design:")),
+            (self.quantity_input, self.tr("Quantity:")),
+            (self.status_input, self.tr("Status:")),
+            (self.date_input, self.tr("Date:"))))
+        self.add_button.setText(self.tr("Place Order"))
+        self.batch_button.setText(self.tr("Add to Batch"))
+        self.place_batch_button.setText(self.tr("Place Batch"))
+        self.remove_batch_button.setText(self.tr("Remove from Batch"))
+        statuses = {"Pending": self.tr("Pending"), "Delivered": self.tr("Delivered"), "Paid": self.tr("Paid")}
+        for combo in (self.status_input, self.status_filter):
+            for index in range(combo.count()):
+                status = combo.itemData(index)
+                combo.setItemText(index, statuses.get(status, status) if status else self.tr("All Statuses"))
+        self.model.set_headers([self.tr("Order ID"), self.tr("Client ID"), self.tr("Design ID"),
+                                self.tr("Quantity"), self.tr("Status"), self.tr("Date"),
+                                self.tr("Total (₹)"), self.tr("GST (₹)")])
+        self.status_button.setText(self.tr("Set Status of Selected"))
+        self.delete_button.setText(self.tr("Delete Selected"))
+        self.export_button.setText(self.tr("Export"))
+        self.invoice_button.setText(self.tr("Invoice for Selected"))
+        self.day_invoices_button.setText(self.tr("Invoices for Date"))
+
+    def load_data(self):
+        self.load_orders()
+        try:
+            self.design_input.load()
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+
+    def load_orders(self):
+        try:
+            self.model.reload()
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+
+    def filter_orders(self):
+        status = self.status_filter.currentData()
+        try:
+            self.model.set_filter([("status", "=", status)] if status else [])
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+
+    def order_date(self):
+        """The form's date, or None after telling the user it is not valid."""
+        order_date = self.date_input.text().strip()
+        if not QDate.fromString(order_date, "yyyy-MM-dd").isValid():
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Date must be YYYY-MM-DD"))
+            return None
+        return order_date
+
+    def form_entry(self):
+        """(client id, design ID, quantity) from the form, or None after
+        telling the user what is wrong."""
+        contact = self.contact_input.text().strip()
+        design_id = self.design_input.design_id()
+        if not contact or not design_id or not self.date_input.text().strip():
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Client contact, design and date are required"))
+            return None
+        if self.order_date() is None:
+            return None
+        try:
+            client_id = get_db().clients.find_by_contact(contact)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+            return None
+        if client_id is None:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("No client with contact {0}").format(contact))
+            return None
+        return client_id, design_id, self.quantity_input.value()
+
+    def next_entry(self):
+        # Client, status and date stay for the next order
+        self.design_input.clear()
+        self.quantity_input.setValue(1)
+        self.design_input.setFocus()
+
+    def add_order(self):
+        entry = self.form_entry()
+        if entry is None:
+            return
+        client_id, design_id, quantity = entry
+        db = get_db()
+        try:
+            order_id = db.orders.place(client_id, design_id, quantity,
+                                       self.status_input.currentData(), self.order_date())
+        except OrderError as e:
+            QMessageBox.warning(self, self.tr("Error"), str(e))
+            return
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to place order: {0}").format(e))
+            return
+        *_, total, gst = db.orders.get(order_id)
+        self.status_label.setText(self.tr("✅ Order placed: {0} × {1} = ₹{2} (GST ₹{3})").format(
+            quantity, design_id, rupees(total), rupees(gst)))
+        self.next_entry()
+
+    def add_to_batch(self):
+        entry = self.form_entry()
+        if entry is None:
+            return
+        _, design_id, quantity = entry
+        label = self.tr("{0}: {1} × {2}").format(self.contact_input.text().strip(), quantity, design_id)
+        item = QListWidgetItem(label)
+        item.setData(ENTRY_ROLE, entry)
+        item.setData(LABEL_ROLE, label)
+        self.batch_list.addItem(item)
+        self.next_entry()
+
+    def remove_from_batch(self):
+        for item in self.batch_list.selectedItems():
+            self.batch_list.takeItem(self.batch_list.row(item))
+
+    def place_batch(self):
+        items = [self.batch_list.item(row) for row in range(self.batch_list.count())]
+        if not items:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Add orders to the batch first"))
+            return
+        order_date = self.order_date()
+        if order_date is None:
+            return
+        try:
+            placed, rejected = get_db().orders.place_many(
+                [item.data(ENTRY_ROLE) for item in items], self.status_input.currentData(), order_date)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to place orders: {0}").format(e))
+            return
+        reasons = dict(rejected)
+        for row in reversed(range(len(items))):
+            if row in reasons:
+                items[row].setText(f"{items[row].data(LABEL_ROLE)} ⚠️ {reasons[row]}")
+            else:
+                self.batch_list.takeItem(row)
+        self.status_label.setText(self.tr("✅ {0} order(s) placed, {1} left in the batch").format(
+            len(placed), len(rejected)))
+
+    def update_order(self):
+        selected = self.table.currentIndex().row()
+        if selected >= 0:
+            order_id = self.model.key(selected)
+            try:
+                get_db().orders.set_status(order_id, self.status_input.currentData())
+                QMessageBox.information(self, self.tr("Success"), self.tr("Order status updated"))
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to update order: {0}").format(e))
+        else:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select an order to update"))
+
+    def invoice_order(self):
+        selected = self.table.currentIndex().row()
+        if selected >= 0:
+            save_invoice(self, self.model.key(selected))
+        else:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select an order to invoice"))
+
+    def invoice_day(self):
+        # Every client's invoice for the date in the order form
+        order_date = self.date_input.text().strip()
+        if not QDate.fromString(order_date, "yyyy-MM-dd").isValid():
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Date must be YYYY-MM-DD"))
+            return
+        save_day_invoices(self, order_date)
+
+    def delete_order(self):
+        selected = self.table.currentIndex().row()
+        if selected >= 0:
+            order_id = self.model.key(selected)
+            try:
+                get_db().orders.delete(order_id)
+                QMessageBox.information(self, self.tr("Success"), self.tr("Order deleted and stock returned"))
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to delete order: {0}").format(e))
+        else:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select an order to delete"))
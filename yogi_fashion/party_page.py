@@ -0,0 +1,306 @@
+import sqlite3
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QPushButton,
+    QTableView, QMessageBox, QLabel
+)
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+from db import get_db, PartyLedgerError
+from async_search import DebouncedSearch
+from table_model import LazyTableModel, enable_sorting
+from lazy_page import LoadOnShow
+from importer import import_from_file, CONTACT_RE
+from exporter import export_to_file
+from pricing import to_paise, rupees
+from i18n import Retranslatable, set_form_labels
+
+class PartyPage(Retranslatable, LoadOnShow, QWidget):
+    # party_ledger changed (e.g. an order marked Paid); from any thread
+    ledgerChanged = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("partyPage")
+        self.client_id = None
+        self.udhar = None  # (balance, aging) of the selected client
+        self.initUI()
+        get_db().subscribe("party_ledger", self._ledger_changed)
+        self.ledgerChanged.connect(self.show_ledger)
+
+    def initUI(self):
+        layout = QVBoxLayout()
+
+        # Title
+        self.title = QLabel()
+        self.title.setFont(QFont("Arial", 16, QFont.Bold))
+        self.title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title)
+
+        # Search bar
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        # Queries run off the GUI thread once typing pauses; stale results are dropped
+        self.search = DebouncedSearch(get_db().clients.search_cursor, parent=self)
+        self.search.resultsReady.connect(self.show_search_results)
+        self.search.searchFailed.connect(
+            lambda message: QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(message)))
+        self.search_input.textChanged.connect(lambda: self.search_clients())
+        self.search_button = QPushButton()
+        self.search_button.clicked.connect(lambda: self.search_clients(immediate=True))
+        search_layout.addStretch()
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(self.search_button)
+        layout.addLayout(search_layout)
+
+        # Main content: Form on left, Table on right
+        main_layout = QHBoxLayout()
+
+        # Left: Form for adding/updating client
+        left_layout = QVBoxLayout()
+        self.form_layout = QFormLayout()
+        self.name_input = QLineEdit()
+        self.contact_input = QLineEdit()
+        self.address_input = QLineEdit()
+        self.form_layout.addRow(QLabel(), self.name_input)
+        self.form_layout.addRow(QLabel(), self.contact_input)
+        self.form_layout.addRow(QLabel(), self.address_input)
+        left_layout.addLayout(self.form_layout)
+
+        # Action buttons below form
+        action_layout = QHBoxLayout()
+        self.add_button = QPushButton()
+        self.add_button.clicked.connect(self.add_client)
+        self.update_button = QPushButton()
+        self.update_button.clicked.connect(self.update_client)
+        self.delete_button = QPushButton()
+        self.delete_button.clicked.connect(self.delete_client)
+        self.import_button = QPushButton()
+        self.import_button.clicked.connect(lambda: import_from_file(self, "clients"))
+        self.export_button = QPushButton()
+        self.export_button.clicked.connect(lambda: export_to_file(self, "clients"))
+        action_layout.addWidget(self.add_button)
+        action_layout.addWidget(self.update_button)
+        action_layout.addWidget(self.delete_button)
+        action_layout.addWidget(self.import_button)
+        action_layout.addWidget(self.export_button)
+        left_layout.addLayout(action_layout)
+        main_layout.addLayout(left_layout, 1)
+
+        # Right: Table for displaying clients
+        # The id column is kept in the model but not shown
+        self.model = LazyTableModel(get_db().clients, [""] * 3, first_column=1, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        enable_sorting(self.table)
+        self.table.selectionModel().currentRowChanged.connect(self.fill_form)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setAlternatingRowColors(True)
+        main_layout.addWidget(self.table, 2)
+
+        layout.addLayout(main_layout)
+
+        # Udhar of the selected client: balance, aging, payments and statement
+        ledger_layout = QHBoxLayout()
+        self.udhar_label = QLabel()
+        self.payment_input = QLineEdit()
+        self.payment_button = QPushButton()
+        self.payment_button.clicked.connect(self.record_payment)
+        ledger_layout.addWidget(self.udhar_label, 1)
+        ledger_layout.addWidget(self.payment_input)
+        ledger_layout.addWidget(self.payment_button)
+        layout.addLayout(ledger_layout)
+
+        # Statement of the selected client; entry, client and order ids are not shown
+        self.ledger_model = LazyTableModel(get_db().party_ledger, [""] * 4, first_column=3, parent=self)
+        self.ledger_table = QTableView()
+        self.ledger_table.setModel(self.ledger_model)
+        self.ledger_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.ledger_table.horizontalHeader().setStretchLastSection(True)
+        self.ledger_table.setAlternatingRowColors(True)
+        layout.addWidget(self.ledger_table)
+
+        self.setLayout(layout)
+        self.retranslateUi()
+
+    def retranslateUi(self):
+        self.title.setText(self.tr("Party Details"))
+        self.search_input.setPlaceholderText(self.tr("Search by Name or Contact"))
+        self.search_button.setText(self.tr("🔍 Search"))
+        set_form_labels(self.form_layout, (
+            (self.name_input, self.tr("Name:")),
+            (self.contact_input, self.tr("Contact:")),
+            (self.address_input, self.tr("Address:"))))
+        self.add_button.setText(self.tr("Add Client"))
+        self.update_button.setText(self.tr("Update Client"))
+        self.delete_button.setText(self.tr("Delete Selected"))
+        self.import_button.setText(self.tr("Import from File"))
+        self.export_button.setText(self.tr("Export"))
+        self.model.set_headers([self.tr("Name"), self.tr("Contact"), self.tr("Address")])
+        self.payment_input.setPlaceholderText(self.tr("Payment amount"))
+        self.payment_button.setText(self.tr("Record Payment"))
+        self.ledger_model.set_headers([self.tr("Kind"), self.tr("Date"), self.tr("Amount"), self.tr("Balance")])
+        self.show_udhar()
+
+    def load_data(self):
+        self.load_clients()
+
+    def load_clients(self):
+        try:
+            self.model.reload()
+            self.table.resizeColumnsToContents()
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+
+    def search_clients(self, immediate=False):
+        text = self.search_input.text()
+        if not text.strip():
+            # An empty box shows the whole table again, read lazily
+            self.search.cancel()
+            self.load_clients()
+            return
+        self.search.request(text, immediate=immediate)
+
+    def show_search_results(self, clients, first, last):
+        # Results arrive in batches; the first batch replaces the table contents
+        self.model.set_rows(clients, append=not first)
+        if first:
+            self.table.resizeColumnsToContents()
+
+    def add_client(self):
+        name = self.name_input.text().strip()
+        contact = self.contact_input.text().strip()
+        address = self.address_input.text().strip()
+
+        if not (name and contact and address):
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Name, Contact, and Address are required"))
+            return
+
+        # Validate contact (e.g., phone number)
+        if not CONTACT_RE.match(contact):
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Invalid contact number"))
+            return
+
+        try:
+            clients = get_db().clients
+            if clients.contact_exists(contact):
+                QMessageBox.warning(self, self.tr("Error"), self.tr("Contact number already exists"))
+                return
+
+            clients.insert(name, contact, address)
+            self.clear_inputs()
+            QMessageBox.information(self, self.tr("Success"), self.tr("Client added"))
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to add client: {0}").format(e))
+
+    def update_client(self):
+        selected = self.table.currentIndex().row()
+        if selected < 0:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select a client to update"))
+            return
+
+        name = self.name_input.text().strip()
+        contact = self.contact_input.text().strip()
+        address = self.address_input.text().strip()
+
+        if not (name and contact and address):
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Name, Contact, and Address are required"))
+            return
+
+        if not CONTACT_RE.match(contact):
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Invalid contact number"))
+            return
+
+        try:
+            clients = get_db().clients
+            client_id = self.model.key(selected)
+
+            if clients.contact_exists(contact, exclude_id=client_id):
+                QMessageBox.warning(self, self.tr("Error"), self.tr("Contact number already exists"))
+                return
+
+            clients.update(client_id, name, contact, address)
+            self.clear_inputs()
+            QMessageBox.information(self, self.tr("Success"), self.tr("Client updated"))
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to update client: {0}").format(e))
+
+    def delete_client(self):
+        selected = self.table.currentIndex().row()
+        if selected < 0:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select a client to delete"))
+            return
+
+        try:
+            get_db().clients.delete(self.model.key(selected))
+            self.clear_inputs()
+            self.show_ledger()  # drops the Udhar of the deleted client
+            QMessageBox.information(self, self.tr("Success"), self.tr("Client deleted"))
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to delete client: {0}").format(e))
+
+    def fill_form(self):
+        selected = self.table.currentIndex().row()
+        client = self.model.row(selected)
+        if client is None:
+            return
+        self.client_id, name, contact, address = client
+        self.name_input.setText(name or '')
+        self.contact_input.setText(contact or '')
+        self.address_input.setText(address or '')
+        self.show_ledger()
+
+    def _ledger_changed(self, table, change, key, rowid):
+        self.ledgerChanged.emit()
+
+    def show_ledger(self):
+        if self.client_id is None:
+            return
+        ledger = get_db().party_ledger
+        try:
+            balance = ledger.balance(self.client_id)
+            if balance is None:
+                self.client_id = self.udhar = None  # the client was deleted
+                self.ledger_model.set_rows([])
+                self.show_udhar()
+                return
+            aging = ledger.aging(self.client_id)
+            _, entries = ledger.statement(self.client_id)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+            return
+        self.udhar = (balance, aging)
+        self.show_udhar()
+        self.ledger_model.set_rows(entries)
+        self.ledger_table.resizeColumnsToContents()
+
+    def show_udhar(self):
+        if self.udhar is None:
+            self.udhar_label.setText(self.tr("Select a client to see Udhar"))
+            return
+        balance, aging = self.udhar
+        ages = ", ".join(f"{label}: ₹{rupees(amount)}" for label, amount in aging.items())
+        self.udhar_label.setText(self.tr("Udhar: ₹{0}  ({1} days)").format(rupees(balance), ages))
+
+    def record_payment(self):
+        if self.client_id is None:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select a client for the payment"))
+            return
+        try:
+            amount = to_paise(self.payment_input.text())
+        except ValueError:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Invalid amount"))
+            return
+        try:
+            get_db().party_ledger.pay(self.client_id, amount)
+            self.payment_input.clear()
+        except PartyLedgerError as e:
+            QMessageBox.warning(self, self.tr("Error"), str(e))
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to record payment: {0}").format(e))
+
+    def clear_inputs(self):
+        self.name_input.clear()
+        self.contact_input.clear()
+        self.address_input.clear()
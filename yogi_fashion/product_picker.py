@@ -0,0 +1,64 @@
+import sqlite3
+from PyQt5.QtWidgets import QLineEdit, QCompleter
+from PyQt5.QtCore import Qt, QTimer, QStringListModel, pyqtSignal
+from db import get_db, UPDATED
+
+class ProductPicker(QLineEdit):
+    """Line edit choosing a product by description or design ID.
+
+    Typing any part of a description or design ID lists the matching
+    products to complete from; a design ID typed in full is taken as it
+    is. Enter with the list open chooses a product rather than pressing
+    return. load() reads the products, and they are read again once a burst of
+    products being added or deleted is over.
+    """
+
+    # products added or deleted; from any thread
+    productsChanged = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._design_ids = {}  # completion text -> design ID
+        self._products = QStringListModel(self)
+        completer = QCompleter(self._products, self)
+        completer.setFilterMode(Qt.MatchContains)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.setCompleter(completer)
+        self._reload = QTimer(self)
+        self._reload.setSingleShot(True)
+        self._reload.setInterval(0)
+        self._reload.timeout.connect(self._refresh)
+        self.productsChanged.connect(self._reload.start)
+        get_db().subscribe("products", self._products_changed)
+
+    def keyPressEvent(self, event):
+        # The completer passes keys on before completing
+        if event.key() in (Qt.Key_Return, Qt.Key_Enter) and self.completer().popup().isVisible():
+            event.ignore()
+            return
+        super().keyPressEvent(event)
+
+    def _products_changed(self, table, change, key, rowid):
+        # Every order moves a product's stock; the list only changes with
+        # products added or deleted
+        if change != UPDATED:
+            self.productsChanged.emit()
+
+    def _refresh(self):
+        try:
+            self.load()
+        except sqlite3.Error:
+            pass  # keep the products listed; the next change retries
+
+    def load(self):
+        """Read the products to complete from; raises sqlite3.Error."""
+        self._design_ids = {
+            f"{description} ({design_id})" if description else design_id: design_id
+            for design_id, description in get_db().execute(
+                "SELECT design_id, description FROM products ORDER BY description, design_id")}
+        self._products.setStringList(list(self._design_ids))
+
+    def design_id(self):
+        """The design ID of the product chosen, or the text typed."""
+        text = self.text().strip()
+        return self._design_ids.get(text, text)
@@ -0,0 +1,233 @@
+import sqlite3
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QPushButton,
+    QTableView, QMessageBox, QLabel, QSpinBox
+)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
+from db import get_db, PurchaseOrderError, PO_PAGE_SIZE
+from table_model import LazyTableModel, enable_sorting
+from lazy_page import LoadOnShow
+from i18n import Retranslatable, set_form_labels
+from .product_picker import ProductPicker
+
+class SupplierPage(Retranslatable, LoadOnShow, QWidget):
+    # purchase_orders changed (e.g. a draft from the reorder alerts); from any thread
+    ordersChanged = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.order_pages = 0  # pages of open orders shown, see load_orders()
+        self.initUI()
+        get_db().subscribe("purchase_orders", self._orders_changed)
+        # A burst of changes (e.g. approving many orders) reloads the orders once
+        self._reload = QTimer(self)
+        self._reload.setSingleShot(True)
+        self._reload.setInterval(0)
+        self._reload.timeout.connect(self.reload_orders)
+        self.ordersChanged.connect(self._reload.start)
+
+    def initUI(self):
+        layout = QVBoxLayout()
+
+        self.title = QLabel()
+        self.title.setFont(QFont("Arial", 16, QFont.Bold))
+        self.title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title)
+
+        # Form for adding supplier
+        self.form_layout = QFormLayout()
+        self.name_input = QLineEdit()
+        self.contact_input = QLineEdit()
+        self.address_input = QLineEdit()
+        self.form_layout.addRow(QLabel(), self.name_input)
+        self.form_layout.addRow(QLabel(), self.contact_input)
+        self.form_layout.addRow(QLabel(), self.address_input)
+        self.add_button = QPushButton()
+        self.add_button.clicked.connect(self.add_supplier)
+        self.form_layout.addWidget(self.add_button)
+        layout.addLayout(self.form_layout)
+
+        # Table for displaying suppliers; selecting one lists its open orders
+        self.model = LazyTableModel(get_db().suppliers, [""] * 3, first_column=1, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        enable_sorting(self.table)
+        self.table.selectionModel().currentRowChanged.connect(lambda: self.load_orders())
+        layout.addWidget(self.table)
+
+        # Form for a new purchase order to the selected supplier
+        po_layout = QHBoxLayout()
+        self.design_input = ProductPicker()
+        self.quantity_input = QSpinBox()
+        self.quantity_input.setRange(1, 100000)
+        self.create_button = QPushButton()
+        self.create_button.clicked.connect(self.create_order)
+        po_layout.addWidget(self.design_input)
+        po_layout.addWidget(self.quantity_input)
+        po_layout.addWidget(self.create_button)
+        layout.addLayout(po_layout)
+
+        # Open purchase orders of the selected supplier, a page at a time
+        self.orders_model = LazyTableModel(get_db().purchase_orders, [""] * 6, parent=self)
+        self.orders_table = QTableView()
+        self.orders_table.setModel(self.orders_model)
+        self.orders_table.setSelectionMode(QTableView.ExtendedSelection)
+        self.orders_table.setSelectionBehavior(QTableView.SelectRows)
+        self.orders_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.orders_table.hideColumn(1)  # the same supplier on every row
+        layout.addWidget(self.orders_table)
+
+        # Buttons for approve/receive
+        button_layout = QHBoxLayout()
+        self.more_button = QPushButton()
+        self.more_button.clicked.connect(self.load_more_orders)
+        self.approve_button = QPushButton()
+        self.approve_button.clicked.connect(self.approve_orders)
+        self.receive_button = QPushButton()
+        self.receive_button.clicked.connect(self.receive_orders)
+        button_layout.addWidget(self.more_button)
+        button_layout.addWidget(self.approve_button)
+        button_layout.addWidget(self.receive_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+        self.retranslateUi()
+
+    def retranslateUi(self):
+        self.title.setText(self.tr("🚚 Suppliers & Purchase Orders"))
+        set_form_labels(self.form_layout, (
+            (self.name_input, self.tr("Name:")),
+            (self.contact_input, self.tr("Contact:")),
+            (self.address_input, self.tr("Address:"))))
+        self.add_button.setText(self.tr("Add Supplier"))
+        self.model.set_headers([self.tr("Name"), self.tr("Contact"), self.tr("Address")])
+        self.design_input.setPlaceholderText(self.tr("Description or design ID"))
+        self.create_button.setText(self.tr("Create Purchase Order"))
+        self.orders_model.set_headers([self.tr("PO ID"), self.tr("Supplier ID"), self.tr("Design ID"),
+                                       self.tr("Quantity"), self.tr("Date"), self.tr("Status")])
+        self.more_button.setText(self.tr("Show More"))
+        self.approve_button.setText(self.tr("Approve Selected"))
+        self.receive_button.setText(self.tr("Receive Selected"))
+
+    def _orders_changed(self, table, change, key, rowid):
+        self.ordersChanged.emit()
+
+    def load_data(self):
+        self.load_suppliers()
+        try:
+            self.design_input.load()
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+
+    def load_suppliers(self):
+        try:
+            self.model.reload()
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+
+    def selected_supplier(self):
+        selected = self.table.currentIndex().row()
+        return self.model.key(selected) if selected >= 0 else None
+
+    def load_orders(self, append=False, pages=1):
+        """Show the first `pages` pages of the selected supplier's open
+        orders, or with `append` the page after those shown."""
+        supplier_id = self.selected_supplier()
+        if supplier_id is None:
+            self.orders_model.set_rows([])
+            self.order_pages = 0
+            self.more_button.setEnabled(False)
+            return
+        after = None
+        limit = PO_PAGE_SIZE if append else pages * PO_PAGE_SIZE
+        if append and self.orders_model.rowCount():
+            last = self.orders_model.row(self.orders_model.rowCount() - 1)
+            after = (last[4], last[0])  # (order_date, po_id) of the last row shown
+        try:
+            rows = get_db().purchase_orders.open_for_supplier(supplier_id, after, limit)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Database error: {0}").format(e))
+            return
+        self.orders_model.set_rows(rows, append=append)
+        self.order_pages = self.order_pages + 1 if append else pages
+        self.more_button.setEnabled(len(rows) == limit)
+
+    def load_more_orders(self):
+        self.load_orders(append=True)
+
+    def reload_orders(self):
+        # After a change, keep the pages loaded with Show More
+        self.load_orders(pages=max(self.order_pages, 1))
+
+    def selected_orders(self):
+        rows = sorted({index.row() for index in self.orders_table.selectionModel().selectedRows()})
+        return [self.orders_model.key(row) for row in rows]
+
+    def add_supplier(self):
+        name = self.name_input.text()
+        contact = self.contact_input.text()
+        address = self.address_input.text()
+        if name and contact and address:
+            try:
+                get_db().suppliers.insert(name, contact, address)
+                self.name_input.clear()
+                self.contact_input.clear()
+                self.address_input.clear()
+                QMessageBox.information(self, self.tr("Success"), self.tr("Supplier added"))
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to add supplier: {0}").format(e))
+        else:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("All fields are required"))
+
+    def create_order(self):
+        supplier_id = self.selected_supplier()
+        design_id = self.design_input.design_id()
+        if supplier_id is None:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select a supplier first"))
+            return
+        if not design_id:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Choose a design"))
+            return
+        try:
+            get_db().purchase_orders.draft(supplier_id, design_id, self.quantity_input.value())
+            self.design_input.clear()
+            self.quantity_input.setValue(1)
+        except PurchaseOrderError as e:
+            QMessageBox.warning(self, self.tr("Error"), str(e))
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to create purchase order: {0}").format(e))
+
+    def approve_orders(self):
+        po_ids = self.selected_orders()
+        if not po_ids:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select purchase orders to approve"))
+            return
+        db = get_db()
+        try:
+            with db.transaction():
+                for po_id in po_ids:
+                    db.purchase_orders.approve(po_id)
+            QMessageBox.information(self, self.tr("Success"), self.tr("{0} purchase order(s) approved").format(len(po_ids)))
+        except PurchaseOrderError as e:
+            QMessageBox.warning(self, self.tr("Error"), str(e))
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to approve: {0}").format(e))
+
+    def receive_orders(self):
+        # All selected lines of a delivery note are received in one commit
+        po_ids = self.selected_orders()
+        if not po_ids:
+            QMessageBox.warning(self, self.tr("Error"), self.tr("Select purchase orders to receive"))
+            return
+        try:
+            get_db().purchase_orders.receive_many([(po_id, None) for po_id in po_ids])
+            QMessageBox.information(self, self.tr("Success"),
+                                    self.tr("{0} purchase order(s) received into stock").format(len(po_ids)))
+        except PurchaseOrderError as e:
+            QMessageBox.warning(self, self.tr("Error"), str(e))
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to receive: {0}").format(e))